@@ -1,43 +1,67 @@
-import streamlit as st
-
-# 1. 페이지 레이아웃 설정
-st.set_page_config(
-    page_title="동동쌤의 중학 수학모음",
-    page_icon="./기타/동동이.PNG",
-    layout="wide"
-)
-
-# 2. 메뉴바 설정(각 페이지의 실제 콘텐츠는 별도의 파일에 존재).
-pages = {
-    "중1 수학": [
-        # 그룹의 첫 번째 페이지를 default=True로 설정하면 '중1 수학' 클릭 시 이 페이지가 먼저 보입니다.
-        st.Page("./중1 수학/PlusMinus.py", title="덧셈, 뺄셈"),   
-        st.Page("./중1 수학/MultiplicationDivision.py", title="곱셈, 나눗셈"),   
-        st.Page("./중1 수학/Polynomial.py", title="다항식 챌린지"),
-        st.Page("./중1 수학/ReadMind.py", title="생각을 읽는 마법구슬"),
-        st.Page("./중1 수학/Equation.py", title="균형을 잡아라"),
-        st.Page("./중1 수학/rotation.py", title="회전체 탐구", default=True),
-    ],
-    "중2 수학": [
-        st.Page("./중2 수학/Exponents.py", title="지수법칙"),
-    ],
-    "체험수학": [
-        st.Page("./체험수학/VoronoiDiagram.py", title="보로노이 다이어그램"),
-    ],
-    "보드게임": [
-        st.Page("./보드게임/Streams.py", title="스트림스"),
-        st.Page("./보드게임/PigGame.py", title="Pig Game"), 
-        st.Page("./보드게임/NumberBaseball.py", title="숫자야구"),
-        st.Page("./보드게임/MatchstickPuzzle.py", title="성냥개비 퍼즐"),
-        st.Page("./보드게임/Dice.py", title="주사위 모음")
-    ],
-    
-}
-
-# 3. 네비게이션 UI 생성(메뉴바 위치)
-pg = st.navigation(pages, position="top")
-
-# 4. 사용자가 선택한 페이지 실행
-
-pg.run()
-
+import streamlit as st
+from utils import assets, lite, metrics, prewarm, profiler, rng, state
+from utils.admin import is_admin
+
+# 0. 무거운 모듈(matplotlib, pandas, plotly) 예열 — 프로세스당 한 번, 백그라운드 스레드에서
+prewarm.start()
+
+# 1. 페이지 레이아웃 설정 (아이콘은 재실행마다 디스크에서 읽지 않고 utils.assets 캐시에서)
+st.set_page_config(
+    page_title="동동쌤의 중학 수학모음",
+    page_icon=assets.read("기타/동동이.PNG"),
+    layout="wide",
+    initial_sidebar_state="collapsed",
+)
+
+# 1-1. 느린 연결이면 가벼운 모드로 (세션 첫 실행에 재고, 왼쪽 메뉴의 스위치로 바꿀 수 있습니다)
+lite.setup()
+
+# 1-2. 이 세션의 난수 씨앗 (주소에 ?seed=...를 붙이면 같은 판을 다시 볼 수 있습니다)
+st.sidebar.caption(f"🎲 난수 씨앗 {rng.seed()}")
+
+# 2. 메뉴바 설정(각 페이지의 실제 콘텐츠는 별도의 파일에 존재).
+pages = {
+    "중1 수학": [
+        # 그룹의 첫 번째 페이지를 default=True로 설정하면 '중1 수학' 클릭 시 이 페이지가 먼저 보입니다.
+        st.Page("./중1 수학/PlusMinus.py", title="덧셈, 뺄셈"),   
+        st.Page("./중1 수학/MultiplicationDivision.py", title="곱셈, 나눗셈"),   
+        st.Page("./중1 수학/Polynomial.py", title="다항식 챌린지"),
+        st.Page("./중1 수학/ReadMind.py", title="생각을 읽는 마법구슬"),
+        st.Page("./중1 수학/Equation.py", title="균형을 잡아라"),
+        st.Page("./중1 수학/rotation.py", title="회전체 탐구", default=True),
+    ],
+    "중2 수학": [
+        st.Page("./중2 수학/Exponents.py", title="지수법칙"),
+    ],
+    "체험수학": [
+        st.Page("./체험수학/VoronoiDiagram.py", title="보로노이 다이어그램"),
+    ],
+    "보드게임": [
+        st.Page("./보드게임/Streams.py", title="스트림스"),
+        st.Page("./보드게임/PigGame.py", title="Pig Game"), 
+        st.Page("./보드게임/NumberBaseball.py", title="숫자야구"),
+        st.Page("./보드게임/MatchstickPuzzle.py", title="성냥개비 퍼즐"),
+        st.Page("./보드게임/Dice.py", title="주사위 모음")
+    ],
+    
+}
+
+# 관리 페이지는 관리자 토큰으로 들어온 세션(?admin=...)의 메뉴에만 나타납니다.
+if is_admin():
+    pages["관리"] = [
+        st.Page("./관리/Metrics.py", title="운영 지표"),
+        st.Page("./관리/Analytics.py", title="학습 분석"),
+        st.Page("./관리/StreamsTournament.py", title="스트림스 전략 대결"),
+    ]
+
+# 3. 네비게이션 UI 생성(메뉴바 위치)
+pg = st.navigation(pages, position="top")
+
+# 4. 오래 열지 않은 페이지의 세션 상태 정리
+state.evict_idle()
+
+# 5. 사용자가 선택한 페이지 실행 (걸린 시간은 관리 페이지의 운영 지표로 남습니다)
+#    관리자가 ?profile=N을 붙였으면 다음 N번은 샘플링 프로파일러로 (utils.profiler)
+with metrics.timed(pg), profiler.sampled(pg):
+    pg.run()
+
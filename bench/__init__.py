@@ -0,0 +1,4 @@
+"""MathZip 페이지 벤치마크 도구 모음.
+
+저장소 루트에서 ``python -m bench.<모듈>`` 형태로 실행합니다.
+"""
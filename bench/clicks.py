@@ -0,0 +1,255 @@
+"""실제 서버에서 클릭 한 번에 걸리는 재실행 시간.
+
+AppTest는 st.fragment 안의 위젯을 눌러도 스크립트 전체를 다시 실행하므로, 부분 재실행의
+효과를 잴 수 없습니다. 이 도구는 `streamlit run app.py`를 띄우고 브라우저처럼 웹소켓으로
+위젯 값을 보내 script_finished가 올 때까지 걸린 시간을 잽니다. 위젯이 fragment 안에 있으면
+브라우저와 똑같이 그 fragment만 다시 실행해 달라고 보냅니다.
+
+    python -m bench.clicks                         # 보드게임 세 페이지
+    python -m bench.clicks --page PigGame --clicks 100 -o after.json
+    python -m bench.clicks --compare before.json   # 이전 결과와 비교
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+import tornado.websocket
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from bench.cold_start import summarize
+from bench.pages import APP_PATH, ROOT
+
+# 클릭 한 번: 걸린 시간, 서버가 보낸 delta(화면 조각) 수와 메시지 크기
+Click = collections.namedtuple("Click", "ms deltas bytes")
+
+# -----------------------------------------------------------------------------
+# 1. 웹소켓으로 페이지를 조작하는 브라우저 흉내
+# -----------------------------------------------------------------------------
+class Browser:
+    def __init__(self, port, page, query_string=""):
+        self.url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        self.page = page
+        self.query_string = query_string  # 주소의 ?뒤 (예: "lite=1")
+        self.widgets = {}  # 라벨 -> {"id", "fragment_id", "disabled"} (마지막으로 그려진 것)
+        self.ids = {}  # 위젯 id -> 같은 정보 (key로 찾을 때)
+        self.elements = []  # 마지막 _send에서 새로 그려진 요소들
+        self.page_script_hash = ""
+        self.ws = None
+
+    async def connect(self):
+        self.ws = await tornado.websocket.websocket_connect(self.url, subprotocols=["streamlit"])
+
+    async def open(self):
+        if self.ws is None:
+            await self.connect()
+        return await self.rerun()
+
+    async def rerun(self):
+        """위젯 값은 그대로 두고 페이지를 다시 실행합니다."""
+        return await self._send(BackMsg())
+
+    async def _send(self, message, fragment_id=""):
+        # 브라우저처럼 지금 페이지의 해시도 보냅니다. fragment 안에서 st.rerun()을 부르면
+        # 서버는 이 해시로 페이지 전체를 다시 실행합니다.
+        message.rerun_script.page_name = self.page
+        message.rerun_script.page_script_hash = self.page_script_hash
+        message.rerun_script.fragment_id = fragment_id
+        message.rerun_script.query_string = self.query_string
+        self.elements = []
+        start = time.perf_counter()
+        deltas = size = 0
+        await self.ws.write_message(message.SerializeToString(), binary=True)
+        while True:
+            data = await self.ws.read_message()
+            if data is None:
+                raise ConnectionError("웹소켓이 닫혔습니다.")
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            size += len(data)
+            deltas += forward.HasField("delta")
+            if forward.HasField("navigation"):
+                self.page_script_hash = forward.navigation.page_script_hash
+            if forward.HasField("delta") and forward.delta.HasField("new_element"):
+                self.elements.append(forward.delta.new_element)
+                self._remember(forward.delta)
+            # st.rerun()으로 이어지는 실행은 다음 실행까지 포함해 한 번의 클릭으로 잽니다.
+            if forward.HasField("script_finished") and forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return Click((time.perf_counter() - start) * 1000, deltas, size)
+
+    def _remember(self, delta):
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind in ("button", "button_group", "checkbox"):
+            proto = getattr(element, kind)
+            widget = {"id": proto.id, "fragment_id": delta.fragment_id, "disabled": proto.disabled}
+            self.widgets[proto.label.strip()] = self.ids[proto.id] = widget
+
+    def find(self, label=None, key=None):
+        """라벨이 label로 시작하는 위젯, 또는 key="..."로 만든 위젯 (id가 "-key"로 끝남)."""
+        if key is not None:
+            return next(w for wid, w in self.ids.items() if wid.endswith(f"-{key}"))
+        return next(w for name, w in self.widgets.items() if name.startswith(label))
+
+    async def click(self, label=None, key=None):
+        widget = self.find(label, key)
+        message = BackMsg()
+        state = message.rerun_script.widget_states.widgets.add()
+        state.id = widget["id"]
+        state.trigger_value = True
+        return await self._send(message, widget["fragment_id"])
+
+    async def choose(self, label, indices):
+        """st.pills(selection_mode="multi")에서 indices번째 보기들을 고른 상태로 만듭니다."""
+        widget = self.find(label)
+        message = BackMsg()
+        state = message.rerun_script.widget_states.widgets.add()
+        state.id = widget["id"]
+        state.int_array_value.data.extend(indices)
+        return await self._send(message, widget["fragment_id"])
+
+
+# -----------------------------------------------------------------------------
+# 2. 페이지별 클릭 시나리오: step(browser, i) -> [(동작 이름, Click), ...]
+# -----------------------------------------------------------------------------
+async def _streams_setup(b):
+    pass
+
+
+async def _streams_step(b, i):
+    # 19번 뽑으면 버튼이 잠기므로 새로 시작합니다 (재지 않음).
+    if b.find("다음 숫자 뽑기")["disabled"]:
+        await b.click("처음부터 다시하기")
+    return [("숫자 뽑기", await b.click("다음 숫자 뽑기"))]
+
+
+async def _pig_setup(b):
+    await b.click("🚀 새 게임 시작")
+
+
+async def _pig_step(b, i):
+    if b.find("주사위 던지기")["disabled"]:
+        await _pig_setup(b)
+    return [("주사위 던지기", await b.click("주사위 던지기"))]
+
+
+async def _baseball_setup(b):
+    pass
+
+
+async def _baseball_step(b, i):
+    if "확인 (입력 완료)" not in b.widgets or b.find("확인 (입력 완료)")["disabled"]:
+        await b.click("🔄 새 게임 시작")
+    digits = [(i + k) % 10 for k in range(4)]
+    samples = []
+    for n in range(1, 5):  # 알약을 하나씩 누릅니다.
+        samples.append(("알약 누르기", await b.choose("👇", digits[:n])))
+    samples.append(("확인", await b.click("확인 (입력 완료)")))
+    return samples
+
+
+SCENARIOS = {
+    "Streams": (_streams_setup, _streams_step),
+    "PigGame": (_pig_setup, _pig_step),
+    "NumberBaseball": (_baseball_setup, _baseball_step),
+}
+
+
+async def measure_page(port, page, clicks):
+    setup, step = SCENARIOS[page]
+    browser = Browser(port, page)
+    await browser.open()
+    await setup(browser)
+    samples = {}
+    for i in range(clicks):
+        for action, click in await step(browser, i):
+            samples.setdefault(action, []).append(click)
+    browser.ws.close()
+    return {action: dict(summarize([c.ms for c in clicks]),
+                         deltas=round(statistics.fmean(c.deltas for c in clicks), 1),
+                         kb=round(statistics.fmean(c.bytes for c in clicks) / 1024, 1))
+            for action, clicks in samples.items()}
+
+
+# -----------------------------------------------------------------------------
+# 3. 서버 띄우기와 실행
+# -----------------------------------------------------------------------------
+def launch(port):
+    health = f"http://127.0.0.1:{port}/_stcore/health"
+    try:
+        with urllib.request.urlopen(health, timeout=1):
+            pass
+    except OSError:
+        pass
+    else:
+        # 예전에 띄운 서버가 남아 있으면 그 서버(옛 코드)를 재게 됩니다.
+        raise RuntimeError(f"{port}번 포트에 이미 서버가 떠 있습니다.")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH, "--server.headless=true",
+         "--server.address=127.0.0.1", f"--server.port={port}", "--browser.gatherUsageStats=false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(health, timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.3)
+    process.terminate()
+    raise RuntimeError("서버를 띄우지 못했습니다.")
+
+
+def compare(report, baseline):
+    for page, actions in report["pages"].items():
+        for action, now in actions.items():
+            before = baseline.get("pages", {}).get(page, {}).get(action)
+            if before is None:
+                continue
+            ratio = now["median_ms"] / before["median_ms"] if before["median_ms"] else float("nan")
+            print(f"{page:16s} {action:10s} median {before['median_ms']:8.1f} -> {now['median_ms']:8.1f} ms "
+                  f"(x{ratio:.2f}) | p95 {before['p95_ms']:8.1f} -> {now['p95_ms']:8.1f} ms | "
+                  f"delta {before['deltas']} -> {now['deltas']} | {before['kb']} -> {now['kb']} KB", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", action="append", choices=sorted(SCENARIOS), help="잴 페이지 (기본: 전체)")
+    parser.add_argument("--clicks", type=int, default=40, help="페이지마다 반복할 시나리오 횟수")
+    parser.add_argument("--port", type=int, default=8571)
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    report = {"clicks": args.clicks, "pages": {}}
+    process = launch(args.port)
+    try:
+        for page in args.page or list(SCENARIOS):
+            report["pages"][page] = asyncio.run(measure_page(args.port, page, args.clicks))
+            for action, s in report["pages"][page].items():
+                print(f"{page:16s} {action:10s} median {s['median_ms']:8.1f} ms | p95 {s['p95_ms']:8.1f} ms | "
+                      f"delta {s['deltas']} | {s['kb']} KB", file=sys.stderr)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""페이지별 첫 실행(cold start) / 재실행(rerun) 시간과 최대 메모리(RSS) 측정.
+
+각 페이지는 별도의 파이썬 프로세스에서 측정합니다. 그래야 import 비용이 포함된
+진짜 첫 실행 시간과 페이지 하나만의 최대 RSS를 얻을 수 있습니다.
+
+    python -m bench.cold_start                       # 모든 페이지 측정, JSON을 표준 출력으로
+    python -m bench.cold_start -o before.json        # 결과 저장
+    python -m bench.cold_start --compare before.json # 저장된 결과와 비교
+    python -m bench.cold_start --page 보드게임/PigGame.py --reruns 50
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from bench.pages import ROOT, discover_pages, new_app, raise_on_exception, scenario
+
+
+def peak_rss_kb():
+    """현재 프로세스의 최대 RSS(KB). macOS는 바이트 단위로 돌려주므로 맞춰 줍니다."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def summarize(samples):
+    """밀리초 단위 측정값 목록을 요약합니다."""
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "median_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+# -----------------------------------------------------------------------------
+# 1. 페이지 하나 측정 (자식 프로세스에서 실행)
+# -----------------------------------------------------------------------------
+def measure_page(path, reruns, warmup):
+    setup, step = scenario(path)
+    at = new_app(path)
+
+    start = time.perf_counter()
+    at.run()
+    first_run_ms = (time.perf_counter() - start) * 1000
+    raise_on_exception(at, path)
+
+    setup(at)
+    for i in range(warmup):
+        step(at, i)
+
+    samples = []
+    for i in range(reruns):
+        start = time.perf_counter()
+        step(at, warmup + i)
+        samples.append((time.perf_counter() - start) * 1000)
+    raise_on_exception(at, path)
+
+    return {
+        "first_run_ms": round(first_run_ms, 3),
+        "rerun": summarize(samples),
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def run_worker(path, reruns, warmup):
+    """자식 프로세스: 결과 한 줄을 JSON으로 출력합니다."""
+    try:
+        result = measure_page(path, reruns, warmup)
+    except Exception as e:  # 한 페이지가 실패해도 전체 보고서는 만들어지도록
+        result = {"error": f"{type(e).__name__}: {e}"}
+    print(json.dumps(result, ensure_ascii=False))
+
+
+# -----------------------------------------------------------------------------
+# 2. 전체 페이지 측정 및 보고서
+# -----------------------------------------------------------------------------
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_all(pages, reruns, warmup):
+    import streamlit
+
+    from utils import fonts, vendor
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "reruns": reruns,
+        "warmup": warmup,
+        # 빠진 라이브러리나 아직 만들지 않은 글꼴은 CDN에서 받으므로 측정값이 달라집니다.
+        # 글꼴은 아직 커밋하지 않았으므로 (utils.fonts --check) 실패가 아니라 경고로만 적습니다.
+        "assets": vendor.check() + [f"{fonts.FONTS[font]['css']}: {font} 글꼴을 아직 만들지 않았거나 페이지 글자와 맞지 않음"
+                                    for font in fonts.stale()],
+        "pages": {},
+    }
+    for problem in report["assets"]:
+        print(f"⚠️ {problem}", file=sys.stderr)
+    for path, title in pages:
+        proc = subprocess.run(
+            [sys.executable, "-m", "bench.cold_start", "--worker", path,
+             "--reruns", str(reruns), "--warmup", str(warmup)],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        lines = proc.stdout.strip().splitlines()
+        try:
+            result = json.loads(lines[-1])
+        except (IndexError, json.JSONDecodeError):
+            result = {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "no output"}
+        result["title"] = title
+        report["pages"][path] = result
+        print(f"{path:40s} {_fmt(result)}", file=sys.stderr)
+    return report
+
+
+def _fmt(result):
+    if "error" in result:
+        return f"ERROR {result['error']}"
+    return (f"first {result['first_run_ms']:8.1f} ms | "
+            f"rerun median {result['rerun']['median_ms']:7.1f} ms p95 {result['rerun']['p95_ms']:7.1f} ms | "
+            f"peak RSS {result['peak_rss_kb'] / 1024:6.1f} MB")
+
+
+def compare(old, new):
+    """두 보고서를 페이지별로 비교해 표로 출력합니다. (+는 느려짐/커짐)"""
+    print(f"{'page':40s} {'first_run':>18s} {'rerun median':>18s} {'peak RSS':>18s}")
+    for path, cur in new["pages"].items():
+        prev = old["pages"].get(path)
+        if prev is None or "error" in prev or "error" in cur:
+            print(f"{path:40s} (비교 불가)")
+            continue
+        cells = [
+            _delta(prev["first_run_ms"], cur["first_run_ms"]),
+            _delta(prev["rerun"]["median_ms"], cur["rerun"]["median_ms"]),
+            _delta(prev["peak_rss_kb"], cur["peak_rss_kb"]),
+        ]
+        print(f"{path:40s} " + " ".join(f"{c:>18s}" for c in cells))
+
+
+def _delta(before, after):
+    if not before:
+        return f"{after:.1f}"
+    return f"{after:.1f} ({(after - before) / before * 100:+.0f}%)"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", action="append", help="측정할 페이지 경로 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--reruns", type=int, default=30, help="정상 상태 재실행 측정 횟수")
+    parser.add_argument("--warmup", type=int, default=3, help="측정 전 버리는 재실행 횟수")
+    parser.add_argument("-o", "--output", help="보고서를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 보고서 JSON 파일")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(args.worker, args.reruns, args.warmup)
+        return
+
+    pages = discover_pages()
+    if args.page:
+        wanted = {os.path.normpath(p) for p in args.page}
+        pages = [p for p in pages if p[0] in wanted]
+
+    report = run_all(pages, args.reruns, args.warmup)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
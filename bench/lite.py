@@ -0,0 +1,176 @@
+"""가벼운 모드(utils.lite)에서 페이지마다 내려받는 바이트.
+
+`streamlit run app.py`를 띄우고 페이지마다 보통 모드(?lite=0)와 가벼운 모드(?lite=1)로 짧은
+시나리오를 돌립니다. 웹소켓으로 받은 메시지 크기에 더해, 그려진 요소가 가리키는 같은 서버의
+파일(컴포넌트 HTML, 그 안의 CSS/JS/그림, st.image 등)을 실제로 받아 크기를 더합니다.
+다른 서버의 파일(YouTube, CDN, Google Fonts)은 받지 않고 주소 수만 셉니다.
+
+Streamlit은 Plotly 차트 같은 일부 요소의 프런트엔드 코드를 그 요소가 처음 그려질 때 따로
+받습니다(LAZY_CHUNKS). 브라우저 캐시가 빈 첫 방문 기준으로 이 조각도 셉니다. 크기는 모두
+gzip으로 받은 실제 전송량입니다. 성냥개비 퍼즐은 한 판에 보는 그림 54장을 모두 셉니다.
+
+    python -m bench.lite
+    python -m bench.lite --page PigGame -o lite.json
+"""
+
+import argparse
+import asyncio
+import functools
+import gzip
+import json
+import os
+import re
+import sys
+import urllib.parse
+import urllib.request
+
+import streamlit
+
+from bench.clicks import Browser, launch
+
+SAME_ORIGIN = "http://127.0.0.1:{port}/"
+# 요소 종류 -> 그 요소의 프런트엔드 조각(static/js/*.js)에만 들어 있는 글자
+LAZY_CHUNKS = {"plotly_chart": "plotly.js"}
+_URL_ATTR = re.compile(r"""(?:src|href)\s*=\s*["']([^"']+)["']""")
+_CSS_URL = re.compile(r"""url\(\s*['"]?([^'")]+)""")
+_COMPONENT_STRING = re.compile(r"""["'](component/[^"']+)["']""")
+
+
+# -----------------------------------------------------------------------------
+# 1. 페이지별 시나리오: run(browser) -> 보낸 메시지마다의 Click 목록
+# -----------------------------------------------------------------------------
+async def _open(b):
+    return [await b.open()]
+
+
+async def _pig(b):
+    # 새 게임 -> 한 번 던지고 -> (차례가 안 끝났으면) 그만하기: 비율 그래프가 그려질 때까지
+    clicks = [await b.open(), await b.click("🚀 새 게임 시작"), await b.click("주사위 던지기")]
+    if not any(e.WhichOneof("type") in ("plotly_chart", "imgs") for e in b.elements):
+        clicks.append(await b.click("그만하기"))
+    return clicks
+
+
+SCENARIOS = {
+    "rotation": _open,
+    "VoronoiDiagram": _open,
+    "Streams": _open,
+    "PigGame": _pig,
+    "MatchstickPuzzle": _open,
+    "PlusMinus": _open,
+}
+
+
+# -----------------------------------------------------------------------------
+# 2. 요소가 가리키는 파일 모으기
+# -----------------------------------------------------------------------------
+def _references(element):
+    """(문서 주소 기준, 주소) 목록. 기준이 None이면 페이지 주소 기준."""
+    kind = element.WhichOneof("type")
+    if kind == "iframe":
+        if element.iframe.srcdoc:
+            return [(None, url) for url in _urls(element.iframe.srcdoc)]
+        return [(None, element.iframe.src)]
+    if kind == "component_instance" and element.component_instance.url:
+        return [(None, element.component_instance.url)]
+    if kind == "imgs":
+        return [(None, img.url) for img in element.imgs.imgs]
+    if kind == "video":
+        return [(None, element.video.url)]
+    return []
+
+
+@functools.lru_cache(maxsize=None)
+def _chunk(marker):
+    """marker가 들어 있는 가장 큰 프런트엔드 조각의 주소 (static/js/...)."""
+    directory = os.path.join(os.path.dirname(streamlit.__file__), "static", "static", "js")
+    found = []
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        with open(path, encoding="utf-8", errors="replace") as f:
+            if marker in f.read():
+                found.append((os.path.getsize(path), name))
+    return f"static/js/{max(found)[1]}" if found else None
+
+
+def _urls(text):
+    found = _URL_ATTR.findall(text) + _CSS_URL.findall(text) + _COMPONENT_STRING.findall(text)
+    return [u for u in dict.fromkeys(found)
+            if "${" not in u and not u.startswith(("#", "data:", "blob:", "javascript:", "about:"))]
+
+
+def fetch_all(port, elements):
+    """같은 서버의 파일을 (HTML/CSS 안의 주소까지) 받아 {"http_bytes", "files", "external"}."""
+    origin = SAME_ORIGIN.format(port=port)
+    queue = [urllib.parse.urljoin(base or origin, url) for element in elements
+             for base, url in _references(element)]
+    kinds = {element.WhichOneof("type") for element in elements}
+    queue += [origin + _chunk(marker) for kind, marker in LAZY_CHUNKS.items() if kind in kinds and _chunk(marker)]
+    seen, external, total = set(), set(), 0
+    while queue:
+        url = queue.pop()
+        if url in seen:
+            continue
+        seen.add(url)
+        if not url.startswith(origin):
+            external.add(url)
+            continue
+        # urllib은 gzip을 풀지 않으므로 len(body)가 실제 전송량입니다.
+        request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            body = response.read()
+            kind = response.headers.get("Content-Type", "")
+            encoding = response.headers.get("Content-Encoding")
+        total += len(body)
+        if "html" in kind or "css" in kind:
+            text = (gzip.decompress(body) if encoding == "gzip" else body).decode("utf-8", "replace")
+            queue.extend(urllib.parse.urljoin(url, u) for u in _urls(text))
+    return {"http_bytes": total, "files": len(seen) - len(external), "external": sorted(external)}
+
+
+async def measure(port, page, light):
+    browser = Browser(port, page, query_string=f"lite={int(light)}")
+    clicks = await SCENARIOS[page](browser)
+    elements = list(browser.elements)
+    browser.ws.close()
+    # 시나리오 중간에 그려졌다가 그대로 남는 요소까지 세려면 마지막 화면 대신 전부 모아야 하지만,
+    # 여기 시나리오는 마지막 메시지가 페이지 전체를 다시 그리므로 마지막 화면으로 충분합니다.
+    http = await asyncio.to_thread(fetch_all, port, elements)
+    ws_bytes = sum(c.bytes for c in clicks)
+    return {"ws_bytes": ws_bytes, **http, "total_bytes": ws_bytes + http["http_bytes"]}
+
+
+# -----------------------------------------------------------------------------
+# 3. 실행
+# -----------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", action="append", choices=sorted(SCENARIOS), help="잴 페이지 (기본: 전체)")
+    parser.add_argument("--port", type=int, default=8573)
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    report = {"pages": {}}
+    process = launch(args.port)
+    try:
+        for page in args.page or list(SCENARIOS):
+            modes = {mode: asyncio.run(measure(args.port, page, mode == "lite")) for mode in ("normal", "lite")}
+            report["pages"][page] = modes
+            normal, light = modes["normal"]["total_bytes"], modes["lite"]["total_bytes"]
+            print(f"{page:18s} 보통 {normal / 1024:8.1f} KB (외부 {len(modes['normal']['external'])}) | "
+                  f"가벼운 {light / 1024:8.1f} KB (외부 {len(modes['lite']['external'])}) | "
+                  f"x{light / normal:.2f}", file=sys.stderr)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
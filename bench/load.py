@@ -0,0 +1,260 @@
+"""교실 동시 접속 부하 생성기.
+
+학생 N명(브라우저 N개)이 같은 순간에 페이지를 열고, 각자 정해진 상호작용을 반복합니다.
+`streamlit run app.py`를 실제로 띄우고 bench.clicks의 Browser처럼 웹소켓을 N개 열기 때문에
+모든 세션이 실제 서버 프로세스 하나 안에서 동시에 돌고, GIL 때문에 직렬화되는 만큼이
+그대로 지연 시간에 드러납니다. CPU와 RSS는 이 도구가 아니라 서버 프로세스의 값입니다.
+
+예전에는 AppTest 여러 개를 스레드로 돌렸지만, AppTest는 Runtime._instance나 st.secrets 같은
+전역을 바꿨다가 되돌리므로 세션이 많으면 서로의 위젯 상태를 지워 format_func에서
+KeyError가 났습니다. 그래서 서버를 직접 두드립니다.
+
+페이지가 그린 예외(st.exception)는 errors에, 연결이 끊기거나 시나리오가 위젯을 찾지 못하는
+등 측정 도구 쪽 실패는 harness_errors에 따로 적습니다.
+
+    python -m bench.load --page 보드게임/Dice.py --sessions 40
+    python -m bench.load --page 보드게임/PigGame.py --sessions 40 --steps 20 -o pig.json
+    python -m bench.load --sessions 30            # 모든 페이지를 차례로
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from bench import clicks
+from bench.clicks import Browser, launch
+from bench.pages import discover_pages, page_name
+
+
+def percentile(ordered, q):
+    """정렬된 목록의 q 분위수 (최근접 순위 방식)."""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+# -----------------------------------------------------------------------------
+# 1. 페이지별 상호작용: step(browser, i) -> [(동작 이름, Click), ...]
+# -----------------------------------------------------------------------------
+async def _no_setup(b):
+    pass
+
+
+async def _equation_step(b, i):
+    # 저울 접시가 끝없이 쌓이지 않도록 10번마다 초기화 (재지 않음)
+    if i % 10 == 9:
+        await b.click(key="t1_reset")
+    return [("세모 올리기", await b.click(key="t1_l_add_tri"))]
+
+
+async def _dice_step(b, i):
+    # 부호 알약을 지금 값("미포함") 그대로 다시 고릅니다.
+    return [("부호 고르기", await b.choose("부호", [1]))]
+
+
+async def _plain_step(b, i):
+    return [("재실행", await b.rerun())]
+
+
+SCENARIOS = {
+    **clicks.SCENARIOS,
+    "Equation": (_no_setup, _equation_step),
+    "Dice": (_no_setup, _dice_step),
+}
+
+
+def scenario(page):
+    """페이지에 맞는 (setup, step) 쌍. 시나리오가 없으면 단순 재실행을 씁니다."""
+    return SCENARIOS.get(page, (_no_setup, _plain_step))
+
+
+# -----------------------------------------------------------------------------
+# 2. 세션 하나: 동시에 페이지를 열고 시나리오를 steps번 반복
+# -----------------------------------------------------------------------------
+class PageError(Exception):
+    """페이지가 예외를 화면에 그렸습니다."""
+
+
+class Student(Browser):
+    """받은 화면에 st.exception이 있으면 PageError를 냅니다."""
+
+    async def _send(self, message, fragment_id=""):
+        click = await super()._send(message, fragment_id)
+        for element in self.elements:
+            if element.WhichOneof("type") == "exception":
+                raise PageError(f"{element.exception.type}: {element.exception.message}")
+        return click
+
+
+class Gate:
+    """모든 세션이 연결을 마치면 한꺼번에 출발시킵니다."""
+
+    def __init__(self, sessions):
+        self.left = sessions
+        self.opened = asyncio.Event()
+
+    async def wait(self):
+        self.left -= 1
+        if self.left <= 0:
+            self.opened.set()
+        await self.opened.wait()
+
+
+async def session(port, page, steps, gate, timeout):
+    """{"open_ms", "rerun_ms", "error", "harness_error"}"""
+    setup, step = scenario(page)
+    browser = Student(port, page)
+    result = {"open_ms": None, "rerun_ms": [], "error": None, "harness_error": None}
+    try:
+        try:
+            await asyncio.wait_for(browser.connect(), timeout)
+        finally:
+            # 연결에 실패한 세션 때문에 나머지가 계속 기다리지 않도록 항상 도착을 알립니다.
+            await gate.wait()
+
+        async def run():
+            # 모든 학생이 "동시에" 페이지를 여는 순간을 흉내냅니다.
+            result["open_ms"] = (await browser.open()).ms
+            await setup(browser)
+            for i in range(steps):
+                result["rerun_ms"].extend(click.ms for _, click in await step(browser, i))
+
+        await asyncio.wait_for(run(), timeout)
+    except PageError as e:
+        result["error"] = str(e)
+    except Exception as e:
+        result["harness_error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if browser.ws is not None:
+            browser.ws.close()
+    return result
+
+
+# -----------------------------------------------------------------------------
+# 3. 서버 프로세스의 CPU와 RSS (/proc)
+# -----------------------------------------------------------------------------
+def server_usage(pid):
+    """(CPU 초, RSS KB). /proc가 없는 환경에서는 (None, None)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # 두 번째 필드(프로세스 이름)에 공백이 있을 수 있으므로 ')' 뒤부터 셉니다.
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None, None
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")  # utime + stime
+    return cpu, pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+# -----------------------------------------------------------------------------
+# 4. 페이지 하나에 대한 부하 측정
+# -----------------------------------------------------------------------------
+async def prime(port, page):
+    """부하 전에 시나리오를 한 번 돌려 지연 import까지 끝내 둡니다 (이미 떠 있는 서버 상황)."""
+    result = await session(port, page, 1, Gate(1), timeout=120)
+    if result["error"] or result["harness_error"]:
+        raise RuntimeError(f"{page}: {result['error'] or result['harness_error']}")
+
+
+async def _gather(port, page, sessions, steps, timeout):
+    gate = Gate(sessions)
+    return await asyncio.gather(*(session(port, page, steps, gate, timeout) for _ in range(sessions)))
+
+
+def load_page(port, pid, page, sessions, steps, timeout=300):
+    cpu_before, rss_before = server_usage(pid)
+    wall_start = time.perf_counter()
+    results = asyncio.run(_gather(port, page, sessions, steps, timeout))
+    wall = time.perf_counter() - wall_start
+    cpu_after, rss_after = server_usage(pid)
+
+    opens = sorted(r["open_ms"] for r in results if r["open_ms"] is not None)
+    reruns = sorted(ms for r in results for ms in r["rerun_ms"])
+    total_runs = len(opens) + len(reruns)
+
+    def pct(ordered):
+        return {f"p{int(q * 100)}_ms": round(percentile(ordered, q), 3) if ordered else None
+                for q in (0.5, 0.95, 0.99)}
+
+    measured = cpu_before is not None and cpu_after is not None
+    return {
+        "sessions": sessions,
+        "steps": steps,
+        "open": pct(opens),
+        "rerun": pct(reruns),
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(total_runs / wall, 2) if wall else None,
+        "cpu_s_per_session": round((cpu_after - cpu_before) / sessions, 4) if measured else None,
+        "rss_kb_per_session": round(max(rss_after - rss_before, 0) / sessions, 1) if measured else None,
+        "rss_kb_total": rss_after,
+        "errors": sorted({r["error"] for r in results if r["error"]}),
+        "harness_errors": sorted({r["harness_error"] for r in results if r["harness_error"]}),
+    }
+
+
+def _fmt(r):
+    rss = f"{r['rss_kb_per_session'] / 1024:.1f}" if r["rss_kb_per_session"] is not None else "?"
+    return (f"open p50/p95/p99 {r['open']['p50_ms']}/{r['open']['p95_ms']}/{r['open']['p99_ms']} ms | "
+            f"rerun p50/p95/p99 {r['rerun']['p50_ms']}/{r['rerun']['p95_ms']}/{r['rerun']['p99_ms']} ms | "
+            f"{r['throughput_rps']} reruns/s | CPU {r['cpu_s_per_session']} s/session | "
+            f"RSS {rss} MB/session"
+            + (f" | ERRORS {r['errors']}" if r["errors"] else "")
+            + (f" | HARNESS {r['harness_errors']}" if r["harness_errors"] else ""))
+
+
+def _shutdown(process):
+    process.terminate()
+    process.wait(timeout=30)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", action="append", help="부하를 줄 페이지 경로 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--sessions", type=int, default=40, help="동시 세션(학생) 수")
+    parser.add_argument("--steps", type=int, default=10, help="세션마다 반복할 상호작용 횟수")
+    parser.add_argument("--cold", action="store_true",
+                        help="페이지마다 서버를 새로 띄우고 미리 실행하지 않은 채 바로 동시 접속")
+    parser.add_argument("--port", type=int, default=8575)
+    parser.add_argument("--timeout", type=float, default=300, help="세션 하나에 주는 최대 시간(초)")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    pages = discover_pages()
+    if args.page:
+        wanted = {os.path.normpath(p) for p in args.page}
+        pages = [p for p in pages if p[0] in wanted]
+
+    report = {"sessions": args.sessions, "steps": args.steps, "cold": args.cold, "pages": {}}
+    process = None
+    try:
+        for path, title in pages:
+            page = page_name(path)
+            if args.cold and process is not None:
+                _shutdown(process)
+                process = None
+            if process is None:
+                process = launch(args.port)
+            if not args.cold:
+                asyncio.run(prime(args.port, page))
+            result = load_page(args.port, process.pid, page, args.sessions, args.steps, args.timeout)
+            result["title"] = title
+            report["pages"][path] = result
+            print(f"{path:40s} {_fmt(result)}", file=sys.stderr)
+    finally:
+        if process is not None:
+            _shutdown(process)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""app.py에 등록된 페이지 목록과 페이지별 대표 상호작용 시나리오.
+
+벤치마크 도구들(cold_start, load, soak)이 모두 이 모듈을 공유합니다.
+"""
+
+import ast
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+# 저장소 루트 (app.py가 있는 폴더)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+
+# 페이지들이 "./기타/..." 같은 상대 경로를 쓰므로 루트에서 실행되도록 맞춥니다.
+os.chdir(ROOT)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+# -----------------------------------------------------------------------------
+# 1. app.py에서 st.Page 목록 읽기
+# -----------------------------------------------------------------------------
+def discover_pages(app_path=APP_PATH):
+    """app.py를 실행하지 않고 st.Page("경로", title=...) 호출만 골라 (경로, 제목) 목록을 돌려줍니다."""
+    with open(app_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    pages = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if not (isinstance(func, ast.Attribute) and func.attr == "Page"):
+            continue
+        if not node.args or not isinstance(node.args[0], ast.Constant):
+            continue
+        path = os.path.normpath(node.args[0].value)
+        title = next((kw.value.value for kw in node.keywords
+                      if kw.arg == "title" and isinstance(kw.value, ast.Constant)), path)
+        pages.append((node.lineno, path, title))
+    # ast.walk는 소스 순서를 보장하지 않으므로 줄 번호로 정렬합니다.
+    return [(path, title) for _, path, title in sorted(pages)]
+
+
+def page_name(path):
+    """'보드게임/PigGame.py' -> 'PigGame'"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+# -----------------------------------------------------------------------------
+# 2. 페이지별 상호작용 시나리오
+# -----------------------------------------------------------------------------
+# setup(at): 첫 실행 직후 한 번 호출되어 상호작용이 가능한 상태를 만듭니다.
+# step(at, i): 정상 상태(steady-state)에서 한 번의 상호작용 + 재실행을 수행합니다.
+# 학생 한 명이 버튼 하나를 누르는 것과 같은 단위입니다.
+def _button(at, label):
+    return next(b for b in at.button if b.label == label)
+
+
+def page_data(at, namespace):
+    """utils.state.page_state(namespace)로 저장된 페이지 상태."""
+    return at.session_state["_page_state"][namespace]["data"]
+
+
+def _no_setup(at):
+    pass
+
+
+def _streams_step(at, i):
+    # 20장을 모두 뽑으면 버튼이 잠기므로 그 전에 새로 시작합니다.
+    if page_data(at, "streams").draw_count >= 19:
+        at.button(key="restart_base").click().run()
+    at.button(key="draw_base").click().run()
+
+
+def _pig_setup(at):
+    _button(at, "🚀 새 게임 시작").click().run()
+
+
+def _pig_step(at, i):
+    if page_data(at, "pig").game_over:
+        _pig_setup(at)
+    _button(at, "주사위 던지기").click().run()
+
+
+def _equation_step(at, i):
+    # 저울 접시가 끝없이 쌓이지 않도록 10번마다 초기화
+    if i % 10 == 9:
+        at.button(key="t1_reset").click().run()
+    at.button(key="t1_l_add_tri").click().run()
+
+
+def _baseball_step(at, i):
+    data = page_data(at, "baseball")
+    if data.game_over:
+        data.target_number = None  # 다음 실행에서 새 게임 시작
+        at.run()
+    length = data.digit_length
+    guess = [str((i + k) % 10) for k in range(length)]
+    at.button_group(key="current_guess").set_value(guess)
+    _button(at, "확인 (입력 완료)").click().run()
+
+
+def _dice_step(at, i):
+    # AppTest는 단일 선택 pills 값(문자열)을 글자 단위로 직렬화하다 실패하므로
+    # 매번 목록 형태로 다시 넣어 줍니다. 앱이 받는 값은 같습니다.
+    at.button_group(key="sign_pill").set_value([at.session_state["sign_pill"]])
+    at.run()
+
+
+def _plain_step(at, i):
+    at.run()
+
+
+SCENARIOS = {
+    "Streams": (_no_setup, _streams_step),
+    "PigGame": (_pig_setup, _pig_step),
+    "Equation": (_no_setup, _equation_step),
+    "NumberBaseball": (_no_setup, _baseball_step),
+    "Dice": (_no_setup, _dice_step),
+}
+
+
+def scenario(path):
+    """페이지에 맞는 (setup, step) 쌍. 시나리오가 없으면 단순 재실행을 씁니다."""
+    return SCENARIOS.get(page_name(path), (_no_setup, _plain_step))
+
+
+def test_secrets():
+    """secrets.toml이 없어도 Polynomial이 동작하도록 넣어 두는 빈 값."""
+    return {"Telegram": {"Token": "", "chat_id": ""}}
+
+
+def new_app(path, timeout=30, secrets=True):
+    """페이지 하나를 AppTest로 준비합니다."""
+    at = AppTest.from_file(os.path.join(ROOT, path), default_timeout=timeout)
+    if secrets:
+        at.secrets.update(test_secrets())
+    return at
+
+
+def raise_on_exception(at, path):
+    if at.exception:
+        raise RuntimeError(f"{path}: {at.exception[0].message}")
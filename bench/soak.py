@@ -0,0 +1,191 @@
+"""메모리 누수 소크(soak) 테스트.
+
+페이지마다 시나리오를 수천 번 재실행하면서 tracemalloc으로 남아 있는 메모리를 추적하고,
+재실행 1,000번당 메모리 증가량이 기준을 넘으면 실패(종료 코드 1)합니다.
+기준을 넘은 페이지는 증가분을 소스 줄 단위로 묶어 보여 주며, 가능하면 그 할당을 일으킨
+페이지의 줄로 거슬러 올라갑니다.
+
+    python -m bench.soak --page "중1 수학/Equation.py" --reruns 2000   # JSON을 표준 출력으로
+    python -m bench.soak --max-growth-kb 256 -o soak.json   # 모든 페이지, 결과 저장
+"""
+
+import argparse
+import gc
+import json
+import linecache
+import os
+import sys
+import time
+import tracemalloc
+
+from bench.pages import ROOT, discover_pages, new_app, raise_on_exception, scenario
+
+# tracemalloc 자신과 import 과정에서 생기는 할당은 누수가 아니므로 제외합니다.
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _page_frame(traceback):
+    """할당 스택에서 가장 안쪽의 저장소 소스 줄을 찾습니다. (bench 자신은 제외)"""
+    for frame in reversed(traceback):
+        path = frame.filename
+        if os.path.isabs(path) and path.startswith(ROOT) and not path.startswith(os.path.join(ROOT, "bench")):
+            return frame
+    return None
+
+
+def _where(frame):
+    path = os.path.relpath(frame.filename, ROOT) if frame.filename.startswith(ROOT) else frame.filename
+    code = linecache.getline(frame.filename, frame.lineno).strip()
+    return f"{path}:{frame.lineno}", code
+
+
+# -----------------------------------------------------------------------------
+# 1. 페이지 하나 소크
+# -----------------------------------------------------------------------------
+# 깊은 스택을 저장하는 tracemalloc은 재실행을 수십 배 느리게 만듭니다. 그래서
+#   1단계: 스택 1단계만 저장하며 수천 번 재실행해 증가량만 재고,
+#   2단계: 기준을 넘은 페이지만 깊은 스택으로 짧게 다시 돌려 원인 줄을 찾습니다.
+def _traced_total():
+    gc.collect()
+    return sum(stat.size for stat in tracemalloc.take_snapshot().filter_traces(_IGNORED).statistics("filename"))
+
+
+def measure_growth(at, step, first, reruns):
+    """재실행 reruns번 동안 남은 메모리 증가량(바이트)과 걸린 시간."""
+    tracemalloc.start(1)
+    try:
+        before = _traced_total()
+        start = time.perf_counter()
+        for i in range(reruns):
+            step(at, first + i)
+        elapsed = time.perf_counter() - start
+        after = _traced_total()
+    finally:
+        tracemalloc.stop()
+    return after - before, elapsed
+
+
+def attribute_growth(at, step, first, reruns, top, frames):
+    """깊은 스택으로 재실행하며 증가분을 소스 줄별로 묶습니다."""
+    tracemalloc.start(frames)
+    try:
+        gc.collect()
+        before = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        for i in range(reruns):
+            step(at, first + i)
+        gc.collect()
+        after = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+    finally:
+        tracemalloc.stop()
+
+    # 같은 줄에서 생긴 증가분 합치기: 실제 할당 줄 / 그 할당을 일으킨 페이지 줄
+    by_line, by_page_line = {}, {}
+    for d in after.compare_to(before, "traceback"):
+        if d.size_diff <= 0:
+            continue
+        for table, frame in ((by_line, d.traceback[-1]), (by_page_line, _page_frame(d.traceback))):
+            if frame is None:
+                continue
+            key = (frame.filename, frame.lineno)
+            size, count = table.get(key, (0, 0))
+            table[key] = (size + d.size_diff, count + d.count_diff)
+
+    def top_of(table):
+        rows = []
+        for (filename, lineno), (size, count) in sorted(table.items(), key=lambda kv: -kv[1][0])[:top]:
+            where, code = _where(tracemalloc.Frame((filename, lineno)))
+            rows.append({"where": where, "code": code,
+                         "kb_per_1000": round(size / 1024 / reruns * 1000, 1), "count": count})
+        return rows
+
+    return {"reruns": reruns, "top_lines": top_of(by_line), "top_page_lines": top_of(by_page_line)}
+
+
+def soak_page(path, reruns, warmup, limit_kb, trace_reruns, top, frames):
+    setup, step = scenario(path)
+    at = new_app(path, timeout=120).run()
+    raise_on_exception(at, path)
+    setup(at)
+    # 첫 몇 번은 캐시/지연 import가 채워지는 구간이므로 측정에서 뺍니다.
+    for i in range(warmup):
+        step(at, i)
+
+    growth, elapsed = measure_growth(at, step, warmup, reruns)
+    raise_on_exception(at, path)
+    per_1000 = growth / 1024 / reruns * 1000
+    result = {
+        "reruns": reruns,
+        "seconds": round(elapsed, 1),
+        "growth_kb": round(growth / 1024, 1),
+        "growth_kb_per_1000": round(per_1000, 1),
+        "passed": per_1000 <= limit_kb,
+    }
+    if not result["passed"]:
+        result["attribution"] = attribute_growth(at, step, warmup + reruns, min(reruns, trace_reruns), top, frames)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", action="append", help="소크할 페이지 경로 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--reruns", type=int, default=1000, help="페이지마다 측정할 재실행 횟수")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전 버리는 재실행 횟수")
+    parser.add_argument("--max-growth-kb", type=float, default=512.0,
+                        help="재실행 1,000번당 허용하는 메모리 증가량(KB). 넘으면 실패")
+    parser.add_argument("--trace-reruns", type=int, default=100,
+                        help="기준을 넘은 페이지의 원인 줄을 찾을 때 깊은 스택으로 재실행할 횟수")
+    parser.add_argument("--top", type=int, default=10, help="보고할 소스 줄 개수")
+    parser.add_argument("--frames", type=int, default=25, help="원인 줄을 찾을 때 tracemalloc이 저장할 스택 깊이")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    pages = discover_pages()
+    if args.page:
+        wanted = {os.path.normpath(p) for p in args.page}
+        pages = [p for p in pages if p[0] in wanted]
+
+    report = {"max_growth_kb_per_1000": args.max_growth_kb, "pages": {}}
+    failed = []
+    for path, title in pages:
+        try:
+            result = soak_page(path, args.reruns, args.warmup, args.max_growth_kb,
+                               args.trace_reruns, args.top, args.frames)
+        except Exception as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+        if not result.get("passed"):
+            failed.append(path)
+        result["title"] = title
+        report["pages"][path] = result
+        _print(path, result)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if failed:
+        print(f"\n❌ 기준({args.max_growth_kb} KB / 1,000회) 초과: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _print(path, result):
+    if "error" in result:
+        print(f"{path:40s} ERROR {result['error']}", file=sys.stderr)
+        return
+    mark = "OK  " if result["passed"] else "FAIL"
+    print(f"{mark} {path:40s} +{result['growth_kb_per_1000']:.1f} KB / 1,000 reruns "
+          f"({result['reruns']} reruns, {result['seconds']} s)", file=sys.stderr)
+    if not result["passed"]:
+        for row in result["attribution"]["top_page_lines"][:5]:
+            print(f"       {row['kb_per_1000']:9.1f} KB / 1,000  {row['where']}  {row['code']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
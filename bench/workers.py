@@ -0,0 +1,175 @@
+"""워커 수에 따른 재실행 처리량.
+
+워커 수마다 `python -m utils.workers`를 실제로 띄우고, 학생 N명(브라우저 N개)이 프록시를
+거쳐 웹소켓으로 같은 페이지를 쉬지 않고 재실행합니다. 워커를 늘릴 때 reruns/s가 얼마나
+늘어나는지(그리고 세션이 워커에 고르게 나뉘는지) 봅니다. 코어 수보다 많은 워커는 의미가
+없으므로 결과와 함께 CPU 코어 수를 적어 둡니다.
+
+    python -m bench.workers --workers 1 2 4 --sessions 40 --seconds 20
+    python -m bench.workers --page PigGame -o workers.json
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+import tornado.httpclient
+import tornado.websocket
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from bench.load import percentile
+from bench.pages import ROOT
+from utils.workers import COOKIE
+
+
+# -----------------------------------------------------------------------------
+# 1. 워커 띄우기
+# -----------------------------------------------------------------------------
+def launch(workers, port, base_port, shared_path):
+    """utils.workers를 띄우고 프록시가 응답할 때까지 기다립니다."""
+    env = dict(os.environ, MATHZIP_SHARED=f"sqlite:///{shared_path}")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "utils.workers", "--workers", str(workers), "--port", str(port),
+         "--address", "127.0.0.1", "--base-port", str(base_port)],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"워커 {workers}개를 띄우지 못했습니다.")
+
+
+def shutdown(process):
+    process.terminate()
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+# -----------------------------------------------------------------------------
+# 2. 브라우저 하나: 쿠키 받기 -> 웹소켓 -> 재실행 반복
+# -----------------------------------------------------------------------------
+async def rerun(ws, page):
+    message = BackMsg()
+    message.rerun_script.page_name = page
+    await ws.write_message(message.SerializeToString(), binary=True)
+    while True:
+        data = await ws.read_message()
+        if data is None:
+            raise ConnectionError("웹소켓이 닫혔습니다.")
+        forward = ForwardMsg()
+        forward.ParseFromString(data)
+        if forward.HasField("script_finished"):
+            return
+
+
+class Barrier:
+    """모든 브라우저가 첫 실행을 마치면 동시에 출발시키고, seconds 뒤에 멈추게 합니다."""
+
+    def __init__(self, sessions, seconds):
+        self.left = sessions
+        self.seconds = seconds
+        self.started = asyncio.Event()
+        self.began = self.stop = None
+
+    async def wait(self):
+        self.left -= 1
+        if self.left == 0:
+            self.began = time.perf_counter()
+            self.stop = self.began + self.seconds
+            self.started.set()
+        await self.started.wait()
+
+
+async def browser(port, page, barrier):
+    """(붙은 워커 번호, 재실행 시간 목록)을 돌려줍니다."""
+    response = await tornado.httpclient.AsyncHTTPClient().fetch(f"http://127.0.0.1:{port}/")
+    cookie = next(c.split(";", 1)[0] for c in response.headers.get_list("Set-Cookie") if c.startswith(COOKIE))
+    ws = await tornado.websocket.websocket_connect(tornado.httpclient.HTTPRequest(
+        f"ws://127.0.0.1:{port}/_stcore/stream", headers={"Cookie": cookie}), subprotocols=["streamlit"])
+    try:
+        await rerun(ws, page)      # 첫 실행 (세션 만들기)은 재지 않습니다.
+        await barrier.wait()
+        times = []
+        while time.perf_counter() < barrier.stop:
+            t0 = time.perf_counter()
+            await rerun(ws, page)
+            times.append((time.perf_counter() - t0) * 1000)
+    finally:
+        ws.close()
+    return cookie.split("=", 1)[1], times
+
+
+async def measure(port, page, sessions, seconds):
+    barrier = Barrier(sessions, seconds)
+    results = await asyncio.gather(*(browser(port, page, barrier) for _ in range(sessions)))
+    return results, time.perf_counter() - barrier.began
+
+
+# -----------------------------------------------------------------------------
+# 3. 워커 수마다 측정
+# -----------------------------------------------------------------------------
+def run(workers, args, shared_path):
+    process = launch(workers, args.port, args.base_port, shared_path)
+    try:
+        results, wall = asyncio.run(measure(args.port, args.page, args.sessions, args.seconds))
+    finally:
+        shutdown(process)
+    reruns = sorted(ms for _, times in results for ms in times)
+    per_worker = collections.Counter(worker for worker, _ in results)
+    return {
+        "workers": workers,
+        "reruns": len(reruns),
+        "throughput_rps": round(len(reruns) / wall, 2),
+        "rerun_p50_ms": round(percentile(reruns, 0.5), 1) if reruns else None,
+        "rerun_p95_ms": round(percentile(reruns, 0.95), 1) if reruns else None,
+        "sessions_per_worker": {w: per_worker[w] for w in sorted(per_worker, key=int)},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="비교할 워커 수들")
+    parser.add_argument("--page", default="Dice", help="재실행할 페이지 (app.py의 URL 이름, 예: PigGame)")
+    parser.add_argument("--sessions", type=int, default=40, help="동시 브라우저(학생) 수")
+    parser.add_argument("--seconds", type=float, default=20, help="워커 수마다 잴 시간")
+    parser.add_argument("--port", type=int, default=8581)
+    parser.add_argument("--base-port", type=int, default=8681)
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    shared_path = os.path.join(ROOT, "data", "bench-shared.sqlite3")
+    report = {"page": args.page, "sessions": args.sessions, "seconds": args.seconds,
+              "cpu_count": os.cpu_count(), "runs": []}
+    for workers in args.workers:
+        result = run(workers, args, shared_path)
+        base = report["runs"][0]["throughput_rps"] if report["runs"] else result["throughput_rps"]
+        result["speedup"] = round(result["throughput_rps"] / base, 2) if base else None
+        report["runs"].append(result)
+        print(f"워커 {workers:2d}: {result['throughput_rps']:8.1f} reruns/s (x{result['speedup']}) | "
+              f"p50/p95 {result['rerun_p50_ms']}/{result['rerun_p95_ms']} ms | "
+              f"세션 배분 {result['sessions_per_worker']}", file=sys.stderr)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
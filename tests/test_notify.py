@@ -0,0 +1,146 @@
+"""utils.notify: 요약 묶기와 나누기, 429 재시도, 버리기, 워커 둘이 한 번만 보내기 (127.0.0.1의 가짜 텔레그램)."""
+
+import http.server
+import json
+import threading
+import time
+
+import pytest
+
+from utils import notify, shared
+
+FLUSH = 0.05
+
+
+class FakeTelegram(http.server.ThreadingHTTPServer):
+    """받은 요청을 received에 모으고, replies에 넣어 둔 (상태 코드, 본문)을 차례로 돌려줍니다."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.received = []
+        self.replies = []
+        self.default = (200, {"ok": True})
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.received.append((self.path, body))
+            status, reply = self.server.replies.pop(0) if self.server.replies else self.server.default
+        data = json.dumps(reply).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def telegram():
+    server = FakeTelegram()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _wait(condition, seconds=5):
+    deadline = time.monotonic() + seconds
+    while not condition():
+        assert time.monotonic() < deadline, "시간 안에 끝나지 않았습니다."
+        time.sleep(0.01)
+
+
+def _delta(before, key):
+    return notify.stats().get(key, 0) - before.get(key, 0)
+
+
+# -----------------------------------------------------------------------------
+# 1. digest
+# -----------------------------------------------------------------------------
+def test_digest_coalesces_repeats():
+    [message] = notify.digest(["레벨업", "45점", "레벨업", "레벨업"])
+    header, *lines = message.split("\n")
+    assert "4건" in header
+    assert lines == ["레벨업 (×3)", "45점"]
+
+
+def test_digest_splits_at_message_limit():
+    lines = [f"{i:03d}" + "가" * 996 for i in range(10)]
+    messages = notify.digest(lines)
+    assert len(messages) > 1
+    assert all(len(m) <= notify.MESSAGE_LIMIT for m in messages)
+    assert "(이어서)" in messages[1].split("\n")[0]
+    assert [line for m in messages for line in m.split("\n")[1:]] == lines
+
+
+def test_digest_truncates_oversize_line():
+    messages = notify.digest(["가" * (notify.MESSAGE_LIMIT * 2), "다음 줄"])
+    # 머리말만 있는 메시지가 따로 나가면 안 됩니다.
+    assert all(len(m.split("\n")) > 1 for m in messages)
+    assert all(len(m) <= notify.MESSAGE_LIMIT for m in messages)
+    assert messages[0].split("\n")[1].startswith("가")
+    assert messages[-1].endswith("다음 줄")
+
+
+# -----------------------------------------------------------------------------
+# 2. 보내기
+# -----------------------------------------------------------------------------
+def test_flush_sends_one_digest_per_chat(telegram):
+    notifier = notify.Notifier("TOKEN", telegram.url, flush_seconds=FLUSH, store=shared.MemoryStore())
+    for _ in range(3):
+        notifier.send(1, "철수님 레벨업")
+    notifier.send(2, "영희님 45점")
+    _wait(lambda: len(telegram.received) == 2)
+
+    by_chat = {body["chat_id"]: body["text"] for _, body in telegram.received}
+    assert {path for path, _ in telegram.received} == {"/botTOKEN/sendMessage"}
+    assert by_chat["1"].endswith("\n철수님 레벨업 (×3)")
+    assert by_chat["2"].endswith("\n영희님 45점")
+
+
+def test_429_waits_retry_after(telegram):
+    telegram.replies = [(429, {"ok": False, "parameters": {"retry_after": 0}})]
+    before = notify.stats()
+    notifier = notify.Notifier("TOKEN", telegram.url, flush_seconds=FLUSH, store=shared.MemoryStore())
+    notifier.send(1, "한 줄")
+    _wait(lambda: _delta(before, "sent") == 1)
+
+    assert len(telegram.received) == 2
+    assert telegram.received[0][1] == telegram.received[1][1]
+    assert _delta(before, "retried") == 1
+
+
+def test_drops_after_max_attempts(telegram, monkeypatch):
+    monkeypatch.setattr(notify, "BACKOFF_SECONDS", 0.001)
+    telegram.default = (500, {"ok": False})
+    before = notify.stats()
+    notifier = notify.Notifier("TOKEN", telegram.url, flush_seconds=FLUSH, store=shared.MemoryStore())
+    notifier.send(1, "한 줄")
+    _wait(lambda: _delta(before, "dropped") == 1)
+
+    assert len(telegram.received) == notify.MAX_ATTEMPTS
+    assert _delta(before, "retried") == notify.MAX_ATTEMPTS - 1
+    assert _delta(before, "sent") == 0
+
+
+def test_two_notifiers_on_one_store_flush_once(telegram):
+    store = shared.MemoryStore()
+    workers = [notify.Notifier("TOKEN", telegram.url, flush_seconds=FLUSH, store=store) for _ in range(2)]
+    workers[0].send(1, "철수님 레벨업")
+    workers[1].send(1, "영희님 레벨업")
+    _wait(lambda: telegram.received)
+    time.sleep(FLUSH * 6)  # 대기열을 놓친 워커가 다시 시도할 시간
+
+    [(_, body)] = telegram.received
+    assert "2건" in body["text"].split("\n")[0]
+    assert body["text"].split("\n")[1:] == ["철수님 레벨업", "영희님 레벨업"]
@@ -0,0 +1,37 @@
+"""utils.quiz.collect: 사건 번호(seq)로 새 사건만 고르고, 마지막 번호 하나만 기억하는지."""
+
+import pytest
+
+from utils import quiz
+from utils.state import PageState
+
+
+@pytest.fixture
+def logged(monkeypatch):
+    kinds = []
+    monkeypatch.setattr(quiz.events, "log", lambda name, kind, **fields: kinds.append(kind))
+    return kinds
+
+
+def _value(*seqs, result=None):
+    return {"events": [{"seq": seq, "kind": f"answer{seq}", "correct": True} for seq in seqs], "result": result}
+
+
+def test_collect_keeps_only_the_last_seq(logged):
+    state = PageState()
+    new, result = quiz.collect("plus_minus", state, _value(101, 102, 103))
+    assert [e["seq"] for e in new] == [101, 102, 103] and result is None
+    assert state.last_seq == 103 and "seen" not in state
+
+    # 같은 값으로 다시 실행되거나, ack 전이라 이미 받은 사건을 다시 보내도 한 번만 남깁니다.
+    assert quiz.collect("plus_minus", state, _value(101, 102, 103)) == ([], None)
+    new, result = quiz.collect("plus_minus", state, _value(102, 103, 104, 105, result={"score": 3}))
+    assert [e["seq"] for e in new] == [104, 105] and result == {"score": 3}
+    assert state.last_seq == 105
+    assert logged == ["answer101", "answer102", "answer103", "answer104", "answer105"]
+
+
+def test_collect_without_value(logged):
+    state = PageState()
+    assert quiz.collect("plus_minus", state, None) == ([], None)
+    assert "last_seq" not in state and logged == []
@@ -0,0 +1,128 @@
+"""utils.shared: memory://와 sqlite:// 저장소의 약속 (TTL, claim, take, scan)과 utils.workers.shared_url."""
+
+import multiprocessing
+import time
+
+import pytest
+
+from utils import shared, workers
+
+TTL = 0.1
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return shared.open_store("memory://")
+    return shared.open_store(f"sqlite:///{tmp_path}/shared.sqlite3")
+
+
+# -----------------------------------------------------------------------------
+# 1. 저장소마다 같은 약속
+# -----------------------------------------------------------------------------
+def test_get_set_delete(store):
+    assert store.get("a") is None and store.get("a", 0) == 0
+    store.set("a", {"n": [1, 2]})
+    assert store.get("a") == {"n": [1, 2]}
+    store.delete("a")
+    assert store.get("a") is None
+
+
+def test_ttl_expires(store):
+    store.set("short", 1, ttl=TTL)
+    store.set("long", 2)
+    assert store.get("short") == 1
+    time.sleep(TTL * 2)
+    assert store.get("short") is None
+    assert store.get("long") == 2
+    assert store.scan("") == {"long": 2}
+
+
+def test_claim_has_one_winner_until_ttl(store):
+    assert store.claim("flush", TTL)
+    assert not store.claim("flush", TTL)
+    time.sleep(TTL * 2)
+    assert store.claim("flush", TTL)
+
+
+def test_take_empties_the_list(store):
+    for i in range(3):
+        store.push("queue", ["chat", i])
+    assert store.take("queue") == [["chat", 0], ["chat", 1], ["chat", 2]]
+    assert store.take("queue") == []
+
+
+def test_scan_matches_prefix_only(store):
+    store.set("workers:1", {"rss_kb": 1})
+    store.set("workers:2", {"rss_kb": 2})
+    store.set("workersX", 3)
+    store.set("room:AB", 4)
+    assert store.scan("workers:") == {"workers:1": {"rss_kb": 1}, "workers:2": {"rss_kb": 2}}
+
+
+# -----------------------------------------------------------------------------
+# 2. 같은 SQLite 파일을 쓰는 여러 프로세스
+# -----------------------------------------------------------------------------
+def _claim(path, start, results):
+    store = shared.SQLiteStore(path)
+    start.wait()
+    results.put(store.claim("flush", 60))
+
+
+def _take(path, start, results):
+    store = shared.SQLiteStore(path)
+    start.wait()
+    results.put(store.take("queue"))
+
+
+def _race(target, path, processes=4):
+    context = multiprocessing.get_context("spawn")
+    start, results = context.Event(), context.Queue()
+    children = [context.Process(target=target, args=(path, start, results)) for _ in range(processes)]
+    for child in children:
+        child.start()
+    start.set()
+    found = [results.get(timeout=60) for _ in children]
+    for child in children:
+        child.join(timeout=60)
+    return found
+
+
+def test_claim_across_processes(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    shared.SQLiteStore(path)
+    assert sorted(_race(_claim, path)) == [False, False, False, True]
+
+
+def test_take_across_processes(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    store = shared.SQLiteStore(path)
+    for i in range(200):
+        store.push("queue", i)
+    taken = [item for batch in _race(_take, path) for item in batch]
+    assert sorted(taken) == list(range(200))
+
+
+# -----------------------------------------------------------------------------
+# 3. utils.workers.shared_url
+# -----------------------------------------------------------------------------
+def test_workers_default_to_sqlite(monkeypatch):
+    monkeypatch.delenv("MATHZIP_SHARED", raising=False)
+    monkeypatch.setattr(shared, "url", lambda: shared.DEFAULT_URL)
+    assert workers.shared_url(4) == workers.DEFAULT_SHARED
+
+
+def test_workers_keep_configured_url(monkeypatch):
+    monkeypatch.setenv("MATHZIP_SHARED", "redis://localhost:6379/0")
+    assert workers.shared_url(4) == "redis://localhost:6379/0"
+
+
+def test_one_worker_may_use_memory(monkeypatch):
+    monkeypatch.setenv("MATHZIP_SHARED", "memory://")
+    assert workers.shared_url(1) == "memory://"
+
+
+def test_many_workers_refuse_memory(monkeypatch):
+    monkeypatch.setenv("MATHZIP_SHARED", "memory://")
+    with pytest.raises(SystemExit):
+        workers.shared_url(2)
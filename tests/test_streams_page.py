@@ -0,0 +1,51 @@
+"""보드게임/Streams.py: 뽑기 버튼을 20번보다 많이 눌러도 20개에서 멈추고 최고의 게임판이 나오는지 (AppTest)."""
+
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from utils.streams import scoring
+
+PAGE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "보드게임", "Streams.py")
+# disabled는 한 번 늦게 반영되므로, 멈춘 뒤에도 몇 번 더 누릅니다.
+CLICKS = scoring.SLOTS + 3
+
+
+@pytest.fixture
+def app(tmp_path_factory):
+    at = AppTest.from_file(PAGE, default_timeout=60)
+    at.query_params["seed"] = "7"
+    at.secrets["Events"] = {"path": str(tmp_path_factory.mktemp("events"))}
+    at.run()
+    assert not at.exception
+    return at
+
+
+def _click(at, key):
+    next(button for button in at.button if button.key == key).click()
+    at.run()
+    assert not at.exception, at.exception[0].message
+
+
+def _data(at):
+    return at.session_state["_page_state"]["streams"]["data"]
+
+
+@pytest.mark.parametrize("button, count", [
+    ("draw_base", "draw_count"),
+    ("draw_Z", "draw_count_Z"),
+    ("draw_Q", "draw_count_Q"),
+])
+def test_draw_stops_at_twenty(app, button, count):
+    for _ in range(CLICKS):
+        _click(app, button)
+    assert _data(app)[count] == scoring.SLOTS
+
+
+def test_custom_draw_stops_at_twenty(app):
+    _click(app, "restart_C")
+    assert len(_data(app)["custom_set"]) > scoring.SLOTS
+    for _ in range(CLICKS):
+        _click(app, "draw_C")
+    assert len(_data(app)["drawn_history_C"]) == scoring.SLOTS
@@ -0,0 +1,109 @@
+"""utils.streams.room: version 번호, 뽑기 20개 제한, 주인 확인 (공유 저장소는 memory://)."""
+
+import fractions
+
+import pytest
+
+from utils import rng, shared
+from utils.streams import room, scoring, tiles
+
+
+@pytest.fixture(autouse=True)
+def memory_store(monkeypatch):
+    store = shared.MemoryStore()
+    monkeypatch.setattr(shared, "store", lambda: store)
+    room.view.cache_clear()
+    yield store
+    room.view.cache_clear()
+
+
+def _open(tile_set=tiles.BASE, seed=1):
+    pool = tile_set.shuffled(rng.Stream(seed, "streams"))
+    code, owner = room.create(tile_set, pool)
+    return code, owner, pool
+
+
+def _number(code):
+    return int(room.version(code).split(":")[1])
+
+
+def test_create_starts_at_version_zero():
+    code, _, pool = _open()
+    assert len(code) == room.CODE_LENGTH and set(code) <= set(room.CODE_ALPHABET)
+    assert _number(code) == 0
+    view = room.view(code, room.version(code))
+    assert view["drawn"] == () and view["tile_set"] == "기본" and not view["joker"]
+    assert room.bounds(view) == (1, 30)
+
+
+def test_draw_follows_pool_and_bumps_version():
+    code, owner, pool = _open()
+    expected = pool.labels()[::-1]
+    for n in range(1, 4):
+        assert room.draw(code, owner) == expected[n - 1]
+        assert _number(code) == n
+    assert room.view(code, room.version(code))["drawn"] == tuple(expected[:3])
+
+
+def test_view_changes_only_with_version():
+    code, owner, _ = _open()
+    before = room.version(code)
+    assert room.view(code, before) is room.view(code, before)
+    room.draw(code, owner)
+    after = room.version(code)
+    assert after != before
+    assert len(room.view(code, after)["drawn"]) == 1
+
+
+def test_draw_cap():
+    code, owner, _ = _open()
+    drawn = [room.draw(code, owner) for _ in range(scoring.SLOTS + 5)]
+    assert all(tile is not None for tile in drawn[:scoring.SLOTS])
+    assert drawn[scoring.SLOTS:] == [None] * 5
+    assert _number(code) == scoring.SLOTS
+    assert len(room.view(code, room.version(code))["drawn"]) == scoring.SLOTS
+
+
+def test_restart_clears_drawn_and_keeps_counting():
+    code, owner, _ = _open()
+    room.draw(code, owner)
+    room.draw(code, owner)
+    room.restart(code, owner, tiles.BASE.shuffled(rng.Stream(2, "streams")))
+    assert _number(code) == 3
+    assert room.view(code, room.version(code))["drawn"] == ()
+
+
+def test_reused_code_gets_new_version(memory_store, monkeypatch):
+    monkeypatch.setattr(room.secrets, "choice", lambda alphabet: alphabet[0])
+    code, owner, _ = _open()
+    first = room.version(code)
+    room.close(code, owner)
+    assert room.version(code) is None
+    again, _, _ = _open()
+    assert again == code
+    assert room.version(code) != first
+
+
+def test_wrong_owner():
+    code, owner, _ = _open()
+    with pytest.raises(KeyError):
+        room.draw(code, "not-the-owner")
+    with pytest.raises(KeyError):
+        room.close("ZZZZ", owner)
+
+
+def test_fraction_bounds():
+    tile_set = tiles.RATIONAL.with_joker()
+    code, _, _ = _open(tile_set)
+    view = room.view(code, room.version(code))
+    assert view["latex"] and view["joker"]
+    assert room.bounds(view) == (fractions.Fraction(-3), fractions.Fraction(3))
+
+
+def test_create_rejects_unplayable_set():
+    with pytest.raises(ValueError):
+        _open(tiles.TileSet("⭐", [tiles.JOKER] * scoring.SLOTS))
+
+
+def test_normalize():
+    assert room.normalize(" ac d3 ") == "ACD3"
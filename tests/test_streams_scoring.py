@@ -0,0 +1,131 @@
+"""utils.streams.scoring: 조커 동적 계획법과 score_batch == score."""
+
+import fractions
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.streams import scoring
+
+J, E = scoring.JOKER, scoring.EMPTY
+
+
+def _brute_force(board):
+    """조커마다 판에 나온 값(과 양 끝)을 모두 넣어 보고 가장 높은 점수. 조커가 적은 판에서만."""
+    board = scoring.parse_board(board)
+    numbers = sorted({value for value in board if value not in (J, E)})
+    candidates = [min(numbers, default=0) - 1, *numbers, max(numbers, default=0) + 1]
+    jokers = [i for i, value in enumerate(board) if value is J]
+    best = 0
+    for values in itertools.product(candidates, repeat=len(jokers)):
+        filled = list(board)
+        for i, value in zip(jokers, values):
+            filled[i] = value
+        best = max(best, scoring.score(filled))
+    return best
+
+
+def _random_boards(n, seed, jokers=3, fractions_too=True):
+    rng = np.random.default_rng(seed)
+    pool = [*range(-5, 11)]
+    if fractions_too:
+        pool += ["1/2", "-5/3", "2.7", "\\frac{4}{3}"]
+    boards = []
+    for _ in range(n):
+        board = [pool[i] for i in rng.integers(0, len(pool), scoring.SLOTS)]
+        for i in rng.choice(scoring.SLOTS, rng.integers(0, jokers + 1), replace=False):
+            board[i] = J
+        for i in rng.choice(scoring.SLOTS, rng.integers(0, 3), replace=False):
+            board[i] = E
+        boards.append(board)
+    return boards
+
+
+# -----------------------------------------------------------------------------
+# 1. 칸 읽기
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("cell, expected", [
+    (7, fractions.Fraction(7)),
+    ("-5/3", fractions.Fraction(-5, 3)),
+    ("\\frac{4}{3}", fractions.Fraction(4, 3)),
+    ("$-\\frac{1}{2}$", fractions.Fraction(-1, 2)),
+    (2.7, fractions.Fraction(27, 10)),
+    ("*", J),
+    ("", E),
+    (float("nan"), E),
+])
+def test_tile_value(cell, expected):
+    assert scoring.tile_value(cell) == expected
+
+
+@pytest.mark.parametrize("cell", ["abc", "1/0", True])
+def test_tile_value_rejects(cell):
+    with pytest.raises(ValueError):
+        scoring.tile_value(cell)
+
+
+def test_parse_board_rejects_too_many_cells():
+    with pytest.raises(ValueError):
+        scoring.parse_board(range(scoring.SLOTS + 1))
+
+
+# -----------------------------------------------------------------------------
+# 2. 판 하나
+# -----------------------------------------------------------------------------
+def test_score_sorted_board_is_one_run():
+    assert scoring.score(range(1, 21)) == scoring.SCORES[20]
+
+
+def test_score_empty_board():
+    assert scoring.score([]) == 0
+
+
+def test_empty_cell_breaks_run():
+    # 1 2 3 | 빈칸 | 4 5 6
+    assert scoring.runs([1, 2, 3, E, 4, 5, 6]) == [(0, 3), (4, 3)]
+    assert scoring.score([1, 2, 3, E, 4, 5, 6]) == 2 * scoring.SCORES[3]
+
+
+def test_joker_bridges_a_drop():
+    # 조커가 5와 3 사이에 있으면 뒤 흐름(⭐ 3 4)에 붙는 편이 낫습니다: 0 + 3점 > 1 + 1점
+    assert scoring.score([5, J, 3, 4]) == scoring.SCORES[3]
+    assert scoring.runs([5, J, 3, 4]) == [(0, 1), (1, 3)]
+
+
+def test_joker_joins_longer_run():
+    assert scoring.score([1, 2, 3, J, 0]) == scoring.SCORES[4]
+
+
+def test_all_jokers():
+    assert scoring.score([J] * scoring.SLOTS) == scoring.SCORES[20]
+
+
+@pytest.mark.parametrize("board", _random_boards(25, seed=1, jokers=2, fractions_too=False))
+def test_joker_dp_matches_brute_force(board):
+    assert scoring.score(board) == _brute_force(board)
+
+
+# -----------------------------------------------------------------------------
+# 3. 판 여러 개
+# -----------------------------------------------------------------------------
+def test_score_batch_matches_score():
+    boards = _random_boards(300, seed=2, jokers=5)
+    expected = [scoring.score(board) for board in boards]
+    assert scoring.score_batch(boards).tolist() == expected
+
+
+def test_score_batch_joker_runs():
+    boards = [[J] * scoring.SLOTS, [5, J, 3, 4], [1, 2, 3, J, 0], list(range(20, 0, -1)), []]
+    assert scoring.score_batch(boards).tolist() == [scoring.score(board) for board in boards]
+
+
+def test_score_batch_dataframe():
+    boards = _random_boards(20, seed=3)
+    frame = pd.DataFrame(boards)
+    assert scoring.score_batch(frame).tolist() == [scoring.score(board) for board in boards]
+
+
+def test_rank_ties():
+    assert scoring.rank([10, 30, 10, 20]).tolist() == [3, 1, 3, 2]
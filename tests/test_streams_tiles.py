@@ -0,0 +1,120 @@
+"""utils.streams.tiles: 직접 만든 묶음(generate), validate, 섞은 묶음(Pool)."""
+
+import collections
+import fractions
+
+import pytest
+
+from utils import rng
+from utils.streams import scoring, tiles
+
+F = fractions.Fraction
+
+
+# -----------------------------------------------------------------------------
+# 1. generate
+# -----------------------------------------------------------------------------
+def test_generate_integers():
+    tile_set = tiles.generate(1, 5)
+    assert [tile.label for tile in tile_set.tiles] == ["1", "2", "3", "4", "5"]
+    assert (tile_set.low, tile_set.high) == (1, 5)
+
+
+def test_generate_negative_decimals():
+    tile_set = tiles.generate(-3, 0, max_denominator=10, sign="음수만", style="소수")
+    values = [tile.value for tile in tile_set.tiles]
+    assert all(value < 0 for value in values)
+    assert all(tiles.is_decimal(value) for value in values)
+    assert values == sorted(set(values))
+    labels = {tile.label for tile in tile_set.tiles}
+    assert {"-3", "-2.9", "-2.875", "-0.1"} <= labels
+    assert tile_set.low == -3 and tile_set.high == F(-1, 10)
+
+
+def test_generate_fraction_labels_and_copies():
+    tile_set = tiles.generate(0, 1, max_denominator=3, copies=2)
+    assert [tile.label for tile in tile_set.tiles] == ["0", "\\frac{1}{3}", "\\frac{1}{2}", "\\frac{2}{3}", "1"]
+    assert len(tile_set) == 10
+    assert tile_set.latex
+
+
+def test_generate_swaps_reversed_range():
+    assert [tile.value for tile in tiles.generate(3, 1).tiles] == [1, 2, 3]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"low": "a", "high": 3},
+    {"low": 0, "high": 3, "max_denominator": 0},
+    {"low": 0, "high": 3, "copies": tiles.MAX_COPIES + 1},
+    {"low": -1000, "high": 1000, "max_denominator": 10},
+])
+def test_generate_rejects(kwargs):
+    with pytest.raises(ValueError):
+        tiles.generate(**kwargs)
+
+
+# -----------------------------------------------------------------------------
+# 2. validate
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("tile_set", list(tiles.TILE_SETS.values()))
+def test_builtin_sets_are_playable(tile_set):
+    assert tile_set.validate() is tile_set
+    assert tile_set.with_joker().validate().joker
+
+
+def test_validate_too_few_tiles():
+    with pytest.raises(ValueError):
+        tiles.generate(1, scoring.SLOTS - 1).validate()
+    tiles.generate(1, scoring.SLOTS).validate()
+
+
+def test_validate_rejects_jokers_only():
+    with pytest.raises(ValueError):
+        tiles.TileSet("⭐", [tiles.JOKER] * scoring.SLOTS).validate()
+
+
+def test_validate_rejects_single_value():
+    with pytest.raises(ValueError):
+        tiles.TileSet.from_counts("7", [("7", tiles.MAX_COPIES), ("⭐", 1)]).validate()
+
+
+def test_from_counts_rejects_bad_count():
+    with pytest.raises(ValueError):
+        tiles.TileSet.from_counts("x", [("1", tiles.MAX_COPIES + 1)])
+
+
+def test_counts_round_trip():
+    tile_set = tiles.RATIONAL.with_joker()
+    rebuilt = tiles.TileSet.from_counts(tile_set.name, [(tile.label, n) for tile, n in tile_set.counts()])
+    assert rebuilt.counts() == tile_set.counts()
+
+
+# -----------------------------------------------------------------------------
+# 3. Pool
+# -----------------------------------------------------------------------------
+def _labels(tile_set):
+    return collections.Counter(tile_set.tiles[i].label for i in tile_set.slots.tolist())
+
+
+def test_pool_draws_every_tile_once():
+    tile_set = tiles.BASE.with_joker()
+    pool = tile_set.shuffled(rng.Stream(1234, "streams"))
+    drawn = [pool.draw() for _ in range(len(tile_set))]
+    assert collections.Counter(tile.label for tile in drawn) == _labels(tile_set)
+    assert len(pool) == 0 and pool.draw() is None
+
+
+def test_pool_labels_end_with_next_draw():
+    pool = tiles.INTEGER.shuffled(rng.Stream(7, "streams"))
+    pool.draw()
+    remaining = pool.labels()
+    assert len(remaining) == len(pool) == len(tiles.INTEGER) - 1
+    assert pool.draw().label == remaining[-1]
+
+
+def test_pool_same_seed_same_order():
+    first = tiles.RATIONAL.shuffled(rng.Stream(42, "streams")).labels()
+    again = tiles.RATIONAL.shuffled(rng.Stream(42, "streams")).labels()
+    other = tiles.RATIONAL.shuffled(rng.Stream(43, "streams")).labels()
+    assert first == again
+    assert first != other
@@ -0,0 +1,5 @@
+"""여러 페이지가 함께 쓰는 도구 모음.
+
+`streamlit run app.py`는 app.py가 있는 폴더를 sys.path에 넣으므로
+각 페이지에서 ``from utils import ...``로 불러올 수 있습니다.
+"""
@@ -0,0 +1,39 @@
+"""관리자 확인.
+
+관리 페이지는 메뉴에 보이지 않다가 secrets.toml의 관리자 토큰을 주소에 붙여 들어온
+세션(https://.../?admin=<토큰>)에서만 메뉴에 나타납니다. 한 번 확인되면 세션이 끝날
+때까지 유지되고, 토큰은 주소창에서 지웁니다.
+
+    # .streamlit/secrets.toml
+    [Admin]
+    Token = "..."
+"""
+
+import hmac
+
+import streamlit as st
+
+_SESSION_KEY = "_admin"
+QUERY_PARAM = "admin"
+
+
+def _token():
+    try:
+        return st.secrets["Admin"]["Token"]
+    except Exception:  # secrets.toml이 없거나 [Admin]이 없으면 관리 페이지를 열 수 없습니다.
+        return ""
+
+
+def is_admin():
+    """이 세션이 관리자인지 확인합니다. 주소에 올바른 토큰이 있으면 세션에 기억합니다."""
+    if st.session_state.get(_SESSION_KEY):
+        return True
+    given = st.query_params.get(QUERY_PARAM)
+    if given is None:
+        return False
+    del st.query_params[QUERY_PARAM]
+    token = _token()
+    if token and hmac.compare_digest(given, token):
+        st.session_state[_SESSION_KEY] = True
+        return True
+    return False
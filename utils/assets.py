@@ -0,0 +1,177 @@
+"""저장소 안의 파일(게임판 PDF, 아이콘, 성냥개비 퍼즐 그림)을 프로세스당 한 번만 읽어 둡니다.
+
+스트림스는 재실행마다 게임판 PDF를 디스크에서 다시 읽었고, app.py는 재실행마다 아이콘을
+읽었습니다. read()는 st.cache_resource로 만든 프로세스 전체의 캐시에서 내용을 돌려주고,
+파일의 수정 시각(mtime)과 크기가 바뀌었을 때만 다시 읽습니다. 수정 시각도 CHECK_SECONDS에
+한 번만 확인하므로, 학생 30명이 재실행해도 디스크에는 거의 가지 않습니다.
+
+    PDFbyte = assets.read("기타/스트림스_게임판.pdf")
+
+폴더를 통째로 브라우저에 내려줄 때는 url()을 씁니다. 처음 부를 때 그 폴더를 컴포넌트
+경로(component/...)로 등록하고, 요청이 오면 같은 캐시에서 내용과 강한 ETag(내용 해시)를
+보내 주므로 브라우저가 다시 물으면 304로 답합니다.
+
+    image_url = assets.url("기타/성냥개비퍼즐(54문제)/1.PNG")
+
+read()/url()로 읽은 횟수와 캐시 적중률은 stats()로 볼 수 있습니다(관리 페이지 › 운영 지표).
+"""
+
+import collections
+import hashlib
+import os
+import threading
+import time
+import urllib.parse
+
+import streamlit as st
+import streamlit.components.v1 as components
+from streamlit.logger import get_logger
+
+logger = get_logger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 같은 파일의 수정 시각을 다시 확인하기까지의 간격(초)
+CHECK_SECONDS = 2.0
+
+Asset = collections.namedtuple("Asset", "body etag mtime_ns size checked")
+
+# 프로세스 전체의 읽기 통계 (관리 페이지 › 운영 지표)
+_stats = collections.Counter()
+_stats_lock = threading.Lock()
+
+
+def _count(key):
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def stats():
+    """hits(캐시에서 돌려준 횟수), misses(디스크에서 읽은 횟수), hit_ratio, 캐시에 든 파일 수와 크기."""
+    with _stats_lock:
+        hits, misses = _stats["hits"], _stats["misses"]
+    cache = _cache()
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+        "files": len(cache.entries),
+        "bytes": sum(asset.size for asset in list(cache.entries.values())),
+    }
+
+
+# -----------------------------------------------------------------------------
+# 1. 캐시
+# -----------------------------------------------------------------------------
+class _Cache:
+    """절대 경로 -> Asset. 세션들이 여러 스레드에서 함께 씁니다."""
+
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def get(self, path):
+        now = time.monotonic()
+        asset = self.entries.get(path)
+        if asset is not None and now - asset.checked < CHECK_SECONDS:
+            _count("hits")
+            return asset
+        with self.lock:
+            asset = self.entries.get(path)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                self.entries.pop(path, None)
+                raise
+            if asset is not None and (asset.mtime_ns, asset.size) == (stat.st_mtime_ns, stat.st_size):
+                asset = self.entries[path] = asset._replace(checked=now)
+                _count("hits")
+                return asset
+            with open(path, "rb") as f:
+                body = f.read()
+            etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+            asset = self.entries[path] = Asset(body, etag, stat.st_mtime_ns, len(body), now)
+            _count("misses")
+            return asset
+
+
+@st.cache_resource(show_spinner=False)
+def _cache():
+    return _Cache()
+
+
+def _abspath(path):
+    return os.path.normpath(os.path.join(ROOT, path))
+
+
+def read(path):
+    """저장소 루트 기준 path의 내용(bytes). 파일이 없으면 FileNotFoundError."""
+    return _cache().get(_abspath(path)).body
+
+
+def etag(path):
+    """path 내용의 강한 ETag(따옴표 포함). 내용이 같으면 프로세스와 배포가 달라도 같습니다."""
+    return _cache().get(_abspath(path)).etag
+
+
+# -----------------------------------------------------------------------------
+# 2. 브라우저에 내려주기 (component/<이름>/<파일>)
+# -----------------------------------------------------------------------------
+_served = {}  # 컴포넌트 이름 -> 폴더 절대 경로
+_served_lock = threading.Lock()
+
+
+def _component_name(directory):
+    """directory 폴더를 컴포넌트로 등록하고 이름을 돌려줍니다. 폴더마다 한 번."""
+    with _served_lock:
+        for name, path in _served.items():
+            if path == directory:
+                return name
+        key = "assets_" + hashlib.sha256(directory.encode("utf-8")).hexdigest()[:8]
+        name = components.declare_component(key, path=directory).name
+        _served[name] = directory
+        _patch_component_handler()
+        return name
+
+
+def url(path):
+    """path 파일을 내려받을 상대 주소 (components.html의 iframe 안에서 쓸 수 있습니다).
+
+    등록에는 실행 중인 스크립트가 필요하므로 페이지 실행 중에 불러야 합니다.
+    """
+    directory, filename = os.path.split(_abspath(path))
+    return f"component/{_component_name(directory)}/{urllib.parse.quote(filename)}"
+
+
+def _patch_component_handler():
+    """등록한 폴더의 파일을 캐시에서 ETag와 함께 내려주도록 컴포넌트 파일 핸들러를 바꿉니다.
+
+    Streamlit의 핸들러는 요청마다 파일을 열어 읽으므로, 등록한 폴더만 가로채고 나머지는
+    원래 핸들러에 맡깁니다. 핸들러 구조가 바뀐 버전에서는 원래대로 디스크에서 읽습니다.
+    """
+    try:
+        from streamlit.web.server.component_request_handler import ComponentRequestHandler
+    except ImportError:
+        return
+    original = ComponentRequestHandler.get
+    if getattr(original, "assets_cached", False):
+        return
+    def get(self, path):
+        name, _, filename = path.partition("/")
+        directory = _served.get(name)
+        if directory is None or not filename or "/" in filename:
+            return original(self, path)
+        try:
+            asset = _cache().get(os.path.join(directory, filename))
+        except OSError:
+            return original(self, path)
+        self.set_header("Etag", asset.etag)
+        # 내용이 바뀌어도 주소는 그대로이므로, 브라우저가 매번 ETag로 확인하게 합니다.
+        self.set_header("Cache-Control", "no-cache")
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        self.set_header("Content-Type", self.get_content_type(filename))
+        self.write(asset.body)
+
+    get.assets_cached = True
+    ComponentRequestHandler.get = get
@@ -0,0 +1,219 @@
+"""게임 중에 일어난 일을 날짜·페이지로 나눈 Parquet 데이터셋에 쌓습니다.
+
+퀴즈의 문제별 정답 여부와 풀이 시간, Pig Game의 주사위, 스트림스의 숫자 뽑기, 숫자야구의
+추측을 한 줄씩 남깁니다. 한 학기치를 반·게임·레벨로 잘라 봐도 빠르도록, 열(column) 단위로
+저장하고 날짜와 페이지는 폴더로 나눕니다 (관리 › 학습 분석).
+
+    events.log("pig", "roll", value=5)
+    events.log("baseball", "guess", level="4자리", value="1234", correct=False)
+
+    data/events/date=2026-03-02/page=pig/part-093015-1a2b3c4d.parquet
+
+줄은 메모리에 모았다가 ROW_GROUP_ROWS줄마다 열려 있는 파일에 row group 하나로 쓰고,
+ROLL_SECONDS마다(그리고 서버가 끝날 때) 파일을 닫아 읽을 수 있게 합니다. 쓰는 중인 파일은
+이름이 점으로 시작해 pyarrow.dataset이 건너뜁니다.
+
+지난 날짜의 작은 파일들은 가끔 하나로 합칩니다.
+
+    python -m utils.events --compact
+"""
+
+import argparse
+import atexit
+import collections
+import datetime
+import os
+import sys
+import threading
+import time
+import uuid
+import zoneinfo
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import streamlit as st
+from streamlit.logger import get_logger
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils import results
+
+logger = get_logger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(ROOT, "data", "events")
+ROW_GROUP_ROWS = 10_000
+ROLL_SECONDS = 15 * 60
+# 날짜 폴더는 학교 시간으로 나눕니다.
+KST = zoneinfo.ZoneInfo("Asia/Seoul")
+
+SCHEMA = pa.schema([
+    ("ts", pa.timestamp("ms", tz="UTC")),
+    ("session", pa.string()),
+    ("class", pa.string()),
+    ("player", pa.string()),
+    ("kind", pa.string()),        # answer, game_over, roll, hold, draw, guess ...
+    ("level", pa.string()),
+    ("value", pa.string()),       # 주사위 눈, 뽑은 숫자, 추측한 수, 점수 ...
+    ("correct", pa.bool_()),
+    ("latency_ms", pa.int32()),
+])
+PARTITION_SCHEMA = pa.schema([("date", pa.string()), ("page", pa.string())])
+PARTITIONING = ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+
+
+# -----------------------------------------------------------------------------
+# 1. 쓰기
+# -----------------------------------------------------------------------------
+class EventLog:
+    """(날짜, 페이지)마다 버퍼 하나와 열린 ParquetWriter 하나."""
+
+    def __init__(self, path=DEFAULT_PATH, row_group_rows=ROW_GROUP_ROWS, roll_seconds=ROLL_SECONDS):
+        self.path = path
+        self.row_group_rows = row_group_rows
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._buffers = collections.defaultdict(list)
+        self._writers = {}   # (날짜, 페이지) -> (ParquetWriter, 쓰는 중인 경로, 닫은 뒤 경로)
+        self.stats = {"rows": 0, "row_groups": 0, "files": 0}
+        threading.Thread(target=self._roll_loop, args=(roll_seconds,), name="events-roller", daemon=True).start()
+        atexit.register(self.roll)
+
+    def log(self, page, kind, *, session="", classroom="", player="", level="", value=None,
+            correct=None, latency_ms=None):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        row = {
+            "ts": now, "session": session, "class": classroom, "player": player or "", "kind": kind,
+            "level": str(level), "value": None if value is None else str(value),
+            "correct": correct, "latency_ms": None if latency_ms is None else int(latency_ms),
+        }
+        key = (now.astimezone(KST).date().isoformat(), page)
+        with self._lock:
+            buffer = self._buffers[key]
+            buffer.append(row)
+            self.stats["rows"] += 1
+            if len(buffer) >= self.row_group_rows:
+                self._write(key)
+
+    def _write(self, key):
+        """버퍼를 row group 하나로 씁니다. self._lock을 잡은 채로 부릅니다."""
+        rows = self._buffers.pop(key, None)
+        if not rows:
+            return
+        if key not in self._writers:
+            directory = os.path.join(self.path, f"date={key[0]}", f"page={key[1]}")
+            os.makedirs(directory, exist_ok=True)
+            name = f"part-{datetime.datetime.now(KST):%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+            writing = os.path.join(directory, "." + name)
+            self._writers[key] = (pq.ParquetWriter(writing, SCHEMA, compression="zstd"),
+                                  writing, os.path.join(directory, name))
+        self._writers[key][0].write_table(pa.Table.from_pylist(rows, schema=SCHEMA))
+        self.stats["row_groups"] += 1
+
+    def roll(self):
+        """모아 둔 줄을 모두 쓰고 열린 파일을 닫아 분석 페이지에서 읽을 수 있게 합니다."""
+        with self._lock:
+            for key in list(self._buffers):
+                self._write(key)
+            for writer, writing, final in self._writers.values():
+                writer.close()
+                os.replace(writing, final)
+                self.stats["files"] += 1
+            self._writers.clear()
+
+    def _roll_loop(self, seconds):
+        while True:
+            time.sleep(seconds)
+            try:
+                self.roll()
+            except Exception:
+                logger.exception("events: 파일을 닫지 못했습니다.")
+
+    def pending(self):
+        """아직 읽을 수 없는(버퍼나 열린 파일에 있는) 줄이 있는지."""
+        with self._lock:
+            return bool(self._buffers or self._writers)
+
+
+def _path():
+    try:
+        return st.secrets["Events"]["path"]
+    except Exception:  # secrets.toml이 없거나 [Events]가 없으면 기본 위치
+        return DEFAULT_PATH
+
+
+@st.cache_resource(show_spinner=False)
+def store():
+    """모든 세션이 함께 쓰는 EventLog."""
+    return EventLog(_path())
+
+
+def log(page, kind, **fields):
+    """이 세션의 사건 하나를 남깁니다. 세션과 반(?class=...)은 알아서 채웁니다."""
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        fields.setdefault("session", ctx.session_id)
+        fields.setdefault("classroom", results.classroom())
+    store().log(page, kind, **fields)
+
+
+# -----------------------------------------------------------------------------
+# 2. 읽기
+# -----------------------------------------------------------------------------
+def dataset(path=None):
+    """닫힌 파일 전체를 pyarrow 데이터셋으로 엽니다. 날짜와 페이지는 폴더 이름에서 읽습니다."""
+    return ds.dataset(path or store().path, schema=pa.unify_schemas([SCHEMA, PARTITION_SCHEMA]),
+                      format="parquet", partitioning=PARTITIONING)
+
+
+def partition_values(name, path=None):
+    """폴더 이름에 나오는 date 또는 page 값 목록 (파일을 열지 않습니다)."""
+    path = path or store().path
+    values = set()
+    for directory, subdirs, _ in os.walk(path):
+        values.update(d.split("=", 1)[1] for d in subdirs if d.startswith(f"{name}="))
+    return sorted(values)
+
+
+# -----------------------------------------------------------------------------
+# 3. 지난 날짜 합치기 (python -m utils.events --compact)
+# -----------------------------------------------------------------------------
+def compact(path=DEFAULT_PATH, before=None):
+    """before(기본: 어제) 이전 날짜의 페이지 폴더마다 파일을 하나로 합칩니다. 합친 폴더 수를 돌려줍니다."""
+    before = before or (datetime.datetime.now(KST).date() - datetime.timedelta(days=1)).isoformat()
+    merged = 0
+    for date_dir in sorted(os.listdir(path)):
+        if not date_dir.startswith("date=") or date_dir[5:] >= before:
+            continue
+        for page_dir in sorted(os.listdir(os.path.join(path, date_dir))):
+            directory = os.path.join(path, date_dir, page_dir)
+            files = sorted(f for f in os.listdir(directory) if f.endswith(".parquet") and not f.startswith("."))
+            if len(files) < 2:
+                continue
+            table = ds.dataset([os.path.join(directory, f) for f in files], schema=SCHEMA, format="parquet").to_table()
+            name = f"part-compact-{uuid.uuid4().hex[:8]}.parquet"
+            # 반·레벨 순으로 정렬해 두면 row group의 최솟값/최댓값으로 건너뛸 수 있는 부분이 많아집니다.
+            table = table.sort_by([("class", "ascending"), ("level", "ascending"), ("ts", "ascending")])
+            pq.write_table(table, os.path.join(directory, "." + name),
+                           row_group_size=ROW_GROUP_ROWS, compression="zstd")
+            os.replace(os.path.join(directory, "." + name), os.path.join(directory, name))
+            for f in files:
+                os.remove(os.path.join(directory, f))
+            merged += 1
+            print(f"{date_dir}/{page_dir}: {len(files)}개 -> 1개 ({table.num_rows:,}줄)", file=sys.stderr)
+    return merged
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--compact", action="store_true", help="어제 이전 날짜의 파일을 페이지마다 하나로 합치기")
+    parser.add_argument("--path", default=DEFAULT_PATH)
+    args = parser.parse_args(argv)
+    if args.compact:
+        compact(args.path)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""페이지가 실제로 쓰는 글자만 담은 한글 웹 글꼴(WOFF2)을 만들어 저장소에서 내려줍니다.
+
+퀴즈 게임은 Google Fonts에서 Jua를, 보로노이는 Pretendard를 씁니다. 한글 글꼴 전체는
+수 MB라 iframe마다 받으면 교실 Wi-Fi에서 첫 화면이 늦게 뜹니다. 여기서는 글꼴을 쓰는
+페이지의 문자열에서 글자를 모아 그 글자만 남긴 WOFF2(수십 KB)와 @font-face CSS를 만들고,
+utils.vendor로 해시 이름 + immutable 캐시 헤더를 붙여 내려줍니다.
+
+    <link rel="stylesheet" href="vendor:jua.css">
+
+페이지 글자를 바꿨으면 다시 만들고 결과를 커밋합니다. 글자 목록이 그대로인 글꼴은
+건너뛰므로 언제 실행해도 됩니다. (pip install fonttools brotli 가 필요합니다.)
+
+    python -m utils.fonts          # 글자 목록이 바뀐 글꼴만 다시 만들기
+    python -m utils.fonts --check  # 커밋된 글꼴이 지금 페이지 글자와 맞는지 확인 (CI용)
+
+원본 글꼴은 .cache/fonts/에 한 번 내려받아 둡니다. 모아 둔 글자에 없는 글자(학생이 입력한
+이름 등)는 CSS의 다음 글꼴(sans-serif 등)로 보입니다.
+"""
+
+import argparse
+import ast
+import hashlib
+import io
+import os
+import string
+import sys
+import urllib.request
+
+from utils import vendor
+
+ROOT = vendor.ROOT
+CACHE_DIR = os.path.join(ROOT, ".cache", "fonts")
+
+# 글꼴 이름 -> 원본 주소, CSS 파일 이름, 글자를 모을 페이지
+FONTS = {
+    "Jua": {
+        "source": "https://cdn.jsdelivr.net/gh/google/fonts@main/ofl/jua/Jua-Regular.ttf",
+        "css": "jua.css",
+        "pages": (
+            "utils/quiz/frontend/plus_minus.html",
+            "utils/quiz/frontend/multiplication_division.html",
+            "utils/quiz/frontend/polynomial.html",
+        ),
+    },
+    "Pretendard": {
+        "source": "https://cdn.jsdelivr.net/npm/pretendard@1.3.9/dist/public/static/Pretendard-Regular.otf",
+        "css": "pretendard.css",
+        "pages": ("체험수학/VoronoiDiagram.py",),
+    },
+}
+
+# 페이지에 없어도 늘 넣어 두는 글자 (숫자, 영문, 기호)
+ALWAYS = string.printable.strip() + " "
+
+
+# -----------------------------------------------------------------------------
+# 1. 글자 모으기
+# -----------------------------------------------------------------------------
+def _text(path):
+    """페이지에 나오는 글자. 파이썬 파일은 문자열 상수만 봅니다."""
+    with open(os.path.join(ROOT, path), encoding="utf-8") as f:
+        source = f.read()
+    if not path.endswith(".py"):
+        return source
+    return "".join(node.value for node in ast.walk(ast.parse(source))
+                   if isinstance(node, ast.Constant) and isinstance(node.value, str))
+
+
+def glyphs(font):
+    """font를 쓰는 페이지의 글자를 정렬해 한 문자열로 돌려줍니다."""
+    chars = set(ALWAYS)
+    for path in FONTS[font]["pages"]:
+        chars.update(c for c in _text(path) if c.isprintable())
+    return "".join(sorted(chars))
+
+
+def _glyphs_digest(font):
+    return hashlib.sha256(glyphs(font).encode("utf-8")).hexdigest()[:12]
+
+
+def _woff2_name(font):
+    return f"{font}.woff2"
+
+
+def stale():
+    """커밋된 글꼴과 페이지 글자가 맞지 않는 글꼴 이름 목록."""
+    manifest = vendor._manifest()
+    return [font for font in FONTS
+            if manifest.get(_woff2_name(font), {}).get("glyphs") != _glyphs_digest(font)]
+
+
+# -----------------------------------------------------------------------------
+# 2. 만들기
+# -----------------------------------------------------------------------------
+def _source(font):
+    """원본 글꼴 파일 경로. 없으면 내려받습니다."""
+    url = FONTS[font]["source"]
+    path = os.path.join(CACHE_DIR, os.path.basename(url))
+    if not os.path.exists(path):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with urllib.request.urlopen(url, timeout=60) as response:
+            body = response.read()
+        with open(path, "wb") as f:
+            f.write(body)
+    return path
+
+
+def subset(font):
+    """font를 페이지 글자만 남긴 WOFF2 bytes로 돌려줍니다."""
+    try:
+        from fontTools import subset as ft_subset
+        import brotli  # noqa: F401  (WOFF2 압축에 필요)
+    except ImportError:
+        sys.exit("fonttools와 brotli가 필요합니다. pip install fonttools brotli 후 다시 실행하세요.")
+
+    options = ft_subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    options.hinting = False          # 화면용이라 힌팅은 빼도 티가 나지 않고 크기가 꽤 줄어듭니다.
+    options.desubroutinize = True    # CFF(otf)는 이쪽이 WOFF2로 더 잘 압축됩니다.
+    ttfont = ft_subset.load_font(_source(font), options)
+    subsetter = ft_subset.Subsetter(options)
+    subsetter.populate(text=glyphs(font))
+    subsetter.subset(ttfont)
+    out = io.BytesIO()
+    ft_subset.save_font(ttfont, out, options)
+    return out.getvalue()
+
+
+def build(font):
+    """WOFF2와 @font-face CSS를 static/vendor/에 기록하고 (WOFF2 크기, CSS 파일 이름)을 돌려줍니다."""
+    body = subset(font)
+    woff2 = vendor.record(_woff2_name(font), body, f"subset:{FONTS[font]['source']}", glyphs=_glyphs_digest(font))
+    # CSS와 WOFF2는 같은 폴더에서 내려가므로 파일 이름만 적으면 됩니다.
+    css = (f"@font-face{{font-family:'{font}';font-style:normal;font-weight:400;font-display:swap;"
+           f"src:url({woff2}) format('woff2')}}\n")
+    return len(body), vendor.record(FONTS[font]["css"], css.encode("utf-8"), "build:utils.fonts")
+
+
+# -----------------------------------------------------------------------------
+# 3. 실행 (python -m utils.fonts)
+# -----------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="다시 만들지 않고 페이지 글자와 맞는지만 확인")
+    parser.add_argument("--force", action="store_true", help="글자 목록이 그대로여도 모두 다시 만들기")
+    args = parser.parse_args(argv)
+
+    targets = list(FONTS) if args.force else stale()
+    if args.check:
+        manifest = vendor._manifest()
+        for font in targets:
+            reason = "페이지 글자가 바뀌었습니다" if _woff2_name(font) in manifest else "아직 만들지 않았습니다"
+            print(f"❌ {font}: {reason}. python -m utils.fonts로 다시 만드세요.", file=sys.stderr)
+        if targets:
+            sys.exit(1)
+        return
+    for font in targets:
+        size, css = build(font)
+        print(f"{font:12s} {len(glyphs(font)):5d}자 {size / 1024:7.1f} KB -> static/vendor/{css}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""느린 학교 네트워크를 위한 가벼운 모드.
+
+세션이 시작되면 app.py가 보이지 않는 컴포넌트(probe)를 한 번 띄워 브라우저에서 앱 서버까지의
+왕복 시간(RTT)과 내려받기 속도를 잽니다. 연결이 나쁘면(SLOW_RTT_MS, SLOW_KBPS) 가벼운 모드를
+켜고, 무거운 페이지들은 enabled()를 보고 가벼운 쪽을 그립니다.
+
+  - 퀴즈 게임, 보로노이: 웹 글꼴을 받지 않음 (without_fonts)
+  - 스트림스: 게임 방법 영상 대신 링크
+  - 성냥개비 퍼즐: 줄인 그림 (small_images)
+  - 회전체: 회전면 조각 수 32 -> LATHE_SEGMENTS
+  - Pig Game: Plotly 차트 대신 PNG 그림
+
+학생(또는 선생님)은 왼쪽 메뉴의 스위치로 언제든 바꿀 수 있고, 링크에 ?lite=1 / ?lite=0을
+붙여 나눠 주면 재지 않고 그대로 정합니다. 모드별로 페이지가 내려받는 바이트는
+`python -m bench.lite`로 봅니다.
+
+    lite.setup()            # app.py, pg.run() 전에 (재기 + 스위치)
+    if lite.enabled(): ...  # 페이지에서
+"""
+
+import atexit
+import functools
+import io
+import os
+import re
+import shutil
+import tempfile
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from utils import vendor
+
+QUERY_PARAM = "lite"
+# 이보다 느리면 가벼운 모드를 켭니다.
+SLOW_RTT_MS = 400
+SLOW_KBPS = 1500
+SLOW_TYPES = ("slow-2g", "2g")
+# 속도를 잴 때 내려받는 크기. 느린 연결에서도 몇 초 안에 끝나도록 작게 둡니다.
+PROBE_BYTES = 128 * 1024
+# 가벼운 모드의 회전체 조각 수와 성냥개비 그림 크기
+LATHE_SEGMENTS = 12
+IMAGE_SCALE = 0.6
+IMAGE_COLORS = 16
+
+_KEY = "lite"
+_AUTO = "_lite_auto"            # 아직 재는 중이면 True
+_CONNECTION = "_lite_connection"  # 잰 값 {"rtt_ms", "kbps", "effective_type", "save_data"}
+
+_PROBE_HTML = """<!DOCTYPE html>
+<html><body><script>
+(function () {
+    function send(type, data) {
+        window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data), "*");
+    }
+    async function timed(url, timeout) {
+        const abort = new AbortController();
+        const timer = setTimeout(function () { abort.abort(); }, timeout);
+        const start = performance.now();
+        try {
+            const response = await fetch(url + "?t=" + Date.now() + Math.random(), { cache: "no-store", signal: abort.signal });
+            const body = await response.arrayBuffer();
+            return [performance.now() - start, body.byteLength];
+        } catch (e) {
+            return [performance.now() - start, 0];
+        } finally {
+            clearTimeout(timer);
+        }
+    }
+    async function probe() {
+        const rtts = [];
+        for (let i = 0; i < 3; i++) rtts.push((await timed("ping.txt", 5000))[0]);
+        const rtt = Math.min.apply(null, rtts);
+        const [ms, bytes] = await timed("payload.bin", 8000);
+        const connection = navigator.connection || {};
+        send("streamlit:setComponentValue", { dataType: "json", value: {
+            rtt_ms: Math.round(rtt),
+            // 받은 비트 / 밀리초 = kbps. 다 받지 못했으면 받은 만큼만 셉니다.
+            kbps: Math.round(bytes * 8 / Math.max(ms - rtt, 1)),
+            effective_type: connection.effectiveType || null,
+            save_data: !!connection.saveData,
+        } });
+    }
+    let started = false;
+    window.addEventListener("message", function (event) {
+        if (!event.data || event.data.type !== "streamlit:render" || started) return;
+        started = true;
+        send("streamlit:setFrameHeight", { height: 0 });
+        probe();
+    });
+    send("streamlit:componentReady", { apiVersion: 1 });
+})();
+</script></body></html>
+"""
+
+
+# -----------------------------------------------------------------------------
+# 1. 연결 재기와 스위치 (app.py)
+# -----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def _probe():
+    """잴 때 쓰는 파일들을 임시 폴더에 쓰고 컴포넌트를 만듭니다. 프로세스당 한 번."""
+    out = tempfile.mkdtemp(prefix="mathzip-lite-")
+    atexit.register(shutil.rmtree, out, ignore_errors=True)
+    with open(os.path.join(out, "probe.html"), "w", encoding="utf-8") as f:
+        f.write(_PROBE_HTML)
+    with open(os.path.join(out, "ping.txt"), "w") as f:
+        f.write("ok")
+    with open(os.path.join(out, "payload.bin"), "wb") as f:
+        f.write(os.urandom(PROBE_BYTES))  # 압축되지 않도록 무작위 바이트
+    name = vendor.serve("lite", out)
+    return components.declare_component("lite_probe", url=f"component/{name}/probe.html")
+
+
+def is_slow(connection):
+    """브라우저가 잰 값으로 가벼운 모드가 필요한지 정합니다."""
+    return (connection.get("rtt_ms", 0) > SLOW_RTT_MS
+            or connection.get("kbps", SLOW_KBPS) < SLOW_KBPS
+            or connection.get("effective_type") in SLOW_TYPES
+            or bool(connection.get("save_data")))
+
+
+def _chosen():
+    # 스위치를 직접 바꾸면 재던 중이어도 그 선택을 따릅니다.
+    st.session_state[_AUTO] = False
+
+
+def setup():
+    """세션이 시작될 때 연결을 재고, 재실행마다 왼쪽 메뉴에 가벼운 모드 스위치를 그립니다."""
+    ss = st.session_state
+    if _KEY not in ss:
+        forced = st.query_params.get(QUERY_PARAM)
+        ss[_KEY] = forced == "1"
+        ss[_AUTO] = forced not in ("0", "1")
+
+    if ss.get(_AUTO):
+        connection = _probe()(key="_lite_probe", default=None, height=0)
+        if connection:
+            ss[_AUTO] = False
+            ss[_CONNECTION] = connection
+            if is_slow(connection):
+                ss[_KEY] = True
+                st.toast("🪶 연결이 느려서 가벼운 모드로 바꿨습니다. 왼쪽 메뉴에서 끌 수 있습니다.")
+
+    connection = ss.get(_CONNECTION)
+    measured = (f"잰 연결: 왕복 {connection['rtt_ms']} ms, {connection['kbps'] / 1000:.1f} Mbps"
+                if connection else "연결을 재지 않았습니다.")
+    st.sidebar.toggle("🪶 가벼운 모드", key=_KEY, on_change=_chosen,
+                      help=f"글꼴, 영상, 큰 그림을 줄여 느린 네트워크에서도 빨리 뜨게 합니다. {measured}")
+
+
+def enabled():
+    """이 세션이 가벼운 모드인지."""
+    return bool(st.session_state.get(_KEY, False))
+
+
+# -----------------------------------------------------------------------------
+# 2. 페이지에서 쓰는 가벼운 변형
+# -----------------------------------------------------------------------------
+# 웹 글꼴 스타일시트 (utils.fonts가 만든 것과 Google Fonts)
+_FONT_LINK = re.compile(r'<link\b[^>]*href="(?:vendor:(?:jua|pretendard)\.css|https://fonts\.googleapis\.com/[^"]*)"[^>]*>\s*')
+
+
+def without_fonts(html):
+    """HTML에서 웹 글꼴 <link>를 뺍니다. 글꼴 이름 뒤의 기본 글꼴(sans-serif 등)로 보입니다."""
+    return _FONT_LINK.sub("", html)
+
+
+@functools.lru_cache(maxsize=None)
+def small_images(directory):
+    """directory(저장소 루트 기준)의 PNG를 IMAGE_SCALE 크기, IMAGE_COLORS색으로 줄여 임시 폴더에
+    쓰고 그 폴더의 절대 경로를 돌려줍니다. 프로세스당 한 번 (처음 가벼운 모드로 열 때)."""
+    from PIL import Image
+
+    source = os.path.join(vendor.ROOT, directory)
+    out = tempfile.mkdtemp(prefix="mathzip-lite-images-")
+    atexit.register(shutil.rmtree, out, ignore_errors=True)
+    for filename in os.listdir(source):
+        if not filename.lower().endswith(".png"):
+            continue
+        with Image.open(os.path.join(source, filename)) as image:
+            image = image.convert("RGBA")
+            size = (max(1, round(image.width * IMAGE_SCALE)), max(1, round(image.height * IMAGE_SCALE)))
+            # 투명한 배경은 흰색으로 채웁니다 (캔버스 배경이 흰색입니다).
+            background = Image.new("RGBA", image.size, "white")
+            image = Image.alpha_composite(background, image).convert("RGB").resize(size, Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.quantize(IMAGE_COLORS).save(buffer, "PNG", optimize=True)
+        with open(os.path.join(out, filename), "wb") as f:
+            f.write(buffer.getvalue())
+    return out
@@ -0,0 +1,219 @@
+"""운영 지표 수집기.
+
+app.py가 pg.run()을 timed()로 감싸면 재실행마다 (시각, 페이지, 걸린 시간, 재실행을 일으킨
+위젯, 결과)가 프로세스 전체에서 하나인 링 버퍼에 쌓입니다. 버퍼는 길이가 정해져 있어
+오래된 기록부터 밀려나므로 메모리가 늘지 않습니다. 수집은 perf_counter 두 번과 deque.append
+정도라 재실행 시간에 거의 영향을 주지 않고, RSS/스레드 수는 SAMPLE_SECONDS마다 한 번만 잽니다.
+
+관리 페이지(관리/Metrics.py)가 runs(), samples(), active_sessions()로 읽어 보여 줍니다.
+워커 프로세스가 여럿이면(utils.workers) 각 워커가 표본을 잴 때 요약을 공유 저장소에 올리고,
+관리 페이지는 workers()로 모든 워커를 한 표로 봅니다.
+
+    with metrics.timed(pg):
+        pg.run()
+
+st.fragment 대신 metrics.fragment(이름)을 쓰면 그 fragment만 다시 실행될 때(app.py를 거치지
+않습니다)도 같은 링 버퍼에 "페이지 › 부분" 이름으로 남습니다.
+"""
+
+import collections
+import contextlib
+import functools
+import os
+import resource
+import sys
+import threading
+import time
+
+import streamlit as st
+from streamlit import config
+from streamlit.logger import get_logger
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils import shared, state
+
+logger = get_logger(__name__)
+
+# 최근 재실행 기록 개수 (한 건에 수백 바이트)
+RUN_BUFFER = 5000
+# RSS/스레드 수를 재는 간격(초)과 남겨 둘 표본 수 (720 x 5초 = 1시간)
+SAMPLE_SECONDS = 5
+SAMPLE_BUFFER = 720
+# 이 시간(초) 안에 재실행이 있었던 세션을 "접속 중"으로 봅니다.
+ACTIVE_SECONDS = 5 * 60
+
+Run = collections.namedtuple("Run", "ts page ms trigger outcome session")
+Sample = collections.namedtuple("Sample", "ts rss_kb threads")
+
+
+def current_rss_kb():
+    """현재 RSS(KB). /proc가 없는 환경에서는 최대 RSS로 대신합니다."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss // 1024 if sys.platform == "darwin" else rss
+
+
+# -----------------------------------------------------------------------------
+# 1. 지표 저장소 (프로세스 전체에서 하나)
+# -----------------------------------------------------------------------------
+_lock = threading.Lock()
+_runs = collections.deque(maxlen=RUN_BUFFER)
+_samples = collections.deque(maxlen=SAMPLE_BUFFER)
+_sessions = {}  # session_id -> (페이지, 마지막 재실행 시각)
+_next_sample = 0.0
+
+
+def _maybe_sample(now):
+    """SAMPLE_SECONDS가 지났으면 RSS/스레드 수를 기록하고 오래된 세션을 정리합니다."""
+    global _next_sample
+    if now < _next_sample:
+        return
+    with _lock:
+        if now < _next_sample:
+            return
+        _next_sample = now + SAMPLE_SECONDS
+        _samples.append(Sample(now, current_rss_kb(), threading.active_count()))
+        for sid, (_, last) in list(_sessions.items()):
+            if now - last > ACTIVE_SECONDS:
+                _sessions.pop(sid, None)
+    _publish(now)
+
+
+def _publish(now):
+    """이 워커의 요약을 공유 저장소에 올립니다. 세 번 거르면 관리 페이지에서 사라집니다."""
+    recent = sorted(run.ms for run in list(_runs) if now - run.ts <= 60)
+    sample = _samples[-1]
+    try:
+        shared.store().set(f"workers:{os.getpid()}", {
+            "port": config.get_option("server.port"),
+            "sessions": len(_sessions),
+            "reruns_per_min": len(recent),
+            "p95_ms": round(recent[int(len(recent) * 0.95)], 1) if recent else None,
+            "rss_kb": sample.rss_kb,
+            "threads": sample.threads,
+            "ts": now,
+        }, ttl=3 * SAMPLE_SECONDS)
+    except Exception:  # 지표를 못 올려도 페이지는 그대로 돌아가야 합니다.
+        logger.exception("metrics: 워커 요약을 공유 저장소에 올리지 못했습니다.")
+
+
+# -----------------------------------------------------------------------------
+# 2. 재실행을 일으킨 위젯 찾기
+# -----------------------------------------------------------------------------
+# 위젯 ID는 "$$ID-<해시>-<key>" 꼴이라 key를 준 위젯은 이름을 알 수 있습니다.
+# key가 없는 위젯은 종류(버튼 등)와 해시 앞부분으로 표시합니다.
+_KINDS = {
+    "trigger_value": "버튼",
+    "string_trigger_value": "입력",
+    "json_trigger_value": "이벤트",
+    "bool_value": "체크박스",
+    "string_array_value": "선택",
+}
+
+
+def triggered_widget():
+    """이번 재실행을 일으킨 위젯 이름. 첫 실행이나 페이지 이동이면 None.
+
+    Streamlit 내부 상태(SessionState)를 읽으므로 구조가 바뀌어도 앱이 멈추지 않도록
+    실패하면 None을 돌려줍니다.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    try:
+        ss = ctx.session_state._state
+        new, old = ss._new_widget_state, ss._old_state
+        for wid in new.states:
+            # 이전 실행에 없던 위젯(다른 페이지에서 넘어온 경우 등)은 비교할 값이 없습니다.
+            if wid not in old or new.get(wid) == old[wid]:
+                continue
+            key = wid.rsplit("-", 1)[-1]
+            if key and key != "None":
+                return key
+            metadata = new.widget_metadata.get(wid)
+            kind = _KINDS.get(metadata.value_type, metadata.value_type) if metadata else "위젯"
+            return f"{kind}({wid.split('-')[1][:6]})"
+    except Exception:
+        return None
+    return None
+
+
+# -----------------------------------------------------------------------------
+# 3. 재실행 시간 재기
+# -----------------------------------------------------------------------------
+@contextlib.contextmanager
+def timed(page):
+    """with 블록(=페이지 실행)에 걸린 시간을 page의 기록으로 남깁니다.
+
+    st.rerun()/st.stop()은 예외로 전달되므로 결과(outcome)에 그 이름을 적고 다시 올려 보냅니다.
+    """
+    ctx = get_script_run_ctx()
+    session = ctx.session_id if ctx is not None else None
+    name = getattr(page, "title", None) or str(page)
+    trigger = triggered_widget()
+    outcome = "ok"
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        outcome = type(e).__name__
+        raise
+    finally:
+        ms = (time.perf_counter() - start) * 1000
+        now = time.time()
+        _runs.append(Run(now, name, ms, trigger, outcome, session))
+        if session is not None:
+            _sessions[session] = (name, now)
+        _maybe_sample(now)
+
+
+def fragment(name, **kwargs):
+    """st.fragment(**kwargs)와 같은 데코레이터. 부분 재실행에 걸린 시간을 name으로 남깁니다.
+
+    부분 재실행에서는 page_state()가 불리지 않으므로, 이 페이지의 상태를 방금 쓴 것으로 표시해
+    (state.touch) fragment로만 오래 쓰는 페이지가 정리되지 않게 합니다.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def run(*args, **kw):
+            ctx = get_script_run_ctx()
+            # 페이지 전체 실행 중이면 app.py의 timed()가 이미 재고 있습니다.
+            if ctx is None or not ctx.fragment_ids_this_run:
+                return func(*args, **kw)
+            state.touch()
+            with timed(name):
+                return func(*args, **kw)
+        return st.fragment(run, **kwargs)
+    return decorate
+
+
+# -----------------------------------------------------------------------------
+# 4. 읽기 (관리 페이지용)
+# -----------------------------------------------------------------------------
+def runs():
+    """링 버퍼에 남아 있는 재실행 기록(오래된 것부터)."""
+    return list(_runs)
+
+
+def samples():
+    """RSS/스레드 수 표본(오래된 것부터)."""
+    return list(_samples)
+
+
+def workers():
+    """공유 저장소에 요약을 올린 워커들 (pid -> 요약)."""
+    return {key.split(":", 1)[1]: value for key, value in shared.store().scan("workers:").items()}
+
+
+def active_sessions(now=None):
+    """페이지별 접속 중인 세션 수."""
+    if now is None:
+        now = time.time()
+    counts = collections.Counter(
+        page for page, last in list(_sessions.values()) if now - last <= ACTIVE_SECONDS
+    )
+    return dict(counts)
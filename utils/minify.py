@@ -0,0 +1,199 @@
+"""페이지에 넣는 HTML(인라인 CSS/JS 포함)을 서버 프로세스당 한 번만 줄여 둡니다.
+
+회전체, 보로노이, 성냥개비 퍼즐과 퀴즈 게임의 HTML은 주석과 들여쓰기까지 그대로 웹소켓으로
+나갑니다. page_html()은 HTML의 내용 해시를 키로 결과를 기억해 두므로, 같은 페이지를 다시
+열거나 재실행할 때는 해시만 계산하고 줄여 둔 문자열을 그대로 돌려줍니다.
+
+    components.html(minify.page_html("rotation", html_code), height=800)
+
+줄인 바이트 수는 report()로 볼 수 있습니다(관리 페이지 › 운영 지표).
+
+줄이는 방법은 보수적입니다. 동작이 바뀔 수 있는 변환(이름 줄이기, 줄바꿈 없애기)은 하지 않고
+  - HTML: 주석 제거, 연속 공백을 한 칸으로
+  - CSS : 주석 제거, 기호 주변 공백 제거
+  - JS  : 주석과 들여쓰기, 빈 줄 제거 (문자열/템플릿 리터럴/정규식 안은 그대로)
+만 합니다.
+"""
+
+import hashlib
+import re
+import threading
+
+from streamlit.logger import get_logger
+
+from utils import vendor
+
+logger = get_logger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# 1. 줄이기
+# -----------------------------------------------------------------------------
+_BLOCK = re.compile(r"(<(script|style)\b[^>]*>)(.*?)(</\2\s*>)", re.IGNORECASE | re.DOTALL)
+_HTML_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_PUNCT = re.compile(r"\s*([{};,>])\s*")
+_WS = re.compile(r"\s+")
+
+# 이 문자 뒤의 "/"는 나눗셈이 아니라 정규식의 시작입니다.
+_REGEX_PREV = set("(,=:[!&|?{};+-*%<>~^\n")
+
+
+def _minify_css(css):
+    css = _CSS_COMMENT.sub("", css)
+    css = _WS.sub(" ", css)
+    css = _CSS_PUNCT.sub(r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def _skip_string(code, i):
+    """code[i]에서 시작하는 문자열/템플릿 리터럴이 끝난 다음 위치."""
+    quote, j, n = code[i], i + 1, len(code)
+    while j < n:
+        c = code[j]
+        if c == "\\":
+            j += 2
+        elif c == quote:
+            return j + 1
+        elif quote == "`" and code.startswith("${", j):
+            j = _skip_braces(code, j + 2)
+        else:
+            j += 1
+    return n
+
+
+def _skip_braces(code, j):
+    """템플릿 리터럴의 ${ ... } 안쪽을 건너뜁니다."""
+    depth, n = 1, len(code)
+    while j < n:
+        c = code[j]
+        if c in "\"'`":
+            j = _skip_string(code, j)
+            continue
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return j + 1
+        j += 1
+    return n
+
+
+def _skip_regex(code, i):
+    j, n, in_class = i + 1, len(code), False
+    while j < n:
+        c = code[j]
+        if c == "\\":
+            j += 2
+            continue
+        if c == "\n":
+            return j
+        if c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            j += 1
+            while j < n and code[j].isalpha():
+                j += 1
+            return j
+        j += 1
+    return n
+
+
+def _minify_js(code):
+    out = []
+    i, n = 0, len(code)
+    prev = "\n"          # 마지막으로 내보낸 공백 아닌 문자 (정규식 판별용)
+    line_start = True
+    while i < n:
+        c = code[i]
+        if c in "\"'`":
+            j = _skip_string(code, i)
+            out.append(code[i:j])
+            prev, line_start, i = c, False, j
+        elif code.startswith("//", i):
+            j = code.find("\n", i)
+            i = n if j < 0 else j
+        elif code.startswith("/*", i):
+            j = code.find("*/", i + 2)
+            i = n if j < 0 else j + 2
+        elif c == "/" and prev in _REGEX_PREV:
+            j = _skip_regex(code, i)
+            out.append(code[i:j])
+            prev, line_start, i = "/", False, j
+        elif c == "\n":
+            if out and not line_start:
+                out.append("\n")
+            line_start, i = True, i + 1
+        elif c in " \t\r":
+            j = i
+            while j < n and code[j] in " \t\r":
+                j += 1
+            if not line_start and j < n and code[j] != "\n":
+                out.append(" ")
+            i = j
+        else:
+            out.append(c)
+            prev, line_start, i = c, False, i + 1
+    return "".join(out).strip()
+
+
+def minify(html):
+    """HTML 문자열을 줄여서 돌려줍니다."""
+    parts, last = [], 0
+    for m in _BLOCK.finditer(html):
+        parts.append(_WS.sub(" ", _HTML_COMMENT.sub("", html[last:m.start()])))
+        open_tag, kind, body, close_tag = m.groups()
+        body = _minify_css(body) if kind.lower() == "style" else _minify_js(body)
+        parts.append(open_tag + body + close_tag)
+        last = m.end()
+    parts.append(_WS.sub(" ", _HTML_COMMENT.sub("", html[last:])))
+    return "".join(parts).strip()
+
+
+# -----------------------------------------------------------------------------
+# 2. 페이지별 기억 (프로세스 전체에서 하나)
+# -----------------------------------------------------------------------------
+_lock = threading.Lock()
+_cache = {}   # 내용 해시 -> 줄인 HTML
+_stats = {}   # 페이지 이름 -> {"original_bytes", "minified_bytes"}
+
+
+def page_html(name, html, replacements=None, from_component=False):
+    """vendor: 주소 바꾸기 + replacements 치환 + 줄이기를 한 번만 하고 결과를 기억해 둡니다.
+
+    replacements: {"___URLS___": "..."}처럼 HTML 안의 자리표시자를 바꿀 값.
+    """
+    replacements = replacements or {}
+    digest = hashlib.blake2b(html.encode("utf-8"), digest_size=16)
+    for placeholder, value in sorted(replacements.items()):
+        digest.update(f"\0{placeholder}\0{value}".encode("utf-8"))
+    key = (digest.hexdigest(), from_component)
+
+    result = _cache.get(key)
+    if result is not None:
+        return result
+    with _lock:
+        if key in _cache:
+            return _cache[key]
+        text = vendor.link(html, from_component)
+        for placeholder, value in replacements.items():
+            text = text.replace(placeholder, value)
+        result = minify(text)
+        original, minified = len(text.encode("utf-8")), len(result.encode("utf-8"))
+        _stats[name] = {"original_bytes": original, "minified_bytes": minified}
+        _cache[key] = result
+    logger.info("minify: %s %d -> %d bytes (-%.0f%%)", name, original, minified, 100 * (1 - minified / original))
+    return result
+
+
+def report():
+    """페이지별 원래 크기, 줄인 크기, 줄어든 바이트 수."""
+    return {
+        name: {**s, "saved_bytes": s["original_bytes"] - s["minified_bytes"],
+               "saved_pct": round(100 * (1 - s["minified_bytes"] / s["original_bytes"]), 1)}
+        for name, s in sorted(_stats.items())
+    }
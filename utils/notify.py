@@ -0,0 +1,177 @@
+"""선생님 알림(텔레그램)을 서버에서 모아 1분에 한 번씩 채팅방별 요약으로 보냅니다.
+
+다항식 챌린지는 원래 학생 브라우저가 레벨업, 45점, 게임 종료 때마다 텔레그램 API를 직접
+불렀습니다. 봇 토큰이 페이지에 그대로 실렸고, 한 반이 같이 하면 1분에 수백 건을 보내
+텔레그램의 전송 제한에 걸렸습니다. 이제 게임은 사건을 컴포넌트 값으로 파이썬에 돌려주고,
+페이지는 알림 한 줄을 여기 큐에 넣기만 합니다.
+
+    notify.telegram(token).send(chat_id, "철수님이 레벨업했습니다! 🎉")
+
+봇마다 백그라운드 스레드 하나가 asyncio 이벤트 루프를 돌립니다. 첫 알림이 들어오면
+FLUSH_SECONDS 동안 더 모은 뒤, 채팅방(반)마다 한 통으로 묶어 보냅니다. 같은 줄이 여러 번
+들어오면 "(×3)"으로 합칩니다. 실패하면 지수적으로 기다렸다가 다시 보내고(429면 텔레그램이
+알려 준 시간만큼), MAX_ATTEMPTS번 실패한 요약은 버리고 로그를 남깁니다. 공유 저장소 오류처럼
+예상하지 못한 오류가 나도 스레드는 멈추지 않고, 로그를 남긴 뒤 기다렸다가 다시 보냅니다.
+
+대기열은 공유 저장소(utils.shared)에 있어서, 워커 프로세스가 여럿이어도 FLUSH_SECONDS마다
+한 프로세스만 대기열을 비워 보냅니다. 채팅방마다 1분에 요약 한 통은 그대로입니다.
+
+api_base를 바꾸면 로컬의 가짜 HTTP 서버로 보낼 수 있습니다 (secrets의 [Telegram] api_base).
+"""
+
+import asyncio
+import collections
+import datetime
+import functools
+import hashlib
+import json
+import threading
+import urllib.error
+import urllib.request
+
+from streamlit.logger import get_logger
+
+from utils import shared
+
+logger = get_logger(__name__)
+
+API_BASE = "https://api.telegram.org"
+FLUSH_SECONDS = 60
+MAX_ATTEMPTS = 5
+BACKOFF_SECONDS = 2
+TIMEOUT_SECONDS = 10
+# 텔레그램 메시지 한 통의 최대 길이는 4096자입니다. 머리말 자리를 남겨 둡니다.
+MESSAGE_LIMIT = 4000
+
+# 프로세스 전체의 전송 통계 (관리 페이지 › 운영 지표)
+_stats = collections.Counter()
+_stats_lock = threading.Lock()
+
+
+def _count(key, n=1):
+    with _stats_lock:
+        _stats[key] += n
+
+
+def stats():
+    """queued(받은 줄), sent(보낸 요약), retried, dropped(버린 요약), failed(대기열을 비우다 난 오류) 수."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+# -----------------------------------------------------------------------------
+# 1. 요약 만들기
+# -----------------------------------------------------------------------------
+def digest(lines):
+    """알림 줄들을 MESSAGE_LIMIT 이하의 메시지 목록으로 묶습니다. 같은 줄은 하나로 합칩니다."""
+    counts = collections.Counter(lines)
+    merged = [line if counts[line] == 1 else f"{line} (×{counts[line]})" for line in dict.fromkeys(lines)]
+    header = f"🔔 MathZip 알림 {len(lines)}건 ({datetime.datetime.now():%H:%M})"
+
+    # 너무 긴 줄은 먼저 자릅니다. 자르기 전 길이로 비교하면 머리말만 있는 메시지가 나갑니다.
+    width = MESSAGE_LIMIT - len(header) - 20
+    messages, current = [], header
+    for line in merged:
+        line = line[:width]
+        if len(current) + 1 + len(line) > MESSAGE_LIMIT:
+            messages.append(current)
+            current = header + " (이어서)"
+        current += "\n" + line
+    messages.append(current)
+    return messages
+
+
+# -----------------------------------------------------------------------------
+# 2. 보내기
+# -----------------------------------------------------------------------------
+class Notifier:
+    """봇 하나의 알림 큐. 페이지(스크립트 스레드)에서는 send()만 부릅니다."""
+
+    def __init__(self, token, api_base=API_BASE, flush_seconds=FLUSH_SECONDS, store=None):
+        self.url = f"{api_base.rstrip('/')}/bot{token}/sendMessage"
+        self.flush_seconds = flush_seconds
+        # 공유 저장소의 대기열 이름 (토큰은 저장소에 남기지 않습니다)
+        self.key = "notify:" + hashlib.sha256(token.encode()).hexdigest()[:16]
+        self._store = store or shared.store()
+        self._loop = asyncio.new_event_loop()
+        self._wake = asyncio.Event()
+        threading.Thread(target=self._run, name="telegram-notifier", daemon=True).start()
+
+    def send(self, chat_id, line):
+        """chat_id로 보낼 알림 한 줄을 큐에 넣습니다. 바로 돌아옵니다."""
+        _count("queued")
+        self._store.push(self.key, [str(chat_id), line])
+        self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._worker())
+
+    async def _worker(self):
+        failures = 0
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            try:
+                await self._flush()
+                failures = 0
+            except Exception:
+                # 저장소 오류 등으로 이 스레드가 멈추면 그 뒤 알림은 쌓이기만 하고 아무도 보내지 않습니다.
+                failures += 1
+                _count("failed")
+                delay = BACKOFF_SECONDS * 2 ** min(failures, MAX_ATTEMPTS)
+                logger.exception("notify: 대기열을 보내지 못했습니다. %d초 뒤 다시 시도합니다.", delay)
+                await asyncio.sleep(delay)
+                self._wake.set()  # 대기열에 남은 것을 다시 보냅니다.
+
+    async def _flush(self):
+        await asyncio.sleep(self.flush_seconds)
+        # 다른 워커가 방금 대기열을 비웠으면 한 번 더 기다렸다가 남은 것을 보냅니다.
+        while not await asyncio.to_thread(self._store.claim, self.key + ":flush", self.flush_seconds):
+            await asyncio.sleep(self.flush_seconds)
+        batch = await asyncio.to_thread(self._store.take, self.key)
+        by_chat = collections.defaultdict(list)
+        for chat_id, line in batch:
+            by_chat[chat_id].append(line)
+        for chat_id, lines in by_chat.items():
+            for text in digest(lines):
+                await self._deliver(chat_id, text)
+
+    def _post(self, chat_id, text):
+        body = json.dumps({"chat_id": chat_id, "text": text}).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=TIMEOUT_SECONDS) as response:
+            response.read()
+
+    async def _deliver(self, chat_id, text):
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                await asyncio.to_thread(self._post, chat_id, text)
+                _count("sent")
+                return
+            except urllib.error.HTTPError as e:
+                if e.code == 429:
+                    try:
+                        delay = json.loads(e.read())["parameters"]["retry_after"]
+                    except (ValueError, KeyError, TypeError):
+                        delay = BACKOFF_SECONDS * 2 ** attempt
+                elif e.code < 500:
+                    # 토큰이나 chat_id가 틀린 경우라 다시 보내도 소용없습니다.
+                    logger.error("notify: 텔레그램이 요약을 거절했습니다 (HTTP %d).", e.code)
+                    break
+                else:
+                    delay = BACKOFF_SECONDS * 2 ** attempt
+            except OSError as e:  # URLError, 시간 초과, 연결 끊김
+                logger.warning("notify: 전송 실패 (%s), 다시 시도합니다.", e)
+                delay = BACKOFF_SECONDS * 2 ** attempt
+            if attempt + 1 < MAX_ATTEMPTS:
+                _count("retried")
+                await asyncio.sleep(delay)
+        _count("dropped")
+        logger.error("notify: 요약 한 통을 보내지 못하고 버렸습니다 (%d자).", len(text))
+
+
+@functools.lru_cache(maxsize=None)
+def telegram(token, api_base=API_BASE):
+    """봇 토큰마다 하나인 Notifier (프로세스 전체에서 공유)."""
+    return Notifier(token, api_base)
@@ -0,0 +1,125 @@
+"""무거운 모듈을 서버 시작 시 백그라운드 스레드에서 미리 불러 두는 예열기.
+
+matplotlib(균형을 잡아라), pandas·plotly(Pig Game)는 처음 import하고 처음 그릴 때
+수백 ms가 걸립니다. 배포 직후 그 페이지를 처음 연 학생만 이 비용을 치르지 않도록
+app.py가 맨 처음 실행될 때(서버가 뜬 뒤 첫 접속) start()를 호출하고, 페이지는
+module()로 예열된 모듈을 받아 씁니다. 예열 결과는 서버 로그에 모듈별 시간으로 남습니다.
+
+    from utils import prewarm
+    plt = prewarm.module("matplotlib.pyplot")
+"""
+
+import importlib
+import io
+import threading
+import time
+
+from streamlit.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# 1. 예열 작업: import 뒤에 한 번 실제로 사용해 지연 import/캐시까지 채웁니다.
+# -----------------------------------------------------------------------------
+def _warm_numpy(np):
+    np.clip(np.arange(3), 0, 1)
+
+
+def _warm_pandas(pd):
+    pd.Series([1, 2, 2]).value_counts()
+
+
+def _warm_plotly(go):
+    # plotly는 import는 빠르지만 첫 Figure 생성/직렬화 때 검증기와 JSON 엔진을 불러옵니다.
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=[1, 2], y=[0, 1], mode='lines+markers', line_shape='spline'))
+    fig.update_layout(xaxis_title="x", yaxis_range=[0, 1], height=300, margin=dict(l=0, r=0, t=0, b=0))
+    fig.to_json()
+
+
+def _warm_matplotlib(plt):
+    # 첫 savefig에서 폰트 캐시와 Agg 렌더러가 준비됩니다.
+    fig, ax = plt.subplots(figsize=(1, 1))
+    ax.scatter([0], [0], marker='^')
+    ax.axis('off')
+    fig.savefig(io.BytesIO(), format="png")
+    plt.close(fig)
+
+
+# (모듈 이름, 예열 함수) — 순서대로 예열합니다.
+HEAVY_MODULES = (
+    ("numpy", _warm_numpy),
+    ("pandas", _warm_pandas),
+    ("plotly.graph_objects", _warm_plotly),
+    ("matplotlib.pyplot", _warm_matplotlib),
+)
+
+
+# -----------------------------------------------------------------------------
+# 2. 예열 상태 (프로세스 전체에서 하나)
+# -----------------------------------------------------------------------------
+_lock = threading.Lock()
+_thread = None
+_ready = threading.Event()
+_done = {name: threading.Event() for name, _ in HEAVY_MODULES}
+_timings = {}  # 모듈 이름 -> {"import_ms", "warm_ms"} 또는 {"error"}
+
+
+def _run():
+    total_start = time.perf_counter()
+    for name, warm in HEAVY_MODULES:
+        try:
+            start = time.perf_counter()
+            mod = importlib.import_module(name)
+            imported = time.perf_counter()
+            warm(mod)
+            warmed = time.perf_counter()
+            _timings[name] = {
+                "import_ms": round((imported - start) * 1000, 1),
+                "warm_ms": round((warmed - imported) * 1000, 1),
+            }
+            logger.info("prewarm: %s import %.1f ms, warm %.1f ms",
+                        name, _timings[name]["import_ms"], _timings[name]["warm_ms"])
+        except Exception as e:  # 예열 실패가 앱 실행을 막으면 안 됩니다.
+            _timings[name] = {"error": f"{type(e).__name__}: {e}"}
+            logger.warning("prewarm: %s failed: %s", name, e)
+        finally:
+            _done[name].set()
+    _ready.set()
+    logger.info("prewarm: ready in %.1f ms", (time.perf_counter() - total_start) * 1000)
+
+
+def start():
+    """예열 스레드를 시작합니다. 여러 번 불러도 프로세스당 한 번만 실행됩니다."""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_run, name="prewarm", daemon=True)
+            _thread.start()
+
+
+def is_ready():
+    """모든 모듈의 예열이 끝났는지 여부."""
+    return _ready.is_set()
+
+
+def wait(timeout=None):
+    """예열이 끝날 때까지 기다립니다. 끝났으면 True."""
+    return _ready.wait(timeout)
+
+
+def timings():
+    """모듈별 import/예열 시간(ms)."""
+    return dict(_timings)
+
+
+def module(name, timeout=10):
+    """예열된 모듈을 돌려줍니다.
+
+    예열 중이면 그 모듈의 예열이 끝날 때까지(최대 timeout초) 기다리고,
+    예열기가 돌지 않는 환경(AppTest로 페이지만 실행 등)에서는 바로 import합니다.
+    """
+    if _thread is not None and name in _done:
+        _done[name].wait(timeout)
+    return importlib.import_module(name)
@@ -0,0 +1,182 @@
+"""관리자가 켜는 재실행 샘플링 프로파일러.
+
+운영 중에 어떤 재실행(균형을 잡아라의 draw_balance_scale, Pig Game 통계 등)이 왜 느린지
+보려면, 관리자 세션의 주소에 ?profile=N을 붙입니다. 그 세션의 다음 N번 재실행 동안 작은 스레드가
+SAMPLE_MS마다 페이지 스크립트 스레드의 호출 스택을 찍습니다. 관리자 토큰이 없는 세션의
+?profile은 무시합니다.
+
+    https://<주소>/?admin=<토큰>&profile=5
+
+재실행 하나가 끝나면 스택을 flamegraph 도구가 읽는 접힌 스택(collapsed stacks) 형식
+("바깥;...;안쪽 표본수" 한 줄씩)으로 data/profiles/에 씁니다(위치는 [Profiler] path).
+
+    flamegraph.pl data/profiles/20261018-101500-PigGame-1234.folded > pig.svg
+    # 또는 https://www.speedscope.app 에 파일을 끌어다 놓기
+
+최근 프로파일과 함수별 요약(자기 시간, 포함 시간)은 관리 › 운영 지표에서 봅니다.
+프로파일하지 않는 재실행에는 세션 상태를 한 번 읽는 것 말고는 아무 일도 하지 않습니다.
+"""
+
+import collections
+import contextlib
+import datetime
+import os
+import re
+import sys
+import threading
+import time
+
+import streamlit as st
+from streamlit.logger import get_logger
+
+from utils.admin import is_admin
+
+logger = get_logger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(ROOT, "data", "profiles")
+QUERY_PARAM = "profile"
+# 스택을 찍는 간격(밀리초)과 한 번에 켤 수 있는 최대 재실행 수
+SAMPLE_MS = 5
+MAX_RUNS = 50
+# 관리 페이지에 남겨 둘 최근 프로파일 수
+KEEP = 20
+
+_SESSION_KEY = "_profile_left"
+
+Profile = collections.namedtuple("Profile", "ts page ms samples stacks path")
+
+
+# -----------------------------------------------------------------------------
+# 1. 샘플러
+# -----------------------------------------------------------------------------
+def _label(code):
+    """스택 한 칸의 이름: 함수 (저장소 기준 파일:첫 줄). ';'는 접힌 스택의 구분자라 쓰지 않습니다."""
+    filename = code.co_filename
+    if filename.startswith(ROOT + os.sep):
+        filename = os.path.relpath(filename, ROOT)
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+
+
+class Sampler:
+    """thread_id 스레드의 호출 스택을 interval초마다 세는 스레드."""
+
+    def __init__(self, thread_id, interval=SAMPLE_MS / 1000):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = collections.Counter()  # (바깥, ..., 안쪽) -> 표본 수
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def collapsed(stacks):
+    """접힌 스택 형식의 텍스트 (flamegraph.pl, speedscope, inferno가 읽습니다)."""
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in stacks.most_common())
+
+
+def top_functions(stacks, limit=15):
+    """함수별 (자기 시간, 포함 시간) 표본 수. 자기 시간이 큰 순서."""
+    own, total = collections.Counter(), collections.Counter()
+    for stack, count in stacks.items():
+        own[stack[-1]] += count
+        for label in set(stack):
+            total[label] += count
+    return [{"function": label, "self": own[label], "total": total[label]}
+            for label, _ in own.most_common(limit)]
+
+
+# -----------------------------------------------------------------------------
+# 2. 재실행 감싸기 (app.py)
+# -----------------------------------------------------------------------------
+_lock = threading.Lock()
+_profiles = collections.deque(maxlen=KEEP)
+
+
+def _path():
+    try:
+        return st.secrets["Profiler"]["path"]
+    except Exception:  # secrets.toml이 없거나 [Profiler]가 없으면 기본 위치
+        return DEFAULT_PATH
+
+
+def _requested():
+    """주소의 ?profile=N을 읽어 이 세션에 남은 횟수로 기억합니다. 관리자 세션만."""
+    given = st.query_params.get(QUERY_PARAM)
+    if given is None:
+        return
+    del st.query_params[QUERY_PARAM]
+    if not is_admin():
+        return
+    try:
+        runs = max(1, min(MAX_RUNS, int(given)))
+    except ValueError:
+        runs = 1
+    st.session_state[_SESSION_KEY] = runs
+    st.toast(f"🔥 다음 재실행 {runs}번을 프로파일합니다.")
+
+
+def _save(page, ms, stacks):
+    now = time.time()
+    directory = _path()
+    slug = re.sub(r"[^\w.-]+", "_", page).strip("_") or "page"
+    filename = f"{datetime.datetime.fromtimestamp(now):%Y%m%d-%H%M%S}-{slug}-{os.getpid()}-{int(now * 1000) % 1000:03d}.folded"
+    path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, filename)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(collapsed(stacks))
+    except OSError:  # 파일을 못 써도 관리 페이지에서는 볼 수 있습니다.
+        logger.exception("profiler: %s에 쓰지 못했습니다.", directory)
+        path = None
+    with _lock:
+        _profiles.append(Profile(now, page, ms, sum(stacks.values()), stacks, path))
+    logger.info("profiler: %s %.0f ms, 표본 %d개 -> %s", page, ms, sum(stacks.values()), path)
+
+
+@contextlib.contextmanager
+def sampled(page):
+    """이 세션에 프로파일할 재실행이 남아 있으면 with 블록을 샘플링합니다."""
+    _requested()
+    left = st.session_state.get(_SESSION_KEY, 0)
+    if not left:
+        yield
+        return
+    st.session_state[_SESSION_KEY] = left - 1
+    name = getattr(page, "title", None) or str(page)
+    sampler = Sampler(threading.get_ident())
+    start = time.perf_counter()
+    try:
+        with sampler:
+            yield
+    finally:  # st.rerun()/st.stop()으로 끝난 재실행도 남깁니다.
+        _save(name, (time.perf_counter() - start) * 1000, sampler.stacks)
+
+
+# -----------------------------------------------------------------------------
+# 3. 읽기 (관리 페이지용)
+# -----------------------------------------------------------------------------
+def profiles():
+    """최근 프로파일(최근 것부터)."""
+    with _lock:
+        return list(reversed(_profiles))
@@ -0,0 +1,133 @@
+"""퀴즈 게임(덧셈·뺄셈, 곱셈·나눗셈, 다항식 챌린지)을 선언형 컴포넌트로 띄웁니다.
+
+components.html은 재실행할 때마다 20~35 KB의 HTML을 통째로 다시 보내고, 내용이 조금만
+달라져도 iframe을 새로 만들어 진행 중이던 게임이 사라집니다. 여기서는 게임 HTML을
+서버 프로세스당 한 번 해시 이름 파일로 준비해 컴포넌트 주소로 내려주므로, 브라우저는
+한 번 받은 파일을 캐시에서 쓰고 재실행 때는 인자(args)만 주고받습니다.
+
+게임은 문제를 풀 때마다 사건(정답 여부, 풀이 시간)을 쌓아 두었다가 몇 개씩, 한 판이 끝나면
+결과와 함께 Streamlit.setComponentValue()로 돌려줍니다.
+
+    value = quiz.game("plus_minus", height=560, ack=state.get("last_seq", 0))  # {"events": [...], "result": ...} 또는 None
+    new_events, result = quiz.collect("plus_minus", state, value)  # 새 사건 -> 이벤트 로그(utils.events)
+    # result: {"score": 12, "max_combo": 5, "avg_sec": 3.4, "level": "Lv.2 ...", "finished_at": ...} 또는 None
+    quiz.show_history("plus_minus", state, result)   # 세션 기록 + 결과 저장소(utils.results)
+
+게임 소스는 frontend/에 있습니다. (Tailwind 클래스를 바꿨으면 python -m utils.tailwind)
+"""
+
+import atexit
+import functools
+import hashlib
+import os
+import shutil
+import tempfile
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from utils import events, lite, minify, results, vendor
+
+FRONTEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+SHIM = "streamlit-component.js"
+GAMES = ("plus_minus", "multiplication_division", "polynomial")
+
+
+# -----------------------------------------------------------------------------
+# 1. 게임 파일 준비 (프로세스당 한 번)
+# -----------------------------------------------------------------------------
+def _write(directory, name, body):
+    filename = vendor._hashed_name(name, hashlib.sha256(body).hexdigest())
+    with open(os.path.join(directory, filename), "wb") as f:
+        f.write(body)
+    return filename
+
+
+@functools.lru_cache(maxsize=2)
+def _build(light=False):
+    """frontend/의 파일을 해시 이름으로 임시 폴더에 쓰고 (컴포넌트 이름, {게임: 파일 이름})을 돌려줍니다.
+
+    HTML 안의 "vendor:<이름>"과 통신 스크립트 주소도 이때 한 번 바꾸고 줄여 둡니다(utils.minify).
+    light=True는 웹 글꼴을 뺀 가벼운 모드(utils.lite)용입니다.
+    """
+    out = tempfile.mkdtemp(prefix="mathzip-quiz-")
+    atexit.register(shutil.rmtree, out, ignore_errors=True)
+
+    with open(os.path.join(FRONTEND, SHIM), "rb") as f:
+        shim = _write(out, SHIM, f.read())
+    files = {}
+    for game in GAMES:
+        with open(os.path.join(FRONTEND, f"{game}.html"), encoding="utf-8") as f:
+            html = f.read()
+        if light:
+            html = lite.without_fonts(html)
+        html = minify.page_html(f"{game} (lite)" if light else game, html,
+                                {f'src="{SHIM}"': f'src="{shim}"'}, from_component=True)
+        files[game] = _write(out, f"{game}.html", html.encode("utf-8"))
+    return vendor.serve("quiz_lite" if light else "quiz", out), files
+
+
+@functools.lru_cache(maxsize=None)
+def _component(game, light=False):
+    assets, files = _build(light)
+    # 주소는 상대 경로로 적어야 baseUrlPath 아래에서도 맞게 찾아갑니다.
+    return components.declare_component(f"{game}_lite" if light else game, url=f"component/{assets}/{files[game]}")
+
+
+# -----------------------------------------------------------------------------
+# 2. 페이지에서 쓰기
+# -----------------------------------------------------------------------------
+def game(name, key=None, height=560, ack=0, **args):
+    """게임을 띄우고, 아직 받았다고 알리지 않은 사건과 결과({"events", "result"})를 돌려줍니다.
+    아직 아무 일이 없으면 None. ack는 collect()가 마지막으로 받은 사건 번호(state.last_seq)입니다."""
+    return _component(name, lite.enabled())(key=key or name, default=None, height=height, ack=ack, **args)
+
+
+def collect(name, state, value):
+    """game()이 돌려준 {"events", "result"}에서 이번에 새로 온 사건만 골라 이벤트 로그(utils.events)에
+    남기고 (새 사건 목록, 끝난 판의 결과 또는 None)을 돌려줍니다.
+
+    사건 번호(seq)는 게임 화면에서 늘 커지므로 마지막으로 받은 번호 하나(state.last_seq)만 기억합니다.
+    """
+    last = state.get("last_seq", 0)
+    value = value or {}
+    new = [event for event in value.get("events", []) if event["seq"] > last]
+    if new:
+        state.last_seq = max(event["seq"] for event in new)
+    for event in new:
+        events.log(name, event["kind"], player=event.get("player", ""), level=event.get("level", ""),
+                   value=event.get("score"), correct=event.get("correct"), latency_ms=event.get("latency_ms"))
+    return new, value.get("result")
+
+
+def _table(rows, with_player=False):
+    return [{**({"이름": r.get("player") or "-"} if with_player else {}),
+             "점수": r["score"], "최고 콤보": r["max_combo"], "평균 풀이(초)": r["avg_sec"], "단계": r["level"]}
+            for r in rows]
+
+
+def show_history(name, state, result):
+    """끝난 판의 결과를 state.results와 결과 저장소(utils.results)에 모으고(같은 판은 한 번만) 표로 보여 줍니다.
+
+    반(?class=...)이 정해져 있으면 우리 반 기록을, 이름을 입력한 학생이면 내 지난 기록도 보여 줍니다.
+    """
+    if "results" not in state:
+        state.results = []
+    classroom = results.classroom()
+    if result and all(r["finished_at"] != result["finished_at"] for r in state.results):
+        state.results.append(result)
+        results.store().add(name, result, player=result.get("player", ""), classroom=classroom)
+    if not state.results and not classroom:
+        return
+
+    tables = {"이번 접속": _table(reversed(state.results))}
+    if classroom:
+        # "학생"은 다항식 챌린지에서 이름을 입력하지 않았을 때의 기본 이름입니다.
+        player = state.results[-1].get("player", "") if state.results else ""
+        if player and player != "학생":
+            tables["내 지난 기록"] = _table(results.store().player_history(classroom, player, game=name))
+        tables[f"{classroom} 반 기록"] = _table(results.store().class_history(classroom, game=name), with_player=True)
+    with st.expander(f"📋 기록 (이번 접속 {len(state.results)}판)"):
+        for tab, rows in zip(st.tabs(list(tables)), tables.values()):
+            with tab:
+                st.dataframe(rows, hide_index=True, width='stretch')
@@ -0,0 +1,68 @@
+// Streamlit 컴포넌트와 주고받는 메시지 (streamlit-component-lib의 필요한 부분만 옮긴 것)
+//
+//   Streamlit.onRender((args, first) => { ... })   // 파이썬에서 넘긴 인자를 받을 때마다
+//   Streamlit.setComponentValue({score: 10})        // 파이썬으로 결과 보내기 (재실행이 일어남)
+//
+// 게임 사건(정답/오답, 레벨업 ...)에는 늘 커지는 번호(seq)를 붙여 쌓아 두었다가 {events, result}로
+// 보냅니다. 파이썬(utils.quiz.collect)은 마지막으로 받은 번호보다 큰 사건만 새 사건으로 쓰고, 그 번호를
+// 인자 ack로 돌려줍니다. ack까지의 사건은 목록에서 지우므로 오래 해도 보내는 목록이 커지지 않습니다.
+// (값을 두 번 보내면 파이썬은 마지막 값만 받으므로, ack를 받기 전까지는 지우지 않습니다.)
+//
+//   Streamlit.newGame()                              // 판이 새로 시작될 때
+//   Streamlit.event("answer", {correct: true})       // EVENT_BATCH개가 쌓이면 보냄
+//   Streamlit.event("level_up", {...}, {now: true})  // 바로 보냄
+//   Streamlit.event("game_over", {...}, {result: r}) // 판의 결과와 함께 보냄
+//
+// 컴포넌트 iframe은 재실행해도 다시 만들어지지 않으므로 게임 상태가 그대로 유지됩니다.
+(function () {
+    const EVENT_BATCH = 5;
+    const listeners = [];
+    let args = null;
+    // iframe을 다시 띄워도 번호가 줄어들지 않도록 시각(ms)에서 시작합니다.
+    let seq = Date.now();
+    let pending = [];  // 파이썬이 아직 받았다고 알려 주지 않은 사건
+    let unsent = 0;
+
+    function send(type, data) {
+        window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data), "*");
+    }
+
+    window.addEventListener("message", function (event) {
+        const data = event.data;
+        if (!data || data.type !== "streamlit:render") return;
+        const first = args === null;
+        args = data.args || {};
+        if (args.ack) pending = pending.filter(function (e) { return e.seq > args.ack; });
+        if (first && args.height) send("streamlit:setFrameHeight", { height: args.height });
+        listeners.forEach(function (fn) { fn(args, first); });
+    });
+
+    window.Streamlit = {
+        onRender: function (fn) {
+            listeners.push(fn);
+            if (args !== null) fn(args, true);
+        },
+        setComponentValue: function (value) {
+            send("streamlit:setComponentValue", { value: value, dataType: "json" });
+        },
+        setFrameHeight: function (height) {
+            send("streamlit:setFrameHeight", { height: height });
+        },
+        newGame: function () {
+            // 지난 판의 사건 중 아직 받았다는 답이 없는 것은 그대로 두었다가 함께 보냅니다.
+            unsent = 0;
+        },
+        event: function (kind, fields, options) {
+            const opts = options || {};
+            seq = Math.max(seq + 1, Date.now());
+            pending.push(Object.assign({ seq: seq, kind: kind }, fields));
+            unsent += 1;
+            if (opts.now || opts.result !== undefined || unsent >= EVENT_BATCH) {
+                unsent = 0;
+                window.Streamlit.setComponentValue({ events: pending, result: opts.result || null });
+            }
+        },
+    };
+
+    send("streamlit:componentReady", { apiVersion: 1 });
+})();
@@ -0,0 +1,176 @@
+"""퀴즈 게임의 끝난 판 결과를 SQLite(WAL)에 모아 두고, 학생별·반별 기록을 꺼내 줍니다.
+
+덧셈·뺄셈, 곱셈·나눗셈, 다항식 챌린지의 점수는 iframe을 닫으면 사라졌습니다. 결과는
+store().add()로 넣으면 바로 돌아오고, 백그라운드 쓰기 스레드가 FLUSH_SECONDS 동안 모인
+결과를 한 트랜잭션으로 씁니다. 한 반 30명이 동시에 게임을 끝내도 쓰기 잠금은 한 번입니다.
+
+    results.store().add("polynomial", result, player="철수", classroom=results.classroom())
+    results.store().player_history("2-3", "철수", game="polynomial")
+    results.store().class_history("2-3", game="polynomial")
+
+반은 선생님이 나눠 준 링크의 ?class=2-3으로 정하고 세션 동안 기억합니다.
+파일 위치는 secrets의 [Results] path로 바꿀 수 있습니다 (기본: data/results.sqlite3).
+"""
+
+import atexit
+import contextlib
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+from streamlit.logger import get_logger
+
+logger = get_logger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(ROOT, "data", "results.sqlite3")
+POOL_SIZE = 4
+FLUSH_SECONDS = 0.2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id          INTEGER PRIMARY KEY,
+    game        TEXT    NOT NULL,
+    class       TEXT    NOT NULL DEFAULT '',
+    player      TEXT    NOT NULL DEFAULT '',
+    score       INTEGER NOT NULL,
+    max_combo   INTEGER NOT NULL,
+    avg_sec     REAL    NOT NULL,
+    level       TEXT    NOT NULL,
+    finished_at INTEGER NOT NULL  -- 브라우저 시각(ms)
+);
+-- 재실행으로 같은 판이 두 번 들어와도 한 번만 남깁니다.
+CREATE UNIQUE INDEX IF NOT EXISTS results_once ON results (game, class, player, finished_at);
+CREATE INDEX IF NOT EXISTS results_by_player ON results (class, player, finished_at);
+CREATE INDEX IF NOT EXISTS results_by_class ON results (class, game, finished_at);
+"""
+
+INSERT = """
+INSERT OR IGNORE INTO results (game, class, player, score, max_combo, avg_sec, level, finished_at)
+VALUES (:game, :class, :player, :score, :max_combo, :avg_sec, :level, :finished_at)
+"""
+
+COLUMNS = "game, class, player, score, max_combo, avg_sec, level, finished_at"
+
+
+# -----------------------------------------------------------------------------
+# 1. 저장소
+# -----------------------------------------------------------------------------
+class ResultStore:
+    """읽기 연결 풀 + 쓰기 스레드 하나. 어느 스크립트 스레드에서 불러도 됩니다."""
+
+    def __init__(self, path=DEFAULT_PATH, pool_size=POOL_SIZE, flush_seconds=FLUSH_SECONDS):
+        self.path = path
+        self.flush_seconds = flush_seconds
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with contextlib.closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+        self._pool = queue.Queue()
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        self._pending = queue.Queue()
+        self.stats = {"written": 0, "batches": 0, "failed": 0}
+        threading.Thread(target=self._write_loop, name="results-writer", daemon=True).start()
+        atexit.register(self.flush)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # WAL에서는 NORMAL이어도 전원이 나가지 않는 한 커밋이 사라지지 않습니다.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # 1-1. 쓰기
+    def add(self, game, result, player="", classroom=""):
+        """끝난 판 하나를 쓰기 대기열에 넣습니다. 바로 돌아옵니다."""
+        self._pending.put({
+            "game": game, "class": classroom or "", "player": player or "",
+            "score": int(result["score"]), "max_combo": int(result["max_combo"]),
+            "avg_sec": float(result["avg_sec"]), "level": str(result["level"]),
+            "finished_at": int(result["finished_at"]),
+        })
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self.flush_seconds
+            while (left := deadline - time.monotonic()) > 0:
+                try:
+                    batch.append(self._pending.get(timeout=left))
+                except queue.Empty:
+                    break
+            try:
+                with conn:
+                    conn.executemany(INSERT, batch)
+                self.stats["written"] += len(batch)
+                self.stats["batches"] += 1
+            except sqlite3.Error:
+                self.stats["failed"] += len(batch)
+                logger.exception("results: 결과 %d개를 쓰지 못했습니다.", len(batch))
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+    def flush(self, timeout=5):
+        """대기열이 빌 때까지(최대 timeout초) 기다립니다. 끝나면 True."""
+        deadline = time.monotonic() + timeout
+        while self._pending.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    # 1-2. 읽기
+    @contextlib.contextmanager
+    def _read(self):
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def _query(self, where, params, limit):
+        sql = f"SELECT {COLUMNS} FROM results WHERE {where} ORDER BY finished_at DESC LIMIT ?"
+        with self._read() as conn:
+            return [dict(row) for row in conn.execute(sql, (*params, limit))]
+
+    def player_history(self, classroom, player, game=None, limit=50):
+        """한 학생의 최근 결과 (최신순)."""
+        if game is None:
+            return self._query("class = ? AND player = ?", (classroom, player), limit)
+        return self._query("class = ? AND player = ? AND game = ?", (classroom, player, game), limit)
+
+    def class_history(self, classroom, game=None, limit=200):
+        """한 반의 최근 결과 (최신순)."""
+        if game is None:
+            return self._query("class = ?", (classroom,), limit)
+        return self._query("class = ? AND game = ?", (classroom, game), limit)
+
+
+# -----------------------------------------------------------------------------
+# 2. 페이지에서 쓰기
+# -----------------------------------------------------------------------------
+def _path():
+    try:
+        return st.secrets["Results"]["path"]
+    except Exception:  # secrets.toml이 없거나 [Results]가 없으면 기본 위치
+        return DEFAULT_PATH
+
+
+@st.cache_resource(show_spinner=False)
+def store():
+    """모든 세션이 함께 쓰는 ResultStore."""
+    return ResultStore(_path())
+
+
+def classroom():
+    """링크의 ?class=...로 정한 반. 처음 본 값을 세션 동안 기억합니다. 없으면 ""."""
+    if "class" in st.query_params:
+        st.session_state["_class"] = st.query_params["class"].strip()[:20]
+    return st.session_state.get("_class", "")
@@ -0,0 +1,99 @@
+"""세션마다 따로 된, 씨앗(seed)으로 다시 만들 수 있는 난수.
+
+페이지들이 전역 random 모듈을 쓰면 프로세스 안의 모든 세션이 한 난수 상태를 나눠 쓰므로,
+어떤 판이 어떻게 나왔는지 다시 만들 수 없습니다. 여기서는 세션마다 씨앗 하나를
+st.session_state에 두고, 페이지(이름)마다 그 씨앗에서 만든 numpy.random.Generator를 씁니다.
+페이지마다 흐름이 따로라서, 다른 페이지를 먼저 열어도 같은 씨앗이면 같은 판이 나옵니다.
+
+    r = rng.stream("pig")
+    roll = r.roll()                      # 주사위 하나 (미리 ROLL_BATCH개씩 뽑아 둡니다)
+    state.pool = r.shuffled(number_pool)  # 섞은 새 목록
+    rolls = r.dice(10_000)               # 한 번에 여러 개 (numpy 배열)
+
+주소에 ?seed=1234를 붙이면 그 씨앗으로 정해 같은 판을 다시 볼 수 있습니다. 지금 세션의
+씨앗은 seed()로 얻습니다(app.py가 왼쪽 메뉴에 보여 줍니다).
+"""
+
+import secrets
+import zlib
+
+import streamlit as st
+
+from utils import prewarm
+
+QUERY_PARAM = "seed"
+# roll()이 한 번에 미리 뽑아 두는 주사위 수
+ROLL_BATCH = 256
+
+_SEED_KEY = "_rng_seed"
+_STREAMS_KEY = "_rng_streams"
+
+
+class Stream:
+    """씨앗과 이름으로 정해지는 난수 흐름 하나 (numpy.random.Generator를 감쌉니다).
+
+    돌려주는 값은 세션 상태나 이벤트 로그에 그대로 넣을 수 있도록 파이썬 int/list입니다.
+    배열이 필요한 대량 뽑기(dice, integers(size=...))만 numpy 배열을 돌려줍니다.
+    """
+
+    def __init__(self, seed, name):
+        np = prewarm.module("numpy")
+        self.seed = seed
+        self.name = name
+        # 이름을 씨앗에 섞어 페이지마다 독립된 흐름을 만듭니다.
+        self.generator = np.random.default_rng([seed, zlib.crc32(name.encode("utf-8"))])
+        self._rolls = {}  # 면 수 -> 아직 쓰지 않은 주사위 (뒤에서부터 꺼냄)
+
+    def integers(self, low, high, size=None):
+        """low 이상 high 이하의 정수. size를 주면 numpy 배열."""
+        values = self.generator.integers(low, high, size=size, endpoint=True)
+        return int(values) if size is None else values
+
+    def dice(self, n, sides=6):
+        """주사위 n개를 한 번에 (numpy 배열, 1..sides)."""
+        return self.generator.integers(1, sides, size=n, endpoint=True)
+
+    def roll(self, sides=6):
+        """주사위 하나. ROLL_BATCH개씩 미리 뽑아 두고 하나씩 꺼냅니다."""
+        buffer = self._rolls.get(sides)
+        if not buffer:
+            buffer = self._rolls[sides] = self.dice(ROLL_BATCH, sides).tolist()[::-1]
+        return buffer.pop()
+
+    def choice(self, population, size=None):
+        """population에서 하나(size를 주면 size개 목록, 중복 허용)."""
+        if size is None:
+            return population[int(self.generator.integers(len(population)))]
+        return [population[i] for i in self.generator.integers(len(population), size=size).tolist()]
+
+    def sample(self, population, k):
+        """population에서 중복 없이 k개 (random.sample과 같은 뜻)."""
+        return [population[i] for i in self.generator.choice(len(population), size=k, replace=False).tolist()]
+
+    def shuffled(self, pool):
+        """pool을 섞은 새 목록 (random.shuffle과 달리 원본은 그대로)."""
+        return [pool[i] for i in self.generator.permutation(len(pool)).tolist()]
+
+
+# -----------------------------------------------------------------------------
+# 세션의 씨앗과 흐름
+# -----------------------------------------------------------------------------
+def seed():
+    """이 세션의 씨앗. 주소에 ?seed=...가 있으면 그 값으로 바꾸고 흐름을 처음부터 다시 만듭니다."""
+    ss = st.session_state
+    given = st.query_params.get(QUERY_PARAM)
+    if given is not None and given.isdigit() and int(given) != ss.get(_SEED_KEY):
+        ss[_SEED_KEY] = int(given)
+        ss.pop(_STREAMS_KEY, None)
+    if _SEED_KEY not in ss:
+        ss[_SEED_KEY] = secrets.randbits(32)
+    return ss[_SEED_KEY]
+
+
+def stream(name):
+    """이 세션에서 name(보통 페이지 이름)이 쓰는 난수 흐름."""
+    current = seed()
+    streams = st.session_state.setdefault(_STREAMS_KEY, {})
+    if name not in streams:
+        streams[name] = Stream(current, name)
+    return streams[name]
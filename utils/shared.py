@@ -0,0 +1,247 @@
+"""여러 서버 프로세스(워커)가 함께 보는 상태 저장소.
+
+`python -m utils.workers`로 Streamlit 프로세스를 여러 개 띄우면 세션마다 다른 프로세스에
+붙으므로, 세션끼리 나누는 상태(알림 대기열, 워커별 운영 지표, 이후의 방·순위표 등)는
+프로세스 메모리가 아니라 여기에 둡니다. 값은 JSON으로 저장합니다.
+
+    store = shared.store()
+    store.set("workers:1234", {"rss_kb": 123456}, ttl=15)
+    store.scan("workers:")            # {"workers:1234": {...}, ...}
+    store.push("notify:...", ["chat", "철수님이 레벨업했습니다!"])
+    store.take("notify:...")          # 쌓인 항목을 모두 꺼내고 비웁니다
+    store.claim("notify:...:flush", ttl=60)   # 이 시간 동안 한 프로세스만 True
+
+저장소는 MATHZIP_SHARED 환경 변수나 secrets의 [Shared] url로 고릅니다.
+
+    memory://                       프로세스 하나 (기본, 지금까지와 같음)
+    sqlite:///data/shared.sqlite3   한 컴퓨터의 워커 여러 개 (따로 띄울 서버가 없음, utils.workers의 기본)
+    redis://localhost:6379/0        컴퓨터 여러 대 (redis 패키지 필요)
+"""
+
+import contextlib
+import functools
+import json
+import os
+import sqlite3
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_URL = "memory://"
+
+
+# -----------------------------------------------------------------------------
+# 1. 프로세스 하나 (기본)
+# -----------------------------------------------------------------------------
+class MemoryStore:
+    """dict 하나. 워커가 하나일 때는 이것으로 충분합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}   # 키 -> (JSON, 만료 시각 또는 None)
+        self._lists = {}    # 키 -> [JSON, ...]
+
+    def _live(self, key, now):
+        item = self._values.get(key)
+        if item is not None and item[1] is not None and item[1] <= now:
+            del self._values[key]
+            return None
+        return item
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._live(key, time.time())
+        return default if item is None else json.loads(item[0])
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._values[key] = (json.dumps(value), None if ttl is None else time.time() + ttl)
+
+    def delete(self, key):
+        with self._lock:
+            self._values.pop(key, None)
+            self._lists.pop(key, None)
+
+    def claim(self, key, ttl):
+        now = time.time()
+        with self._lock:
+            if self._live(key, now) is not None:
+                return False
+            self._values[key] = ("true", now + ttl)
+            return True
+
+    def scan(self, prefix):
+        now = time.time()
+        with self._lock:
+            return {key: json.loads(item[0]) for key in sorted(self._values)
+                    if key.startswith(prefix) and (item := self._live(key, now)) is not None}
+
+    def push(self, key, item):
+        with self._lock:
+            self._lists.setdefault(key, []).append(json.dumps(item))
+
+    def take(self, key):
+        with self._lock:
+            return [json.loads(item) for item in self._lists.pop(key, [])]
+
+
+# -----------------------------------------------------------------------------
+# 2. 한 컴퓨터의 여러 워커: SQLite 파일 하나 (WAL)
+# -----------------------------------------------------------------------------
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    key     TEXT PRIMARY KEY,
+    value   TEXT NOT NULL,
+    expires REAL             -- time.time() 기준, NULL이면 지우기 전까지
+);
+CREATE TABLE IF NOT EXISTS lists (
+    id    INTEGER PRIMARY KEY,
+    key   TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS lists_by_key ON lists (key, id);
+"""
+
+
+class SQLiteStore:
+    """파일 하나를 여러 프로세스가 함께 씁니다. 연결은 스레드마다 하나."""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        with contextlib.closing(sqlite3.connect(path, timeout=5)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SQLITE_SCHEMA)
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: 트랜잭션은 아래에서 BEGIN IMMEDIATE로 직접 엽니다.
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def get(self, key, default=None):
+        row = self._conn.execute("SELECT value FROM kv WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                                 (key, time.time())).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set(self, key, value, ttl=None):
+        self._conn.execute("INSERT OR REPLACE INTO kv (key, value, expires) VALUES (?, ?, ?)",
+                           (key, json.dumps(value), None if ttl is None else time.time() + ttl))
+
+    def delete(self, key):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+            conn.execute("DELETE FROM lists WHERE key = ?", (key,))
+
+    def claim(self, key, ttl):
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM kv WHERE key = ? AND expires <= ?", (key, now))
+            return conn.execute("INSERT OR IGNORE INTO kv (key, value, expires) VALUES (?, 'true', ?)",
+                                (key, now + ttl)).rowcount == 1
+
+    def scan(self, prefix):
+        now = time.time()
+        with self._transaction() as conn:
+            # 만료된 값은 여기서 정리합니다 (워커 지표처럼 주기적으로 읽히는 접두사가 있습니다).
+            conn.execute("DELETE FROM kv WHERE expires <= ?", (now,))
+            rows = conn.execute("SELECT key, value FROM kv WHERE key >= ? AND key < ? ORDER BY key",
+                                (prefix, prefix + "\U0010ffff")).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def push(self, key, item):
+        self._conn.execute("INSERT INTO lists (key, value) VALUES (?, ?)", (key, json.dumps(item)))
+
+    def take(self, key):
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT value FROM lists WHERE key = ? ORDER BY id", (key,)).fetchall()
+            conn.execute("DELETE FROM lists WHERE key = ?", (key,))
+        return [json.loads(value) for value, in rows]
+
+
+# -----------------------------------------------------------------------------
+# 3. 여러 컴퓨터: Redis
+# -----------------------------------------------------------------------------
+class RedisStore:
+    """redis-py로 같은 동작을 합니다. 키에는 PREFIX를 붙입니다."""
+
+    PREFIX = "mathzip:"
+
+    def __init__(self, url):
+        import redis  # pip install redis (이 저장소를 쓸 때만 필요)
+        self._redis = redis.Redis.from_url(url)
+
+    def get(self, key, default=None):
+        value = self._redis.get(self.PREFIX + key)
+        return default if value is None else json.loads(value)
+
+    def set(self, key, value, ttl=None):
+        self._redis.set(self.PREFIX + key, json.dumps(value), px=None if ttl is None else int(ttl * 1000))
+
+    def delete(self, key):
+        self._redis.delete(self.PREFIX + key)
+
+    def claim(self, key, ttl):
+        return bool(self._redis.set(self.PREFIX + key, "true", nx=True, px=int(ttl * 1000)))
+
+    def scan(self, prefix):
+        keys = sorted(self._redis.scan_iter(match=self.PREFIX + prefix + "*"))
+        values = self._redis.mget(keys) if keys else []
+        return {key.decode()[len(self.PREFIX):]: json.loads(value)
+                for key, value in zip(keys, values) if value is not None}
+
+    def push(self, key, item):
+        self._redis.rpush(self.PREFIX + key, json.dumps(item))
+
+    def take(self, key):
+        pipe = self._redis.pipeline()
+        pipe.lrange(self.PREFIX + key, 0, -1)
+        pipe.delete(self.PREFIX + key)
+        items, _ = pipe.execute()
+        return [json.loads(item) for item in items]
+
+
+# -----------------------------------------------------------------------------
+# 4. 저장소 고르기
+# -----------------------------------------------------------------------------
+def open_store(url):
+    """url에 맞는 저장소를 만듭니다. sqlite:///상대경로는 저장소 루트 기준입니다."""
+    if url.startswith("memory:"):
+        return MemoryStore()
+    if url.startswith("sqlite:///"):
+        return SQLiteStore(os.path.join(ROOT, url[len("sqlite:///"):]))
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStore(url)
+    raise ValueError(f"알 수 없는 공유 저장소 주소입니다: {url}")
+
+
+def url():
+    """MATHZIP_SHARED 환경 변수 > secrets의 [Shared] url > memory://"""
+    if os.environ.get("MATHZIP_SHARED"):
+        return os.environ["MATHZIP_SHARED"]
+    try:
+        import streamlit as st
+        return st.secrets["Shared"]["url"]
+    except Exception:  # secrets.toml이 없거나 [Shared]가 없으면 프로세스 하나
+        return DEFAULT_URL
+
+
+@functools.lru_cache(maxsize=None)
+def store():
+    """이 프로세스의 공유 저장소 (백그라운드 스레드에서도 부를 수 있습니다)."""
+    return open_store(url())
@@ -0,0 +1,147 @@
+"""페이지별로 이름공간을 나눈 세션 상태.
+
+여러 페이지가 st.session_state의 같은 키(draw_count, drawn_history, game_over ...)를
+쓰면서 한 페이지의 상태가 다른 페이지로 새어 나가고, 한 번 들른 페이지의 상태가
+세션 내내 메모리에 남습니다. page_state()는 페이지마다 따로 된 저장 공간을 돌려주고,
+오래 쓰지 않은 페이지의 상태는 지우거나(keep을 준 경우) 작은 스냅샷으로 줄입니다.
+
+    from utils.state import page_state
+    state = page_state("streams")
+    if "pool" not in state:
+        state.pool = [...]
+    state.draw_count += 1
+
+위젯의 key로 쓰는 값(예: 체크박스 key="joker_base")은 Streamlit이 직접 관리하므로
+지금처럼 st.session_state에 둡니다.
+"""
+
+import pickle
+import sys
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# 이 시간(초) 동안 열지 않은 페이지의 상태는 정리합니다. page_state(idle_seconds=...)로 페이지마다 바꿀 수 있습니다.
+IDLE_SECONDS = 30 * 60
+
+_REGISTRY_KEY = "_page_state"
+
+
+class PageState(dict):
+    """속성처럼 쓸 수 있는 dict. state.draw_count와 state["draw_count"]는 같습니다."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def _registry():
+    """이름공간 -> {"data", "last", "idle", "keep", "compacted", "page"} (세션마다 하나)"""
+    if _REGISTRY_KEY not in st.session_state:
+        st.session_state[_REGISTRY_KEY] = {}
+    return st.session_state[_REGISTRY_KEY]
+
+
+# -----------------------------------------------------------------------------
+# 1. 페이지 상태 얻기
+# -----------------------------------------------------------------------------
+def page_state(namespace, idle_seconds=IDLE_SECONDS, keep=()):
+    """이 페이지의 상태 저장 공간을 돌려줍니다.
+
+    idle_seconds: 이 시간 동안 페이지를 열지 않으면 상태를 정리합니다.
+    keep: 정리할 때 지우지 않고 남겨 둘 키. 비어 있으면 전부 지웁니다.
+          (다시 열었을 때 나머지 값은 페이지의 초기화 코드가 채웁니다.)
+    """
+    registry = _registry()
+    entry = registry.get(namespace)
+    if entry is None:
+        entry = registry[namespace] = {"data": PageState(), "compacted": False}
+    # 스냅샷만 남았던 페이지도 다시 열리면 초기화 코드가 나머지를 채우므로 온전한 상태로 봅니다.
+    entry.update(last=time.monotonic(), idle=idle_seconds, keep=tuple(keep), compacted=False, page=_current_page())
+    return entry["data"]
+
+
+def _current_page():
+    ctx = get_script_run_ctx()
+    return None if ctx is None else ctx.page_script_hash
+
+
+def touch():
+    """지금 페이지의 이름공간들을 방금 쓴 것으로 표시합니다.
+
+    fragment만 다시 실행될 때는 page_state()가 불리지 않으므로 metrics.fragment가 대신 부릅니다.
+    (교실 방을 따라 보는 학생처럼 fragment로만 30분 넘게 쓰는 페이지가 정리되지 않도록)
+    """
+    page = _current_page()
+    if page is None:
+        return
+    now = time.monotonic()
+    for entry in _registry().values():
+        if entry.get("page") == page:
+            entry["last"] = now
+
+
+# -----------------------------------------------------------------------------
+# 2. 오래 쓰지 않은 페이지 정리 (app.py가 매 실행마다 호출)
+# -----------------------------------------------------------------------------
+def evict_idle(now=None):
+    """idle 시간을 넘긴 페이지 상태를 지우거나 keep 키만 남긴 스냅샷으로 줄입니다.
+
+    정리한 이름공간 목록을 돌려줍니다.
+    """
+    if now is None:
+        now = time.monotonic()
+    registry = _registry()
+    evicted = []
+    for namespace, entry in list(registry.items()):
+        if now - entry["last"] <= entry["idle"]:
+            continue
+        if entry["keep"] and not entry["compacted"]:
+            data = entry["data"]
+            entry["data"] = PageState({k: data[k] for k in entry["keep"] if k in data})
+            entry["compacted"] = True
+        elif not entry["keep"]:
+            del registry[namespace]
+        else:
+            continue  # 이미 스냅샷만 남은 상태
+        evicted.append(namespace)
+    return evicted
+
+
+# -----------------------------------------------------------------------------
+# 3. 크기 보고
+# -----------------------------------------------------------------------------
+def _size(obj):
+    """직렬화했을 때의 바이트 수로 크기를 어림합니다."""
+    try:
+        return len(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(obj)
+
+
+def report():
+    """이 세션의 페이지별 상태 크기(바이트)와 마지막 사용 후 지난 시간(초)."""
+    now = time.monotonic()
+    pages = {
+        namespace: {
+            "bytes": _size(entry["data"]),
+            "idle_s": round(now - entry["last"], 1),
+            "compacted": entry["compacted"],
+        }
+        for namespace, entry in _registry().items()
+    }
+    return {"pages": pages, "total_bytes": sum(p["bytes"] for p in pages.values())}
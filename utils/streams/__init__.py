@@ -0,0 +1,13 @@
+"""스트림스(보드게임/Streams.py)에서 함께 쓰는 계산 모음.
+
+    from utils.streams import scoring
+    scoring.score(["3", "7", "⭐", "12", ...])   # 게임판 하나 (20칸)
+    scoring.score_batch(boards)                  # 반 전체 (판 수 x 20칸, numpy)
+
+  - scoring: 게임판 점수(오르는 흐름의 길이 -> 점수표)와 반 전체 한 번에 채점·순위
+  - solver: 뽑힌 순서로 만들 수 있는 최고의 판과 미리 모르고 놓는 비례 배치
+  - tiles: 타일 묶음 (정확한 값과 화면 글자, 섞은 묶음, 직접 만든 묶음)
+  - strategies: 여러 판을 한꺼번에 두는 배치 전략 (비례 배치, 가까운 이웃 옆, 몬테카를로)
+  - tournament: 전략 대결 (프로세스 풀, python -m utils.streams.tournament)
+  - room: 교실 방 (선생님이 뽑고 학생 기기들이 같은 순서를 따라 봄)
+"""
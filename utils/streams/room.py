@@ -0,0 +1,160 @@
+"""스트림스 교실 방: 선생님이 뽑고, 학생 기기들은 같은 순서를 따라 봅니다.
+
+선생님 세션이 방을 만들면 섞은 타일 묶음(pool)을 방에 넣고, 뽑을 때마다 방을 고쳐 씁니다.
+학생 세션은 방 코드로 들어가 st.fragment(run_every=POLL_SECONDS)로 version 키 하나만
+읽습니다. 값이 그대로면 아무것도 하지 않고(세션에 둔 마지막 화면을 다시 그림), 바뀌었을 때만
+방을 읽습니다. 학생 쪽에서 섞거나 다시 계산하는 것은 없습니다.
+
+방은 공유 저장소(utils.shared)에 있어서 워커 프로세스가 여럿이어도 같은 방을 봅니다.
+
+    streams-room:{code}           {"tile_set", "joker", "latex", "low", "high", "pool", "drawn", "version", "owner"}
+    streams-room:{code}:version   "방 id:번호". 번호는 뽑거나 다시 시작할 때마다 1씩 늘어납니다.
+                                  (닫은 방의 코드를 새 방이 받아도 version은 겹치지 않습니다.)
+
+    pool = tile_set.shuffled(rng.stream("streams"))   # utils.streams.tiles
+    code, owner = room.create(tile_set, pool)        # 선생님 (owner는 선생님 세션에만 둡니다)
+    room.draw(code, owner)                           # 뽑은 타일의 글자
+    room.version(code)                              # 학생: 폴링마다 이것만
+    room.view(code, version)                        # 학생: version이 바뀌었을 때만
+"""
+
+import collections
+import fractions
+import functools
+import secrets
+import threading
+
+from utils import shared
+from utils.streams import scoring
+
+# 학생 기기가 방을 확인하는 간격(초). 40대가 2초마다 읽어도 1초에 키 20번 읽기입니다.
+POLL_SECONDS = 2
+# 마지막으로 뽑은 뒤 이 시간이 지나면 방이 사라집니다.
+TTL_SECONDS = 3 * 60 * 60
+CODE_LENGTH = 4
+# 칠판에 적고 읽기 쉽도록 헷갈리는 글자(0/O, 1/I/L, 2/Z, 5/S, 8/B)는 뺍니다.
+CODE_ALPHABET = "ACDEFGHJKMNPQRTUVWXY34679"
+
+PREFIX = "streams-room:"
+
+# 프로세스 전체의 방 통계 (관리 페이지 › 운영 지표)
+_stats = collections.Counter()
+_stats_lock = threading.Lock()
+
+
+def _count(key, n=1):
+    with _stats_lock:
+        _stats[key] += n
+
+
+def stats():
+    """created(만든 방), draws(뽑기), polls(학생 폴링), loads(방을 실제로 읽은 횟수) 수."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def normalize(code):
+    """학생이 적은 코드를 방 코드 꼴로 (공백 제거, 대문자)."""
+    return "".join(code.split()).upper()
+
+
+# -----------------------------------------------------------------------------
+# 1. 선생님
+# -----------------------------------------------------------------------------
+def _save(code, room):
+    store = shared.store()
+    # 방을 먼저 쓰고 version을 나중에 씁니다. 새 version을 본 학생은 항상 새 방을 읽습니다.
+    store.set(PREFIX + code, room, ttl=TTL_SECONDS)
+    store.set(PREFIX + code + ":version", f"{room['id']}:{room['version']}", ttl=TTL_SECONDS)
+    store.set(PREFIX + code + ":claim", True, ttl=TTL_SECONDS)  # 방이 살아 있는 동안 코드도 붙잡아 둡니다.
+
+
+def _pair(value):
+    return [value.numerator, value.denominator]
+
+
+def bounds(view):
+    """view의 가장 작은/큰 값 (Fraction 두 개)."""
+    return fractions.Fraction(*view["low"]), fractions.Fraction(*view["high"])
+
+
+def _owned(code, owner):
+    room = shared.store().get(PREFIX + code)
+    if room is None or not secrets.compare_digest(room["owner"], owner):
+        raise KeyError(code)
+    return room
+
+
+def create(tile_set, pool):
+    """tile_set(tiles.TileSet)을 섞은 pool(tiles.Pool)로 새 방을 열고 (코드, 주인 토큰)을 돌려줍니다.
+
+    방에는 남은 타일의 글자만 넣습니다. 학생 화면에 필요한 묶음 정보(이름, ⭐, LaTeX 여부,
+    가장 작은/큰 값의 [분자, 분모])도 함께 넣어, 학생 쪽에서는 묶음을 다시 만들지 않습니다.
+    한 판을 할 수 없는 묶음(tile_set.validate())이면 ValueError.
+    """
+    tile_set.validate()
+    store = shared.store()
+    while True:
+        code = "".join(secrets.choice(CODE_ALPHABET) for _ in range(CODE_LENGTH))
+        # 같은 코드가 살아 있는 동안에는 다른 세션이 그 코드를 받지 못합니다.
+        if store.claim(PREFIX + code + ":claim", TTL_SECONDS):
+            break
+    owner = secrets.token_hex(16)
+    _save(code, {"id": secrets.token_hex(4), "tile_set": tile_set.name, "joker": tile_set.joker, "latex": tile_set.latex,
+                 "low": _pair(tile_set.low), "high": _pair(tile_set.high), "pool": pool.labels(), "drawn": [],
+                 "version": 0, "owner": owner})
+    _count("created")
+    return code, owner
+
+
+def draw(code, owner):
+    """다음 타일을 뽑아 돌려줍니다. 다 뽑았으면 None. 방이 없거나 주인이 아니면 KeyError."""
+    room = _owned(code, owner)
+    if len(room["drawn"]) >= scoring.SLOTS or not room["pool"]:
+        return None
+    tile = room["pool"].pop()
+    room["drawn"].append(tile)
+    room["version"] += 1
+    _save(code, room)
+    _count("draws")
+    return tile
+
+
+def restart(code, owner, pool):
+    """같은 방(같은 코드)에서 같은 묶음을 새로 섞은 pool(tiles.Pool)로 처음부터 다시 합니다."""
+    room = _owned(code, owner)
+    room.update(pool=pool.labels(), drawn=[], version=room["version"] + 1)
+    _save(code, room)
+
+
+def close(code, owner):
+    _owned(code, owner)
+    store = shared.store()
+    for key in (PREFIX + code, PREFIX + code + ":version", PREFIX + code + ":claim"):
+        store.delete(key)
+
+
+# -----------------------------------------------------------------------------
+# 2. 학생
+# -----------------------------------------------------------------------------
+def version(code):
+    """방의 version. 방이 없으면(닫혔거나 만료) None. 폴링마다 부르는 유일한 읽기입니다."""
+    _count("polls")
+    return shared.store().get(PREFIX + code + ":version")
+
+
+@functools.lru_cache(maxsize=64)
+def view(code, version):
+    """학생 화면에 필요한 것만 담은 방 {"tile_set", "joker", "latex", "low", "high", "drawn"}. 없으면 None.
+
+    (code, version)마다 프로세스에서 한 번만 읽으므로, 같은 워커의 학생 40명이 새 타일을
+    보더라도 저장소에서 방을 읽는 것은 한 번입니다.
+    """
+    _count("loads")
+    room = shared.store().get(PREFIX + code)
+    if room is None:
+        return None
+    # low/high는 [분자, 분모]입니다 (bounds(view)로 Fraction).
+    view = {key: room[key] for key in ("tile_set", "joker", "latex", "low", "high")}
+    view["drawn"] = tuple(room["drawn"])
+    return view
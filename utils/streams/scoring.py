@@ -0,0 +1,194 @@
+"""스트림스 게임판 채점.
+
+게임판은 SLOTS(20)칸입니다. 왼쪽부터 값이 같거나 커지는(줄지 않는) 칸들이 한 흐름이 되고,
+흐름마다 길이를 점수표(SCORES)로 바꿔 더한 것이 점수입니다. ⭐(조커)는 어떤 수로도 쓸 수
+있어 앞이나 뒤 흐름에 붙고, 빈칸은 흐름을 끊고 0점입니다.
+
+칸에는 세 가지 타일을 모두 쓸 수 있습니다.
+
+    기본   7, 21            정수   -4, 0, 15
+    유리수 1/2, -5/3, 2.7, \\frac{4}{3} (게임 화면의 LaTeX 그대로도 됩니다)
+    조커   ⭐ 또는 *          빈칸   "" 또는 None
+
+    scoring.score(board)           # 판 하나: 가장 좋게 나눈 흐름의 점수 (동적 계획법)
+    scoring.score_batch(boards)    # 판 여러 개: numpy 배열 연산으로 한 번에 (판 수,) 배열
+    scoring.score_arrays(values, joker, empty)  # 이미 배열로 된 판들 (전략 대결 등)
+    scoring.rank(scores)           # 등수 (같은 점수는 같은 등수)
+
+점수표는 흐름이 길수록 더 많이 오르므로(볼록), 조커 묶음은 한쪽 흐름에 통째로 붙이는 것이
+언제나 가장 좋습니다. score_batch는 이 성질로 판들을 칸마다 한 번씩만 훑어 score와 같은 점수를
+냅니다(조커 수와 상관없이).
+"""
+
+import fractions
+import functools
+import math
+import re
+
+import numpy as np
+
+SLOTS = 20
+# 흐름 길이 -> 점수 (스트림스 공식 점수표, 0번은 자리 맞춤)
+SCORES = (0, 0, 1, 3, 5, 7, 9, 11, 15, 20, 25, 30, 35, 40, 50, 60, 70, 85, 100, 150, 300)
+
+JOKER = "⭐"
+EMPTY = None
+_JOKERS = ("⭐", "*", "★", "☆")
+_FRAC = re.compile(r"^([+-]?)\\[dt]?frac\{([+-]?\d+)\}\{(\d+)\}$")
+
+_SCORES = np.array(SCORES, dtype=np.int64)
+
+
+# -----------------------------------------------------------------------------
+# 1. 칸 읽기
+# -----------------------------------------------------------------------------
+def tile_value(cell):
+    """칸 하나를 정확한 값(fractions.Fraction), JOKER, EMPTY 중 하나로 바꿉니다.
+
+    읽을 수 없는 칸이면 ValueError.
+    """
+    if cell is None:
+        return EMPTY
+    if isinstance(cell, bool):
+        raise ValueError(f"숫자 타일이 아닙니다: {cell!r}")
+    if isinstance(cell, (int, np.integer)):
+        return fractions.Fraction(int(cell))
+    if isinstance(cell, (float, np.floating)):
+        # CSV에서 숫자로 읽힌 칸. 2.7이 2.70000000000000017...이 되지 않도록 글자로 바꿔 읽습니다.
+        return EMPTY if math.isnan(cell) else fractions.Fraction(repr(float(cell)))
+    if isinstance(cell, fractions.Fraction):
+        return cell
+    return _text_value(str(cell))
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_value(cell):
+    # 반 전체 판에는 같은 글자가 수십 번씩 나오므로 읽은 결과를 기억해 둡니다.
+    text = cell.strip().strip("$").replace(" ", "").replace("−", "-")
+    if not text:
+        return EMPTY
+    if text in _JOKERS:
+        return JOKER
+    match = _FRAC.match(text)
+    if match:
+        sign, numerator, denominator = match.groups()
+        text = f"{sign}{numerator}/{denominator}"
+    try:
+        return fractions.Fraction(text.replace("+-", "-").replace("--", ""))
+    except (ValueError, ZeroDivisionError):
+        raise ValueError(f"숫자 타일이 아닙니다: {cell!r}") from None
+
+
+def parse_board(cells):
+    """칸 목록을 tile_value 목록으로. SLOTS칸보다 짧으면 뒤를 빈칸으로 채웁니다."""
+    board = [tile_value(cell) for cell in cells]
+    if len(board) > SLOTS:
+        raise ValueError(f"게임판은 {SLOTS}칸입니다 ({len(board)}칸을 받았습니다).")
+    return board + [EMPTY] * (SLOTS - len(board))
+
+
+# -----------------------------------------------------------------------------
+# 2. 판 하나 (동적 계획법)
+# -----------------------------------------------------------------------------
+def runs(board):
+    """점수가 가장 높게 나눈 흐름들 [(시작 칸, 길이), ...]. 빈칸은 빼고 돌려줍니다.
+
+    best[j]는 앞의 j칸으로 얻는 최고 점수입니다. [i, j) 칸에 빈칸이 없고 조커를 뺀 값이
+    줄지 않으면 한 흐름이 될 수 있습니다.
+    """
+    board = parse_board(board)
+    best = [0] + [-1] * SLOTS
+    cut = [0] * (SLOTS + 1)
+    for j in range(1, SLOTS + 1):
+        if board[j - 1] is EMPTY:
+            best[j], cut[j] = best[j - 1], j - 1
+            continue
+        # 오른쪽 끝(j-1)에서 왼쪽으로 넓히며, 지금까지 본 값 중 가장 작은 값보다 큰 값이 나오면 멈춥니다.
+        low = None
+        for i in range(j - 1, -1, -1):
+            value = board[i]
+            if value is EMPTY:
+                break
+            if value is not JOKER:
+                if low is not None and value > low:
+                    break
+                low = value
+            if best[i] + SCORES[j - i] > best[j]:
+                best[j], cut[j] = best[i] + SCORES[j - i], i
+
+    found, j = [], SLOTS
+    while j > 0:
+        i = cut[j]
+        if board[j - 1] is not EMPTY:
+            found.append((i, j - i))
+        j = i
+    return found[::-1]
+
+
+def score(board):
+    """게임판 하나의 점수."""
+    return sum(SCORES[length] for _, length in runs(board))
+
+
+# -----------------------------------------------------------------------------
+# 3. 판 여러 개 (numpy)
+# -----------------------------------------------------------------------------
+def _arrays(boards):
+    """판 목록을 (값, 조커, 빈칸) 배열 세 개로. 값 배열의 조커·빈칸 자리는 NaN입니다."""
+    parsed = [parse_board(board) for board in boards]
+    n = len(parsed)
+    values = np.full((n, SLOTS), np.nan)
+    joker = np.zeros((n, SLOTS), dtype=bool)
+    empty = np.zeros((n, SLOTS), dtype=bool)
+    for r, board in enumerate(parsed):
+        for c, value in enumerate(board):
+            if value is JOKER:
+                joker[r, c] = True
+            elif value is EMPTY:
+                empty[r, c] = True
+            else:
+                values[r, c] = value
+    return values, joker, empty
+
+
+def score_batch(boards):
+    """판 여러 개(판 수 x 칸, 목록/배열/DataFrame)의 점수를 numpy 정수 배열로."""
+    if hasattr(boards, "to_numpy"):
+        boards = boards.to_numpy(dtype=object)
+    return score_arrays(*_arrays(list(boards)))
+
+
+def score_arrays(values, joker, empty):
+    """이미 배열로 된 판들(값, 조커, 빈칸; 판 수 x 칸)의 점수. 조커·빈칸 자리의 값은 무엇이든 됩니다.
+
+    흐름은 숫자가 줄어드는 곳에서만 끊으면 되고, 그 사이의 조커 묶음은 (점수표가 볼록하므로)
+    통째로 앞 흐름(A)이나 뒤 흐름(B)에 붙입니다. 마지막으로 끊은 곳에서 어느 쪽을 골랐는지만
+    기억하면 되므로, 칸을 한 번 훑으며 두 경우의 (끝난 흐름 점수, 지금 흐름 길이)만 들고 갑니다.
+    """
+    n, width = values.shape
+    done_a, done_b = np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64)
+    run_a, run_b = np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64)
+    pending = np.zeros(n, dtype=np.int64)  # 마지막 숫자 뒤의 조커 수
+    last = np.full(n, np.nan)              # 지금 흐름의 마지막 숫자 (없으면 NaN)
+    for c in range(width):
+        x, hole = values[:, c], empty[:, c]
+        number = ~joker[:, c] & ~hole
+        drop = number & (x < last)
+        grow = number & ~drop
+        # 조커를 앞 흐름에 붙여 닫은 점수 (빈칸이나 줄어드는 숫자에서 씁니다)
+        closed = np.maximum(done_a + _SCORES[run_a + pending], done_b + _SCORES[run_b + pending])
+        # 줄어드는 숫자에서 조커를 뒤 흐름에 붙이면 새 흐름이 조커 수 + 1칸
+        opened = np.maximum(done_a + _SCORES[run_a], done_b + _SCORES[run_b])
+        done_a = np.where(hole | drop, closed, done_a)
+        done_b = np.where(hole, closed, np.where(drop, opened, done_b))
+        run_a = np.where(hole, 0, np.where(drop, 1, np.where(grow, run_a + pending + 1, run_a)))
+        run_b = np.where(hole, 0, np.where(drop, pending + 1, np.where(grow, run_b + pending + 1, run_b)))
+        last = np.where(hole, np.nan, np.where(number, x, last))
+        pending = np.where(number | hole, 0, pending + 1)
+    return np.maximum(done_a + _SCORES[run_a + pending], done_b + _SCORES[run_b + pending])
+
+
+def rank(scores):
+    """점수 배열의 등수 (1등부터, 같은 점수는 같은 등수)."""
+    scores = np.asarray(scores)
+    return (scores[None, :] > scores[:, None]).sum(axis=1) + 1
@@ -0,0 +1,49 @@
+"""뽑힌 순서로 만들 수 있는 가장 좋은 게임판과, 미리 모르고 놓는 기준 전략.
+
+게임이 끝나면 뽑힌 타일과 순서를 모두 알고 있습니다. 타일은 뽑힐 때마다 빈칸 아무 데나 놓을
+수 있으므로, 어떤 배치든 순서대로 놓아 만들 수 있습니다. 그래서 "순서를 미리 알았다면"의
+최고점은 탐색할 필요 없이 정렬한 판입니다(⭐는 끝에 붙입니다). 학생에게는 이것보다
+"미리 모르고 규칙대로 놓았다면 몇 점이었을까"가 더 쓸모 있어서, 그 기준 전략(비례 배치)도
+같은 순서로 돌려 봅니다.
+
+    score, board = solver.best_board(drawn)                    # 순서를 미리 알았다면
+    score, board = solver.proportional_board(drawn, low, high)  # 미리 모르고 비례 배치로
+
+비례 배치는 전략 대결과 같은 strategies.proportional을 판 하나로 돌립니다.
+"""
+
+import numpy as np
+
+from utils.streams import scoring, strategies
+
+
+# -----------------------------------------------------------------------------
+# 1. 순서를 미리 알았다면
+# -----------------------------------------------------------------------------
+def best_board(drawn, slots=scoring.SLOTS):
+    """(점수, 게임판). 게임판은 뽑힌 타일(글자 그대로)을 칸 순서대로 놓은 목록, 빈칸은 None."""
+    values = [scoring.tile_value(tile) for tile in drawn]
+    numbers = sorted((value, tile) for value, tile in zip(values, drawn) if value is not scoring.JOKER)
+    jokers = [tile for value, tile in zip(values, drawn) if value is scoring.JOKER]
+    board = [tile for _, tile in numbers] + jokers
+    board += [None] * (slots - len(board))
+    return scoring.score(board), board
+
+
+# -----------------------------------------------------------------------------
+# 2. 미리 모르고 (비례 배치, utils.streams.strategies)
+# -----------------------------------------------------------------------------
+def proportional_board(drawn, low, high, slots=scoring.SLOTS):
+    """뽑힌 순서대로 비례 배치로 놓은 (점수, 게임판). low/high는 타일 묶음의 가장 작은/큰 값."""
+    game = strategies.Game([float(low), float(high)], np.empty((1, 0)), None, track=False)
+    boards = strategies.Boards(1, slots)
+    board = [None] * slots
+    for step, tile in enumerate(drawn[:slots]):
+        value = scoring.tile_value(tile)
+        is_joker = np.array([value is scoring.JOKER])
+        number = np.array([np.nan if is_joker[0] else float(value)])
+        game.step = step
+        slot = int(strategies.proportional(boards, number, is_joker, game)[0])
+        boards.put(np.array([slot]), number, is_joker)
+        board[slot] = tile
+    return scoring.score(board), board
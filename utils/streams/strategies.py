@@ -0,0 +1,213 @@
+"""스트림스 배치 전략 (여러 판을 numpy 배열로 한꺼번에).
+
+판 N개를 Boards 하나로 들고, 타일이 하나 뽑힐 때마다 전략이 판마다 놓을 칸을 고릅니다.
+전략은 (boards, value, is_joker, game) -> 칸 번호 배열(N,) 함수입니다. value는 판마다
+뽑힌 값(N,)이고 ⭐인 판은 is_joker가 True입니다. game은 타일 묶음의 범위(low, high)와
+판마다 남은 타일(remaining), 난수(rng)를 가진 Game입니다.
+
+  - proportional(비례 배치): 흐름을 깨지 않는 빈칸 묶음(왼쪽 값 <= v <= 오른쪽 값)에서
+    양옆 값 사이의 비율만큼 떨어진 칸. 그런 자리가 없으면 남은 빈칸을 모두 ⭐로 본 점수가
+    가장 높은 칸에 버립니다. ⭐는 가장 긴 빈칸 묶음의 가운데.
+  - nearest(가까운 이웃 옆): 같은 빈칸 묶음에서 값이 더 가까운 이웃 쪽 끝 칸 (틈을 줄입니다).
+  - montecarlo(몬테카를로): 빈칸마다 남은 타일로 ROLLOUTS번 끝까지 비례 배치로 두어 보고
+    평균 점수가 가장 높은 칸.
+
+    game = strategies.Game(pool_values, draws, rng)   # draws: (N, 뽑는 수) 값, ⭐는 NaN
+    scores = strategies.play(strategies.proportional, game)
+"""
+
+import numpy as np
+
+from utils.streams import scoring
+
+# 몬테카를로 전략이 칸 하나를 따져 볼 때 끝까지 두어 보는 횟수
+ROLLOUTS = 8
+
+
+class Boards:
+    """판 N개. values는 놓인 숫자(빈칸과 ⭐ 자리는 NaN)."""
+
+    def __init__(self, n, slots=scoring.SLOTS):
+        self.values = np.full((n, slots), np.nan)
+        self.joker = np.zeros((n, slots), dtype=bool)
+        self.filled = np.zeros((n, slots), dtype=bool)
+
+    def put(self, slots, value, is_joker):
+        rows = np.arange(len(slots))
+        self.values[rows, slots] = np.where(is_joker, np.nan, value)
+        self.joker[rows, slots] = is_joker
+        self.filled[rows, slots] = True
+
+    def repeat(self, times):
+        """판마다 times번씩 복사한 새 Boards (판 0이 times개, 판 1이 times개, ...)."""
+        copy = Boards.__new__(Boards)
+        copy.values = np.repeat(self.values, times, axis=0)
+        copy.joker = np.repeat(self.joker, times, axis=0)
+        copy.filled = np.repeat(self.filled, times, axis=0)
+        return copy
+
+    def score(self):
+        return scoring.score_arrays(self.values, self.joker, ~self.filled)
+
+
+class Game:
+    """같은 타일 묶음으로 하는 N판. pool은 묶음의 값(⭐는 NaN), draws는 판마다 뽑힌 값 (N, T)."""
+
+    def __init__(self, pool, draws, rng, track=True):
+        self.pool = np.asarray(pool, dtype=float)
+        self.low, self.high = np.nanmin(self.pool), np.nanmax(self.pool)
+        self.draws = np.asarray(draws, dtype=float)
+        self.rng = rng
+        self.step = 0
+        # 판마다 아직 뽑히지 않은 타일 (묶음의 자리 기준). 같은 값이 여러 개면 앞자리부터 지웁니다.
+        # 끝까지 두어 보기만 하는 판(track=False)은 세지 않습니다.
+        self.remaining = np.ones((len(self.draws), len(self.pool)), dtype=bool) if track else None
+
+    def _take(self, value, is_joker):
+        same = np.where(is_joker[:, None], np.isnan(self.pool)[None, :], self.pool[None, :] == value[:, None])
+        same &= self.remaining
+        first = np.argmax(same, axis=1)
+        self.remaining[np.arange(len(first)), first] = False
+
+
+def play(strategy, game, boards=None):
+    """game.draws를 차례로 strategy로 놓고 점수 배열(N,)을 돌려줍니다."""
+    if boards is None:
+        boards = Boards(len(game.draws))
+    for step in range(game.draws.shape[1]):
+        game.step = step
+        value = game.draws[:, step]
+        is_joker = np.isnan(value)
+        boards.put(strategy(boards, value, is_joker, game), value, is_joker)
+        if game.remaining is not None:
+            game._take(value, is_joker)
+    return boards.score()
+
+
+# -----------------------------------------------------------------------------
+# 1. 빈칸 묶음과 양옆 값
+# -----------------------------------------------------------------------------
+def _before(mask):
+    """각 칸의 앞쪽에서 가장 가까운 표시된 칸 번호 (자기 자신 제외). 없으면 -1."""
+    n, width = mask.shape
+    nearest = np.maximum.accumulate(np.where(mask, np.arange(width), -1), axis=1)
+    return np.concatenate([np.full((n, 1), -1), nearest[:, :-1]], axis=1)
+
+
+def _after(mask):
+    """각 칸의 뒤쪽에서 가장 가까운 표시된 칸 번호 (자기 자신 제외). 없으면 칸 수."""
+    n, width = mask.shape
+    nearest = np.minimum.accumulate(np.where(mask, np.arange(width), width)[:, ::-1], axis=1)[:, ::-1]
+    return np.concatenate([nearest[:, 1:], np.full((n, 1), width)], axis=1)
+
+
+def _gaps(boards, low, high):
+    """빈칸마다 (묶음 첫 칸, 끝 칸, 왼쪽 숫자, 오른쪽 숫자). 숫자가 없으면 low/high. ⭐는 건너뜁니다."""
+    n, width = boards.filled.shape
+    first = _before(boards.filled) + 1
+    last = _after(boards.filled) - 1
+    numbers = boards.filled & ~boards.joker
+    left, right = _before(numbers), _after(numbers)
+    rows = np.arange(n)[:, None]
+    left_value = np.where(left >= 0, boards.values[rows, np.clip(left, 0, width - 1)], low)
+    right_value = np.where(right < width, boards.values[rows, np.clip(right, 0, width - 1)], high)
+    return first, last, left_value, right_value
+
+
+def _choose(boards, value, is_joker, game, within):
+    """빈칸 묶음 안에서 칸을 고르는 within(first, last, left, right, value)을 쓰는 전략의 뼈대."""
+    n, width = boards.filled.shape
+    rows = np.arange(n)
+    empty = ~boards.filled
+    first, last, left, right = _gaps(boards, game.low, game.high)
+
+    # 흐름을 깨지 않는 첫 빈칸 묶음
+    v = value[:, None]
+    fits = empty & (left <= v) & (v <= right)
+    slot = np.argmax(fits, axis=1)
+    f, l, lo, hi = first[rows, slot], last[rows, slot], left[rows, slot], right[rows, slot]
+    chosen = within(f, l, lo, hi, value)
+
+    # 맞는 자리가 없으면 남은 빈칸을 모두 ⭐로 봤을 때 점수가 가장 높은 칸에 버립니다.
+    stuck = ~fits.any(axis=1) & ~is_joker
+    if stuck.any():
+        chosen[stuck] = _dump(boards, np.flatnonzero(stuck), value[stuck])
+    # ⭐는 가장 긴 빈칸 묶음의 가운데
+    length = np.where(empty, last - first + 1, 0)
+    longest = np.argmax(length, axis=1)
+    middle = (first[rows, longest] + last[rows, longest]) // 2
+    return np.where(is_joker, middle, chosen)
+
+
+def _dump(boards, rows, value):
+    """rows 판마다 value를 빈칸 각각에 놓아 보고, 남은 빈칸을 ⭐로 본 점수가 가장 높은 칸."""
+    width = boards.filled.shape[1]
+    slots = np.tile(np.arange(width), len(rows))
+    values = np.repeat(boards.values[rows], width, axis=0)
+    wild = np.repeat(boards.joker[rows] | ~boards.filled[rows], width, axis=0)
+    lines = np.arange(len(slots))
+    values[lines, slots] = np.repeat(value, width)
+    wild[lines, slots] = False
+    potential = scoring.score_arrays(values, wild, np.zeros_like(wild)).reshape(len(rows), width)
+    return np.argmax(np.where(boards.filled[rows], -1, potential), axis=1)
+
+
+# -----------------------------------------------------------------------------
+# 2. 전략
+# -----------------------------------------------------------------------------
+def _proportional_within(first, last, left, right, value):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratio = np.nan_to_num(np.where(right > left, (value - left) / (right - left), 0.5))
+    return first + np.minimum(last - first, (ratio * (last - first + 1)).astype(int))
+
+
+def _nearest_within(first, last, left, right, value):
+    return np.where(value - left <= right - value, first, last)
+
+
+def proportional(boards, value, is_joker, game):
+    return _choose(boards, value, is_joker, game, _proportional_within)
+
+
+def nearest(boards, value, is_joker, game):
+    return _choose(boards, value, is_joker, game, _nearest_within)
+
+
+def montecarlo(boards, value, is_joker, game, rollouts=None):
+    rollouts = rollouts or ROLLOUTS
+    n, width = boards.filled.shape
+    left = game.draws.shape[1] - game.step - 1  # 이 타일 다음에 더 뽑을 수
+    empty = ~boards.filled
+    if left == 0 or game.remaining is None:
+        return proportional(boards, value, is_joker, game)
+
+    # 따져 볼 칸: 흐름을 깨지 않는 빈칸들. 그런 칸이 없거나 ⭐이면 모든 빈칸.
+    first, last, low, high = _gaps(boards, game.low, game.high)
+    fits = empty & (low <= value[:, None]) & (value[:, None] <= high)
+    candidates = np.where((fits.any(axis=1) & ~is_joker)[:, None], fits, empty)
+    owner, slot = np.nonzero(candidates)
+
+    # 후보 하나마다 rollouts판을 복사해 이번 타일을 놓고, 남은 타일을 무작위 순서로 끝까지 둡니다.
+    trial = Boards.__new__(Boards)
+    trial.values, trial.joker, trial.filled = (np.repeat(a[owner], rollouts, axis=0)
+                                               for a in (boards.values, boards.joker, boards.filled))
+    lines = np.repeat(owner, rollouts)
+    trial.put(np.repeat(slot, rollouts), value[lines], is_joker[lines])
+    remaining = game.remaining[lines]
+    same = np.where(is_joker[lines, None], np.isnan(game.pool)[None, :], game.pool[None, :] == value[lines, None])
+    remaining[np.arange(len(lines)), np.argmax(same & remaining, axis=1)] = False
+    # 같은 판의 후보들은 같은 미래(같은 난수)로 비교해야 차이가 잡음에 묻히지 않습니다.
+    noise = game.rng.random((n, rollouts, len(game.pool)))[owner].reshape(len(lines), -1)
+    future = game.pool[np.argsort(np.where(remaining, noise, np.inf), axis=1)[:, :left]]
+    scores = play(proportional, Game(game.pool, future, game.rng, track=False), trial)
+
+    mean = np.full((n, width), -np.inf)
+    mean[owner, slot] = scores.reshape(-1, rollouts).mean(axis=1)
+    return np.argmax(mean, axis=1)
+
+
+STRATEGIES = {
+    "proportional": ("비례 배치", proportional),
+    "nearest": ("가까운 이웃 옆", nearest),
+    "montecarlo": ("몬테카를로", montecarlo),
+}
@@ -0,0 +1,236 @@
+"""스트림스 타일 묶음 (기본, 정수, 유리수, 직접 만든 묶음).
+
+게임 페이지(보드게임/Streams.py), 교실 방(utils.streams.room), 전략 대결(utils.streams.tournament)이
+같은 묶음을 씁니다. 타일마다 정확한 값(fractions.Fraction)과 화면에 쓰는 글자(label)를 함께
+두므로, "\\frac{5}{3}" 같은 유리수 타일도 비교하고 정렬할 수 있습니다.
+
+묶음은 서로 다른 타일의 표(tiles)와, 실제 타일마다 표의 몇 번째인지 적은 작은 정수 배열(slots)로
+되어 있습니다. 섞은 묶음(Pool)은 그 배열을 섞은 것과 남은 개수 하나라서, 뽑기는 O(1)입니다.
+
+    tile_set = tiles.TILE_SETS["유리수"].with_joker(True)
+    pool = tile_set.shuffled(rng.stream("streams"))
+    tile = pool.draw()                 # Tile(value=Fraction(5, 3), label="\\frac{5}{3}")
+    tile_set.low, tile_set.high        # 가장 작은/큰 값 (Fraction)
+
+    custom = tiles.generate(-3, 0, max_denominator=10, style="소수")   # 직접 만든 묶음
+    custom.validate()                  # 타일이 SLOTS(20)개보다 적으면 ValueError
+"""
+
+import collections
+import decimal
+import fractions
+
+import numpy as np
+
+from utils.streams import scoring
+
+JOKER = scoring.JOKER
+
+# value는 Fraction 또는 scoring.JOKER, label은 화면에 쓰는 글자 (유리수는 LaTeX)
+Tile = collections.namedtuple("Tile", "value label")
+
+# 직접 만든 묶음의 한계. 서로 다른 타일 수와 한 타일의 개수.
+MAX_KINDS = 400
+MAX_COPIES = 20
+# 라벨 모양: 정수는 그대로, 나머지는 분수(LaTeX) 또는 소수
+STYLES = ("분수", "소수")
+SIGNS = {"모두": None, "음수만": -1, "양수만": 1}
+
+
+def label(value, style="분수"):
+    """값을 타일 글자로. 정수는 "7", 분수는 "-\\frac{5}{3}", 소수는 "-2.5"."""
+    if value.denominator == 1:
+        return str(value.numerator)
+    if style == "소수":
+        return str(decimal.Decimal(value.numerator) / decimal.Decimal(value.denominator))
+    sign = "-" if value < 0 else ""
+    return f"{sign}\\frac{{{abs(value.numerator)}}}{{{value.denominator}}}"
+
+
+def is_decimal(value):
+    """끝나는 소수로 쓸 수 있는지 (분모의 소인수가 2와 5뿐)."""
+    denominator = value.denominator
+    for prime in (2, 5):
+        while denominator % prime == 0:
+            denominator //= prime
+    return denominator == 1
+
+
+def read(cell):
+    """칸(숫자나 글자)을 Tile로. 숫자면 글자는 label(), 글자면 그대로 둡니다. 읽을 수 없으면 ValueError."""
+    value = scoring.tile_value(cell)
+    if value is scoring.EMPTY:
+        raise ValueError("빈 타일은 넣을 수 없습니다.")
+    if value is JOKER:
+        return Tile(JOKER, JOKER)
+    text = cell.strip().strip("$") if isinstance(cell, str) else label(value)
+    return Tile(value, text)
+
+
+# -----------------------------------------------------------------------------
+# 1. 묶음과 섞은 묶음
+# -----------------------------------------------------------------------------
+class TileSet:
+    """타일 묶음. tiles는 서로 다른 타일, slots는 실제 타일마다 tiles의 번호 (정의한 순서)."""
+
+    def __init__(self, name, cells):
+        self.name = name
+        index = {}
+        tiles, slots = [], []
+        for cell in cells:
+            tile = cell if isinstance(cell, Tile) else read(cell)
+            if tile.label not in index:
+                index[tile.label] = len(tiles)
+                tiles.append(tile)
+            slots.append(index[tile.label])
+        self.tiles = tuple(tiles)
+        self.slots = np.array(slots, dtype=np.int16)
+        numbers = [tile.value for tile in self.tiles if tile.value is not JOKER]
+        self.low = min(numbers) if numbers else None
+        self.high = max(numbers) if numbers else None
+
+    @classmethod
+    def from_counts(cls, name, counts):
+        """[(칸, 개수), ...]로 만듭니다. 같은 값의 타일은 값 순서로 이어 붙입니다."""
+        rows = [(read(cell), int(count)) for cell, count in counts]
+        for tile, count in rows:
+            if not 0 <= count <= MAX_COPIES:
+                raise ValueError(f"'{tile.label}' 타일의 개수는 0개부터 {MAX_COPIES}개까지 적을 수 있습니다.")
+        rows.sort(key=lambda row: (row[0].value is JOKER, 0 if row[0].value is JOKER else row[0].value))
+        return cls(name, [tile for tile, count in rows for _ in range(count)])
+
+    def __len__(self):
+        return len(self.slots)
+
+    @property
+    def joker(self):
+        return any(tile.value is JOKER for tile in self.tiles)
+
+    @property
+    def latex(self):
+        """분수 타일이 있어 st.latex로 보여야 하는지."""
+        return any("\\frac" in tile.label for tile in self.tiles)
+
+    def with_joker(self, joker=True):
+        """⭐ 한 장을 끝에 더한 묶음 (joker가 False면 자기 자신)."""
+        if not joker:
+            return self
+        return TileSet(self.name, [self.tiles[i] for i in self.slots.tolist()] + [Tile(JOKER, JOKER)])
+
+    def counts(self):
+        """[(Tile, 개수), ...] 값 순서 (⭐는 끝). 표와 방(room)에 저장할 때 씁니다."""
+        numbers = np.bincount(self.slots, minlength=len(self.tiles)).tolist()
+        rows = list(zip(self.tiles, numbers))
+        return sorted(rows, key=lambda row: (row[0].value is JOKER, 0 if row[0].value is JOKER else row[0].value))
+
+    def values(self):
+        """실제 타일마다 값 (float 배열, ⭐는 NaN). 전략 대결이 numpy로 둘 때 씁니다."""
+        table = np.array([np.nan if tile.value is JOKER else float(tile.value) for tile in self.tiles])
+        return table[self.slots]
+
+    def describe(self):
+        """"타일 24개 · 서로 다른 타일 12가지 · -3 ~ -1/10" 같은 한 줄 요약."""
+        kinds = sum(tile.value is not JOKER for tile in self.tiles)
+        text = f"타일 {len(self)}개 · 서로 다른 타일 {kinds}가지"
+        if self.low is not None:
+            text += f" · {self.low} ~ {self.high}"
+        return text + (" · ⭐ 포함" if self.joker else "")
+
+    def validate(self, min_size=scoring.SLOTS):
+        """게임 한 판(min_size장 뽑기)을 할 수 있는 묶음인지 확인합니다. 아니면 ValueError."""
+        if len(self) < min_size:
+            raise ValueError(f"타일이 {len(self)}개뿐입니다. 한 판에 {min_size}개를 뽑으므로 {min_size}개 이상이어야 합니다.")
+        if len(self.tiles) > MAX_KINDS:
+            raise ValueError(f"서로 다른 타일이 {len(self.tiles)}가지입니다. {MAX_KINDS}가지 이하로 줄이세요.")
+        # 비례 배치(solver, strategies)는 가장 작은 값과 가장 큰 값 사이의 비율로 칸을 고릅니다.
+        if self.low is None or self.low == self.high:
+            raise ValueError("서로 다른 값의 숫자 타일이 2가지 이상 있어야 합니다 (⭐만으로는 게임을 할 수 없습니다).")
+        return self
+
+    def shuffled(self, stream):
+        """stream(utils.rng.Stream)으로 섞은 Pool."""
+        return Pool(self, self.slots[stream.generator.permutation(len(self))])
+
+
+class Pool:
+    """섞은 묶음. order의 뒤에서부터 뽑고, 남은 개수(left)만 줄입니다."""
+
+    def __init__(self, tile_set, order):
+        self.tile_set = tile_set
+        self.order = order
+        self.left = len(order)
+
+    def __len__(self):
+        return self.left
+
+    def draw(self):
+        """다음 타일 (Tile). 다 뽑았으면 None."""
+        if not self.left:
+            return None
+        self.left -= 1
+        return self.tile_set.tiles[self.order[self.left]]
+
+    def labels(self):
+        """남은 타일의 글자 목록 (다음에 뽑을 것이 끝). 교실 방에 넣을 때 씁니다."""
+        return [self.tile_set.tiles[i].label for i in self.order[:self.left].tolist()]
+
+
+# -----------------------------------------------------------------------------
+# 2. 기본 묶음 (게임 페이지의 세 탭)
+# -----------------------------------------------------------------------------
+def _rational_cells():
+    cells = []
+    for i in range(1, 7):
+        cells.append(f"\\frac{{{i}}}{{2}}")
+        cells.append(f"-\\frac{{{i}}}{{2}}")
+    cells.extend(["2.7", "-2.7"])
+    cells.extend(["\\frac{5}{3}", "-\\frac{5}{3}", "\\frac{4}{3}", "-\\frac{4}{3}", "\\frac{2}{3}", "-\\frac{2}{3}",
+                  "\\frac{1}{3}", "-\\frac{1}{3}", "0", "\\frac{1}{2}", "\\frac{3}{2}", "\\frac{5}{2}",
+                  "-\\frac{1}{2}", "-\\frac{3}{2}", "-\\frac{5}{2}"])
+    return cells
+
+
+# 1 ~ 10 (각 1개), 11 ~ 20 (각 2개), 21 ~ 30 (각 1개)
+BASE = TileSet("기본", list(range(1, 11)) + list(range(11, 21)) + list(range(11, 21)) + list(range(21, 31)))
+# -15 ~ -5 (각 1개), -4 ~ 4 (각 2개), 5 ~ 15 (각 1개)
+INTEGER = TileSet("정수", list(range(-15, -4)) + [n for n in range(-4, 5) for _ in range(2)] + list(range(5, 16)))
+# 절댓값이 0, 1/3 ~ 3인 유리수와 ±2.7 (게임 화면의 LaTeX 글자 그대로)
+RATIONAL = TileSet("유리수", _rational_cells())
+
+TILE_SETS = {"기본": BASE, "정수": INTEGER, "유리수": RATIONAL}
+
+
+# -----------------------------------------------------------------------------
+# 3. 직접 만든 묶음
+# -----------------------------------------------------------------------------
+def generate(low, high, max_denominator=1, sign="모두", style="분수", copies=1):
+    """low ~ high 사이에서 분모가 max_denominator 이하인 값을 모두 copies개씩 넣은 묶음.
+
+    sign은 SIGNS의 이름("음수만"이면 0보다 작은 값만), style이 "소수"면 끝나는 소수로 쓸 수
+    있는 값만 소수 글자로 넣습니다. 예: generate(-3, 0, 10, "음수만") = 음의 분수만.
+    """
+    low, high = scoring.tile_value(low), scoring.tile_value(high)
+    if not isinstance(low, fractions.Fraction) or not isinstance(high, fractions.Fraction):
+        raise ValueError("범위는 숫자로 적으세요.")
+    if low > high:
+        low, high = high, low
+    if not 1 <= max_denominator <= 100:
+        raise ValueError("분모는 1부터 100까지 고를 수 있습니다.")
+    if not 1 <= copies <= MAX_COPIES:
+        raise ValueError(f"같은 타일은 1개부터 {MAX_COPIES}개까지 넣을 수 있습니다.")
+    # 분모마다 범위 안의 분자를 훑습니다. 기약분수로 줄여 같은 값은 한 번만 넣습니다.
+    values = set()
+    for denominator in range(1, max_denominator + 1):
+        first = -((-low.numerator * denominator) // low.denominator)   # ceil(low * 분모)
+        last = (high.numerator * denominator) // high.denominator      # floor(high * 분모)
+        if last - first + 1 > MAX_KINDS * 4:
+            raise ValueError("범위가 너무 넓습니다. 범위나 분모를 줄이세요.")
+        values.update(fractions.Fraction(n, denominator) for n in range(first, last + 1))
+    wanted = SIGNS[sign]
+    if wanted is not None:
+        values = {value for value in values if value * wanted > 0}
+    if style == "소수":
+        values = {value for value in values if is_decimal(value)}
+    if len(values) > MAX_KINDS:
+        raise ValueError(f"서로 다른 값이 {len(values)}가지입니다. {MAX_KINDS}가지 이하가 되도록 범위나 분모를 줄이세요.")
+    return TileSet.from_counts("직접 만든 묶음", [(label(value, style), copies) for value in sorted(values)])
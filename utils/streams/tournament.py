@@ -0,0 +1,169 @@
+"""스트림스 전략 대결: 같은 무작위 순서로 배치 전략들을 겨루게 합니다.
+
+게임 페이지와 같은 타일 묶음(utils.streams.tiles)에서 판마다 20장을 무작위로 뽑고, 모든 전략이
+같은 순서로 둡니다. 판 수를 CHUNK씩 나눠 프로세스 풀(코어마다 하나)에 맡기고, 각 워커는
+CHUNK판을 numpy 배열 하나로 한꺼번에 두고 채점합니다(utils.streams.strategies, scoring).
+결과는 전략별 점수 분포, 승률(같은 판에서 가장 높은 점수, 비기면 나눔), 초당 판 수입니다.
+
+    python -m utils.streams.tournament --games 1000000 --workers 4
+    python -m utils.streams.tournament --tile-set 유리수 --joker --workers 1 2 4   # 코어 수에 따른 판/초
+    python -m utils.streams.tournament --strategies proportional montecarlo --games 500
+
+몬테카를로 전략은 칸마다 남은 판을 끝까지 두어 보므로 코어 하나에 1초에 몇 판 정도입니다.
+수백만 판은 비례 배치, 가까운 이웃 옆 같은 규칙 전략으로 돌립니다.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import functools
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+
+from utils.streams import scoring, strategies, tiles
+
+# 작업 하나가 두는 판 수. 배열이 CPU 캐시에 들어가는 크기가 빠릅니다(500판이 5000판보다 1.5배).
+# 몬테카를로는 판마다 후보 칸 x 시도 수만큼 불어나므로 더 작게 나눕니다.
+CHUNK = 500
+MONTECARLO_CHUNK = 20
+
+Result = collections.namedtuple("Result", "tile_set joker games workers seconds scores cpu_seconds")
+
+
+def pool_values(tile_set, joker=False):
+    """타일 묶음의 값 배열 (⭐는 NaN)."""
+    return tiles.TILE_SETS[tile_set].with_joker(joker).values()
+
+
+# -----------------------------------------------------------------------------
+# 1. 작업 하나 (워커 프로세스에서)
+# -----------------------------------------------------------------------------
+def _play_chunk(tile_set, joker, names, games, seed, index, rollouts):
+    """games판의 순서를 뽑고 전략마다 둡니다. {전략: (점수 배열, 걸린 초)}."""
+    pool = pool_values(tile_set, joker)
+    rng = np.random.default_rng([seed, index])
+    draws = rng.permuted(np.tile(pool, (games, 1)), axis=1)[:, :scoring.SLOTS]
+    out = {}
+    for name in names:
+        strategy = strategies.STRATEGIES[name][1]
+        if strategy is strategies.montecarlo:
+            strategy = functools.partial(strategies.montecarlo, rollouts=rollouts)
+        start = time.perf_counter()
+        scores = strategies.play(strategy, strategies.Game(pool, draws, rng))
+        out[name] = (scores.astype(np.int16), time.perf_counter() - start)
+    return out
+
+
+# -----------------------------------------------------------------------------
+# 2. 대결
+# -----------------------------------------------------------------------------
+def run(tile_set="기본", games=10_000, names=tuple(strategies.STRATEGIES), workers=1, seed=0,
+        joker=False, rollouts=strategies.ROLLOUTS, progress=None):
+    """대결을 돌려 Result를 돌려줍니다. progress(끝난 비율)는 작업이 끝날 때마다 부릅니다.
+
+    workers가 2 이상이면 spawn 프로세스 풀을 씁니다. Streamlit 서버의 스레드들을 fork로
+    복사하지 않도록, 워커는 이 모듈만 새로 불러옵니다.
+    """
+    chunk = MONTECARLO_CHUNK if "montecarlo" in names else CHUNK
+    tasks = [(tile_set, joker, tuple(names), min(chunk, games - start), seed, index, rollouts)
+             for index, start in enumerate(range(0, games, chunk))]
+    done = {}
+    start = time.perf_counter()
+    if workers <= 1:
+        for index, task in enumerate(tasks):
+            done[index] = _play_chunk(*task)
+            if progress:
+                progress(len(done) / len(tasks))
+    else:
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(workers, mp_context=context) as executor:
+            futures = {executor.submit(_play_chunk, *task): index for index, task in enumerate(tasks)}
+            for future in concurrent.futures.as_completed(futures):
+                done[futures[future]] = future.result()
+                if progress:
+                    progress(len(done) / len(tasks))
+    seconds = time.perf_counter() - start
+
+    scores = {name: np.concatenate([done[i][name][0] for i in range(len(tasks))]) for name in names}
+    cpu = {name: sum(done[i][name][1] for i in range(len(tasks))) for name in names}
+    return Result(tile_set, joker, games, workers, seconds, scores, cpu)
+
+
+def win_rates(result):
+    """전략별 승률. 같은 판에서 가장 높은 점수가 이기고, 비기면 이긴 전략끼리 나눕니다."""
+    names = list(result.scores)
+    table = np.stack([result.scores[name] for name in names])
+    winners = table == table.max(axis=0)
+    share = winners / winners.sum(axis=0)
+    return dict(zip(names, share.sum(axis=1) / table.shape[1]))
+
+
+def summary(result):
+    """전략별 요약 행 목록 (관리 페이지 표와 명령줄 출력)."""
+    wins = win_rates(result)
+    rows = []
+    for name, scores in result.scores.items():
+        p10, p50, p90 = np.percentile(scores, [10, 50, 90])
+        rows.append({
+            "strategy": name,
+            "label": strategies.STRATEGIES[name][0],
+            "mean": round(float(scores.mean()), 2),
+            "std": round(float(scores.std()), 2),
+            "p10": float(p10), "median": float(p50), "p90": float(p90),
+            "max": int(scores.max()),
+            "win_rate": round(float(wins[name]), 4),
+            # 코어 하나가 1초에 두는 판 수 (프로세스를 띄우는 시간은 빼고)
+            "games_per_cpu_second": round(len(scores) / max(result.cpu_seconds[name], 1e-9), 1),
+        })
+    return rows
+
+
+def histogram(scores):
+    """점수별 판 수 (0 ~ 300점)."""
+    return np.bincount(scores.astype(np.int64), minlength=scoring.SCORES[-1] + 1)
+
+
+# -----------------------------------------------------------------------------
+# 3. 명령줄
+# -----------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tile-set", default="기본", choices=list(tiles.TILE_SETS))
+    parser.add_argument("--joker", action="store_true", help="⭐ 카드를 넣습니다")
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--strategies", nargs="+", default=["proportional", "nearest"], choices=list(strategies.STRATEGIES))
+    parser.add_argument("--workers", type=int, nargs="+", default=[os.cpu_count() or 1], help="비교할 프로세스 수들")
+    parser.add_argument("--rollouts", type=int, default=strategies.ROLLOUTS, help="몬테카를로가 칸마다 두어 보는 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    report = {"tile_set": args.tile_set, "joker": args.joker, "games": args.games,
+              "cpu_count": os.cpu_count(), "runs": []}
+    for workers in args.workers:
+        result = run(args.tile_set, args.games, args.strategies, workers, args.seed, args.joker, args.rollouts)
+        rate = result.games / result.seconds
+        base = report["runs"][0]["games_per_second"] if report["runs"] else rate
+        report["runs"].append({"workers": workers, "seconds": round(result.seconds, 2),
+                               "games_per_second": round(rate, 1), "speedup": round(rate / base, 2),
+                               "strategies": summary(result)})
+        print(f"프로세스 {workers:2d}: {rate:10.1f} 판/초 (x{rate / base:.2f}), {result.seconds:.1f}초", file=sys.stderr)
+    for row in report["runs"][-1]["strategies"]:
+        print(f"  {row['label']:10s} 평균 {row['mean']:6.2f} (표준편차 {row['std']:5.2f}) | "
+              f"승률 {row['win_rate']:6.1%} | 코어당 {row['games_per_cpu_second']:9.1f} 판/초", file=sys.stderr)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""퀴즈 페이지들이 실제로 쓰는 Tailwind 클래스만 담은 CSS를 미리 만들어 둡니다.
+
+덧셈·뺄셈, 곱셈·나눗셈, 다항식 챌린지, 성냥개비 퍼즐은 원래 cdn.tailwindcss.com
+(브라우저 안에서 도는 Tailwind 컴파일러, 약 400 KB)을 불러, 학생 기기마다 열 때마다
+DOM을 훑어 CSS를 만들었습니다. 여기서는 그 페이지 소스에서 클래스 이름을 모아 한 번만
+컴파일하고, 결과(수십 KB)를 static/vendor/tailwind.<해시>.css로 저장해 utils.vendor로
+내려줍니다. 페이지 HTML에서는 이렇게 씁니다.
+
+    <link rel="stylesheet" href="vendor:tailwind.css">
+
+클래스를 바꾸거나 추가했으면 다시 만들고 결과를 커밋합니다.
+(Tailwind 단독 실행 파일이 필요합니다: pip install tailwindcss-bin==4.3.3)
+
+    python -m utils.tailwind          # 다시 만들기
+    python -m utils.tailwind --check  # 커밋된 CSS가 지금 소스와 맞는지 확인 (CI용)
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from utils import vendor
+
+ROOT = vendor.ROOT
+NAME = "tailwind.css"
+
+# 클래스를 모을 페이지
+SOURCES = (
+    "utils/quiz/frontend/plus_minus.html",
+    "utils/quiz/frontend/multiplication_division.html",
+    "utils/quiz/frontend/polynomial.html",
+    "보드게임/MatchstickPuzzle.py",
+)
+
+# JS에서 classList.add()/className으로 붙였다 떼는 클래스.
+# Tailwind는 소스의 문자열도 훑으므로 지금은 없어도 찾지만, 'text-' + color처럼
+# 이름을 조립하게 되더라도 빠지지 않도록 명시해 둡니다.
+SAFELIST = (
+    "hidden", "opacity-0", "opacity-100",
+    "text-red-500", "text-green-500", "text-rose-500", "text-emerald-500",
+    "bg-blue-600", "text-white",
+)
+
+# Tailwind v4로 컴파일하지만 페이지는 v3(Play CDN) 기준으로 만들어졌으므로 v3의 기본값을 되살립니다.
+#  - 테두리/placeholder 색, 버튼 커서 (v4 업그레이드 안내의 호환 스타일)
+#  - 이름이 한 단계씩 밀린 shadow-sm, blur-sm의 값
+COMPAT = """
+@theme {
+  --shadow-sm: 0 1px 2px 0 rgb(0 0 0 / 0.05);
+  --blur-sm: 4px;
+}
+@layer base {
+  *, ::after, ::before, ::backdrop, ::file-selector-button { border-color: var(--color-gray-200, currentColor); }
+  input::placeholder, textarea::placeholder { color: var(--color-gray-400); }
+  button:not(:disabled), [role="button"]:not(:disabled) { cursor: pointer; }
+}
+"""
+
+
+# -----------------------------------------------------------------------------
+# 1. 컴파일
+# -----------------------------------------------------------------------------
+def _input_css():
+    sources = "\n".join(f'@source "{os.path.join(ROOT, path)}";' for path in SOURCES)
+    return f'@import "tailwindcss" source(none);\n{sources}\n@source inline("{" ".join(SAFELIST)}");\n{COMPAT}'
+
+
+def _oklch_to_hex(match):
+    """oklch(L% C H) -> #rrggbb (sRGB 범위 밖은 잘라냅니다)."""
+    l, c, h = match.group(1), float(match.group(2)), float(match.group(3) or 0)
+    l = float(l[:-1]) / 100 if l.endswith("%") else float(l)
+    a, b = c * math.cos(math.radians(h)), c * math.sin(math.radians(h))
+    l_, m_, s_ = (l + 0.3963377774 * a + 0.2158037573 * b) ** 3, \
+                 (l - 0.1055613458 * a - 0.0638541728 * b) ** 3, \
+                 (l - 0.0894841775 * a - 1.2914855480 * b) ** 3
+    linear = (
+        +4.0767416621 * l_ - 3.3077115913 * m_ + 0.2309699292 * s_,
+        -1.2684380046 * l_ + 2.6097574011 * m_ - 0.3413193965 * s_,
+        -0.0041960863 * l_ - 0.7034186147 * m_ + 1.7076147010 * s_,
+    )
+    channels = []
+    for x in linear:
+        x = min(max(x, 0.0), 1.0)
+        x = 12.92 * x if x <= 0.0031308 else 1.055 * x ** (1 / 2.4) - 0.055
+        channels.append(round(x * 255))
+    return "#" + "".join(f"{v:02x}" for v in channels)
+
+
+# v4의 기본 색상은 oklch()로 적혀 있어 2023년 이전 브라우저(업데이트가 끊긴 크롬북 등)에서는
+# 색이 모두 빠집니다. 같은 색을 16진수로 바꿔 둡니다.
+_OKLCH = re.compile(r"oklch\(([\d.]+%?)\s+([\d.]+)\s+([\d.]+)?\)")
+
+
+def build():
+    """CSS를 컴파일해 bytes로 돌려줍니다."""
+    binary = shutil.which("tailwindcss")
+    if binary is None:
+        sys.exit("tailwindcss 실행 파일이 없습니다. pip install tailwindcss-bin==4.3.3 후 다시 실행하세요.")
+    with tempfile.TemporaryDirectory() as tmp:
+        src, out = os.path.join(tmp, "input.css"), os.path.join(tmp, "output.css")
+        with open(src, "w", encoding="utf-8") as f:
+            f.write(_input_css())
+        subprocess.run([binary, "-i", src, "-o", out, "--minify"], check=True, capture_output=True)
+        with open(out, encoding="utf-8") as f:
+            css = f.read()
+    return _OKLCH.sub(_oklch_to_hex, css).encode("utf-8")
+
+
+# -----------------------------------------------------------------------------
+# 2. 실행 (python -m utils.tailwind)
+# -----------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="다시 만든 결과가 커밋된 CSS와 같은지만 확인")
+    args = parser.parse_args(argv)
+
+    css = build()
+    if args.check:
+        entry = vendor._manifest().get(NAME)
+        expected = vendor._hashed_name(NAME, hashlib.sha256(css).hexdigest())
+        if entry is None or entry["file"] != expected:
+            sys.exit(f"❌ static/vendor/{NAME}가 소스와 다릅니다. python -m utils.tailwind로 다시 만드세요.")
+        return
+    filename = vendor.record(NAME, css, "build:utils.tailwind")
+    print(f"{NAME} {len(css) / 1024:.1f} KB -> static/vendor/{filename}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
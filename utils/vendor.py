@@ -0,0 +1,228 @@
+"""외부 JS/CSS 라이브러리를 저장소에 넣어 두고(vendoring) 앱 서버가 직접 내려줍니다.
+
+components.html로 넣는 페이지들이 렌더링할 때마다 공개 CDN(d3, bootstrap)에서
+라이브러리를 받아 오면, 태블릿 30대가 같은 학교 Wi-Fi에서 동시에 받거나 CDN이 막혀 있을 때
+페이지가 뜨지 않습니다. 라이브러리는 static/vendor/에 내용 해시가 들어간 이름
+(d3.min.3f2a9c1e07.js)으로 저장하고, 파일 이름이 내용이 바뀔 때만 바뀌므로 브라우저가
+한 번 받은 파일을 다시 묻지 않고 계속 쓰도록(immutable) 내려줍니다.
+
+페이지의 HTML에는 "vendor:<이름>"으로 적고 link()로 실제 주소로 바꿉니다.
+
+    html_code = vendor.link('<script src="vendor:d3.min.js"></script> ...')
+
+라이브러리를 추가하거나 버전을 바꾸면 LIBRARIES를 고치고 다시 내려받습니다.
+
+    python -m utils.vendor            # 내려받아 해시 이름으로 저장 + manifest.json 갱신
+    python -m utils.vendor --check    # 저장된 파일이 manifest와 같은지 확인 (CI용)
+
+Streamlit의 정적 파일 서빙(app/static)은 .js/.css를 text/plain + nosniff로 내려주어
+브라우저가 실행하지 않으므로, 같은 폴더를 컴포넌트 경로(component/...)로 등록해
+올바른 Content-Type으로 내려줍니다.
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+import urllib.request
+
+import streamlit.components.v1 as components
+from streamlit.logger import get_logger
+
+logger = get_logger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VENDOR_DIR = os.path.join(ROOT, "static", "vendor")
+MANIFEST = os.path.join(VENDOR_DIR, "manifest.json")
+
+# 이름 -> 원본 주소. 버전을 고정해 두어야 해시 이름이 배포마다 바뀌지 않습니다.
+# 회전체의 three.js r128과 OrbitControls는 아직 받아 넣지 못해 rotation.py가 CDN 주소를 그대로 씁니다.
+# 넣을 때는 여기에 추가하고 내려받은 뒤 rotation.py를 "vendor:..."로 바꿉니다.
+LIBRARIES = {
+    "d3.min.js": "https://cdn.jsdelivr.net/npm/d3@7.9.0/dist/d3.min.js",
+    "bootstrap.min.css": "https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css",
+}
+
+# 저장소 안에서 만들어 넣는 파일(utils.fonts)이 아직 없을 때 대신 쓸 주소.
+FALLBACKS = {
+    "jua.css": "https://fonts.googleapis.com/css2?family=Jua&display=swap",
+    # 보로노이는 원래 Pretendard를 따로 불러오지 않고 기기에 깔려 있을 때만 썼습니다.
+    "pretendard.css": "data:text/css,",
+}
+
+# 해시 이름 파일은 내용이 바뀌면 이름도 바뀌므로 1년 동안 다시 확인하지 않아도 됩니다.
+IMMUTABLE = "public, max-age=31536000, immutable"
+_HASHED = re.compile(r"\.[0-9a-f]{10}\.(js|css|html|woff2)$")
+_REFERENCE = re.compile(r"vendor:([\w.\-]+)")
+
+
+# -----------------------------------------------------------------------------
+# 1. 앱에서 쓰기
+# -----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def _manifest():
+    """이름 -> {"file", "source", "sha256"}. 서버 프로세스당 한 번 읽습니다."""
+    try:
+        with open(MANIFEST, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.warning("vendor: %s가 없어 CDN 주소를 씁니다. `python -m utils.vendor`로 내려받으세요.", MANIFEST)
+        return {}
+
+
+_immutable_prefixes = set()
+
+
+def serve(name, path):
+    """path 폴더를 component/<컴포넌트 이름>/ 아래로 내려주고 그 컴포넌트 이름을 돌려줍니다.
+
+    폴더 안의 해시 이름 파일에는 immutable 캐시 헤더가 붙습니다.
+    등록에는 실행 중인 스크립트가 필요하므로 페이지 실행 중에 불러야 합니다.
+    """
+    component = components.declare_component(name, path=path)
+    _immutable_prefixes.add(component.name + "/")
+    _immutable_cache_headers()
+    return component.name
+
+
+@functools.lru_cache(maxsize=1)
+def _component_name():
+    """static/vendor/ 폴더를 등록합니다. 처음 link()가 불릴 때 한 번."""
+    return serve("vendor", VENDOR_DIR)
+
+
+def _immutable_cache_headers():
+    """해시 이름 파일에 immutable 캐시 헤더를 붙입니다.
+
+    Streamlit의 컴포넌트 파일 핸들러는 Cache-Control: public만 보내므로, 브라우저가
+    열 때마다 ETag로 다시 확인합니다. 핸들러 구조가 바뀐 버전에서는 아무 일도 하지 않습니다.
+    """
+    try:
+        from streamlit.web.server.component_request_handler import ComponentRequestHandler
+    except ImportError:
+        return
+    original = ComponentRequestHandler.set_extra_headers
+    if getattr(original, "vendor_immutable", False):
+        return
+    def set_extra_headers(self, path):
+        original(self, path)
+        if path.startswith(tuple(_immutable_prefixes)) and _HASHED.search(path):
+            self.set_header("Cache-Control", IMMUTABLE)
+
+    set_extra_headers.vendor_immutable = True
+    ComponentRequestHandler.set_extra_headers = set_extra_headers
+
+
+def url(name, from_component=False):
+    """라이브러리의 주소. 아직 내려받지 않았으면 원래 CDN 주소를 돌려줍니다.
+
+    LIBRARIES나 FALLBACKS에 없는 파일(예: utils.tailwind가 만든 tailwind.css)은 대신할
+    주소가 없으므로 없으면 FileNotFoundError를 냅니다.
+
+    components.html의 iframe(srcdoc)은 부모 페이지 주소를 기준으로 하므로 상대 주소로
+    적어야 baseUrlPath나 Community Cloud의 경로 아래에서도 맞게 찾아갑니다.
+    from_component=True는 component/<이름>/ 아래에서 내려주는 HTML(선언형 컴포넌트)에서 쓸 주소입니다.
+    """
+    entry = _manifest().get(name)
+    if entry is None or not os.path.exists(os.path.join(VENDOR_DIR, entry["file"])):
+        fallback = LIBRARIES.get(name) or FALLBACKS.get(name)
+        if fallback is None:
+            raise FileNotFoundError(f"static/vendor/에 {name}이(가) 없습니다. 만들어서 커밋했는지 확인하세요.")
+        return fallback
+    prefix = "../" if from_component else "component/"
+    return f"{prefix}{_component_name()}/{entry['file']}"
+
+
+def link(html, from_component=False):
+    """HTML 안의 "vendor:<이름>"을 실제 주소로 바꿉니다."""
+    return _REFERENCE.sub(lambda m: url(m.group(1), from_component), html)
+
+
+# -----------------------------------------------------------------------------
+# 2. 내려받기 / 확인 (python -m utils.vendor)
+# -----------------------------------------------------------------------------
+def _hashed_name(name, digest):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{digest[:10]}{ext}"
+
+
+def record(name, body, source, **extra):
+    """body를 해시 이름으로 저장하고 manifest의 name 항목을 갱신합니다. 저장한 파일 이름을 돌려줍니다.
+
+    같은 이름의 이전 버전 파일은 지우고, 다른 항목은 그대로 둡니다.
+    (utils.tailwind처럼 저장소 안에서 만들어 넣는 파일도 이 함수로 기록합니다.)
+    extra는 manifest 항목에 함께 적어 둘 값입니다(예: utils.fonts의 글자 목록 해시).
+    """
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    digest = hashlib.sha256(body).hexdigest()
+    filename = _hashed_name(name, digest)
+    with open(os.path.join(VENDOR_DIR, filename), "wb") as f:
+        f.write(body)
+
+    try:
+        with open(MANIFEST, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        manifest = {}
+    previous = manifest.get(name)
+    if previous and previous["file"] != filename:
+        try:
+            os.remove(os.path.join(VENDOR_DIR, previous["file"]))
+        except FileNotFoundError:
+            pass
+    manifest[name] = {"file": filename, "source": source, "sha256": digest, **extra}
+    with open(MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(manifest.items())), f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    _manifest.cache_clear()
+    return filename
+
+
+def download():
+    for name, source in LIBRARIES.items():
+        with urllib.request.urlopen(source, timeout=30) as response:
+            body = response.read()
+        filename = record(name, body, source)
+        print(f"{name:20s} {len(body) / 1024:8.1f} KB -> static/vendor/{filename}", file=sys.stderr)
+
+
+def check():
+    """manifest의 모든 파일이 있고 내용 해시가 맞으면 빈 목록, 아니면 문제 목록."""
+    problems = []
+    manifest = _manifest()
+    for name in sorted(set(LIBRARIES) | set(manifest)):
+        entry = manifest.get(name)
+        if entry is None:
+            problems.append(f"{name}: manifest에 없음")
+            continue
+        path = os.path.join(VENDOR_DIR, entry["file"])
+        try:
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except FileNotFoundError:
+            problems.append(f"{name}: {entry['file']} 없음")
+            continue
+        if digest != entry["sha256"] or entry["file"] != _hashed_name(name, digest):
+            problems.append(f"{name}: {entry['file']} 내용이 manifest와 다름")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="내려받지 않고 저장된 파일만 확인")
+    args = parser.parse_args(argv)
+
+    if not args.check:
+        download()
+    problems = check()
+    for problem in problems:
+        print(f"❌ {problem}", file=sys.stderr)
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Streamlit 프로세스 여러 개를 띄우고, 앞에 세션 고정(sticky) 리버스 프록시를 둡니다.
+
+Streamlit 서버 하나는 CPU 코어 하나만 제대로 씁니다(GIL). 학교 전체가 한꺼번에 들어오면
+한 코어가 바쁜 만큼 모든 학생이 기다립니다. 이 명령은 워커를 코어 수만큼 띄우고
+--port 하나로 받아 나눠 줍니다.
+
+    python -m utils.workers                    # 워커 = CPU 코어 수, 주소 http://localhost:8501
+    python -m utils.workers --workers 4 --port 8080
+
+Streamlit 세션은 웹소켓이 붙은 워커의 메모리에 있으므로, 한 브라우저의 요청(웹소켓 재연결,
+업로드, 이미지 등 미디어 파일)은 늘 같은 워커로 가야 합니다. 처음 온 브라우저에는 연결이
+가장 적은 워커를 골라 쿠키(COOKIE)로 적어 주고, 그 뒤로는 쿠키대로 보냅니다. 학교에서는
+학생들이 같은 공인 IP로 나오므로 IP 기준으로 고정하면 모두 한 워커로 몰립니다.
+
+세션끼리 나누는 상태는 공유 저장소(utils.shared)에 둡니다. MATHZIP_SHARED나 secrets의
+[Shared] url로 정하지 않았으면 워커들이 data/shared.sqlite3를 함께 씁니다(utils.shared의 기본
+memory://는 워커마다 따로라 워커가 둘 이상이면 쓸 수 없습니다). 워커가 죽으면 다시 띄웁니다.
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import urllib.request
+
+import tornado.httpclient
+import tornado.web
+import tornado.websocket
+
+from utils import shared
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+COOKIE = "mathzip_worker"
+DEFAULT_SHARED = "sqlite:///data/shared.sqlite3"
+# Streamlit의 server.maxMessageSize 기본값(200MB)과 맞춥니다.
+MAX_MESSAGE_BYTES = 200 * 1024 * 1024
+# 프록시가 그대로 넘기지 않는 헤더 (연결마다 따로 정해지는 것들)
+HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "upgrade", "content-length",
+               "proxy-connection", "te", "trailer"}
+
+
+# -----------------------------------------------------------------------------
+# 1. 워커 프로세스
+# -----------------------------------------------------------------------------
+class Worker:
+    """streamlit run app.py 하나 (127.0.0.1:port)."""
+
+    def __init__(self, index, port, extra_args=()):
+        self.index = index
+        self.port = port
+        self.extra_args = list(extra_args)
+        self.connections = 0   # 지금 붙어 있는 웹소켓 수
+        self.process = None
+
+    def start(self):
+        self.process = subprocess.Popen([
+            sys.executable, "-m", "streamlit", "run", APP_PATH,
+            "--server.headless=true", "--server.address=127.0.0.1", f"--server.port={self.port}",
+            "--browser.gatherUsageStats=false", *self.extra_args,
+        ], cwd=ROOT)
+
+    def healthy(self):
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=1) as r:
+                return r.status == 200
+        except OSError:
+            return False
+
+
+class Pool:
+    """워커 목록과 새 브라우저를 어느 워커에 붙일지 정하는 규칙."""
+
+    def __init__(self, workers):
+        self.workers = workers
+        self._next = 0
+
+    def pick(self, cookie):
+        """쿠키에 적힌 워커, 없거나 틀리면 연결이 가장 적은 워커 (같으면 돌아가며)."""
+        if cookie is not None and cookie.isdigit() and int(cookie) < len(self.workers):
+            return self.workers[int(cookie)], False
+        order = self.workers[self._next:] + self.workers[:self._next]
+        worker = min(order, key=lambda w: w.connections)
+        self._next = (worker.index + 1) % len(self.workers)
+        return worker, True
+
+
+# -----------------------------------------------------------------------------
+# 2. 프록시
+# -----------------------------------------------------------------------------
+def _forward_headers(request):
+    headers = {k: v for k, v in request.headers.get_all() if k.lower() not in HOP_HEADERS}
+    headers["X-Forwarded-For"] = request.remote_ip
+    headers["X-Forwarded-Proto"] = request.protocol
+    return headers
+
+
+class HTTPProxy(tornado.web.RequestHandler):
+    SUPPORTED_METHODS = ("GET", "HEAD", "POST", "PUT", "DELETE", "OPTIONS", "PATCH")
+
+    def initialize(self, pool):
+        self.pool = pool
+
+    def compute_etag(self):
+        return None  # 워커가 준 ETag를 그대로 넘깁니다.
+
+    async def _proxy(self):
+        worker, new = self.pool.pick(self.get_cookie(COOKIE))
+        request = tornado.httpclient.HTTPRequest(
+            f"http://127.0.0.1:{worker.port}{self.request.uri}",
+            method=self.request.method,
+            headers=_forward_headers(self.request),
+            body=self.request.body if self.request.method in ("POST", "PUT", "PATCH", "DELETE") else None,
+            allow_nonstandard_methods=True, follow_redirects=False, decompress_response=False,
+            request_timeout=600,
+        )
+        response = await tornado.httpclient.AsyncHTTPClient().fetch(request, raise_error=False)
+        if response.code == 599:  # 워커에 연결하지 못함 (다시 뜨는 중 등)
+            self.set_status(502)
+            self.finish("worker unavailable")
+            return
+        self.set_status(response.code, response.reason)
+        for name in ("Content-Type", "Server", "Date"):
+            self.clear_header(name)
+        for name, value in response.headers.get_all():
+            if name.lower() not in HOP_HEADERS:
+                self.add_header(name, value)
+        if new:
+            self.set_cookie(COOKIE, str(worker.index), httponly=True, samesite="Lax")
+        if response.body and self.request.method != "HEAD":
+            self.write(response.body)
+        self.finish()
+
+    get = head = post = put = delete = options = patch = _proxy
+
+
+class WebSocketProxy(tornado.websocket.WebSocketHandler):
+    """브라우저 <-> 워커의 /_stcore/stream 웹소켓을 그대로 잇습니다."""
+
+    def initialize(self, pool):
+        self.pool = pool
+        self.upstream = None
+        self.worker = None
+
+    def check_origin(self, origin):
+        return True  # 출처 확인은 워커(Streamlit)가 원래 Host 헤더로 합니다.
+
+    def select_subprotocol(self, subprotocols):
+        # Streamlit은 첫 번째 subprotocol을 고르고, 나머지에는 XSRF 토큰 등을 실어 보냅니다.
+        return subprotocols[0] if subprotocols else None
+
+    async def open(self):
+        self.worker, _ = self.pool.pick(self.get_cookie(COOKIE))
+        self.worker.connections += 1
+        protocols = self.request.headers.get("Sec-WebSocket-Protocol")
+        headers = {k: v for k, v in _forward_headers(self.request).items()
+                   if not k.lower().startswith("sec-websocket")}
+        try:
+            self.upstream = await tornado.websocket.websocket_connect(
+                tornado.httpclient.HTTPRequest(f"ws://127.0.0.1:{self.worker.port}{self.request.uri}",
+                                               headers=headers),
+                subprotocols=[p.strip() for p in protocols.split(",")] if protocols else None,
+                max_message_size=MAX_MESSAGE_BYTES,
+            )
+        except Exception:
+            self.close(1011, "worker unavailable")
+            return
+        asyncio.ensure_future(self._pump())
+
+    async def _pump(self):
+        while True:
+            message = await self.upstream.read_message()
+            if message is None:
+                self.close()
+                return
+            try:
+                await self.write_message(message, binary=isinstance(message, bytes))
+            except tornado.websocket.WebSocketClosedError:
+                return
+
+    async def on_message(self, message):
+        if self.upstream is not None:
+            await self.upstream.write_message(message, binary=isinstance(message, bytes))
+
+    def on_close(self):
+        if self.worker is not None:
+            self.worker.connections -= 1
+        if self.upstream is not None:
+            self.upstream.close()
+
+
+def make_app(pool):
+    return tornado.web.Application([
+        (r"/_stcore/stream", WebSocketProxy, {"pool": pool}),
+        (r"/.*", HTTPProxy, {"pool": pool}),
+    ], websocket_max_message_size=MAX_MESSAGE_BYTES)
+
+
+# -----------------------------------------------------------------------------
+# 3. 실행
+# -----------------------------------------------------------------------------
+def shared_url(workers):
+    """워커들이 함께 쓸 공유 저장소 주소 (utils.shared.url() 순서, 정하지 않았으면 DEFAULT_SHARED).
+
+    워커가 둘 이상인데 memory://를 고르면 알림 대기열, 교실 방 등이 워커마다 따로 생기므로 멈춥니다.
+    """
+    url = shared.url()
+    if url == shared.DEFAULT_URL and not os.environ.get("MATHZIP_SHARED"):
+        return DEFAULT_SHARED
+    if url.startswith("memory://") and workers > 1:
+        sys.exit(f"공유 저장소가 {url}라 워커 {workers}개가 상태를 나누지 못합니다. "
+                 f"MATHZIP_SHARED를 비워 두거나({DEFAULT_SHARED}) sqlite:///, redis:// 주소를 주세요.")
+    return url
+
+
+async def serve(args, streamlit_args):
+    # 워커들이 secrets를 따로 읽어도 같은 저장소를 쓰도록 환경 변수로 넘깁니다.
+    os.environ["MATHZIP_SHARED"] = shared_url(args.workers)
+    pool = Pool([Worker(i, args.base_port + i, streamlit_args) for i in range(args.workers)])
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    for worker in pool.workers:
+        worker.start()
+    try:
+        while not all(await asyncio.gather(*(asyncio.to_thread(w.healthy) for w in pool.workers))):
+            if stop.is_set():
+                return
+            await asyncio.sleep(0.5)
+
+        make_app(pool).listen(args.port, address=args.address, max_body_size=MAX_MESSAGE_BYTES)
+        print(f"워커 {args.workers}개 준비: http://{args.address}:{args.port}  "
+              f"(공유 저장소 {os.environ['MATHZIP_SHARED']})", file=sys.stderr, flush=True)
+
+        while not stop.is_set():
+            for worker in pool.workers:
+                if worker.process.poll() is not None:
+                    print(f"워커 {worker.index} (포트 {worker.port})가 멈춰 다시 띄웁니다.", file=sys.stderr)
+                    worker.start()
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=2)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for worker in pool.workers:
+            worker.process.terminate()
+        for worker in pool.workers:
+            try:
+                worker.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                worker.process.kill()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog="알 수 없는 인자는 그대로 streamlit run에 넘깁니다 (예: --server.maxUploadSize=50).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 수 (기본: CPU 코어 수)")
+    parser.add_argument("--port", type=int, default=8501, help="프록시가 받을 포트")
+    parser.add_argument("--address", default="0.0.0.0", help="프록시가 받을 주소")
+    parser.add_argument("--base-port", type=int, default=8601, help="워커 포트 (base-port, base-port+1, ...)")
+    args, streamlit_args = parser.parse_known_args(argv)
+    asyncio.run(serve(args, streamlit_args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import datetime
+import time
+
+import pyarrow.dataset as ds
+import streamlit as st
+from utils import events, prewarm
+from utils.admin import is_admin
+
+pd = prewarm.module("pandas")
+
+st.title("🧑‍🏫 학습 분석")
+
+if not is_admin():
+    st.error("관리자만 볼 수 있는 페이지입니다.")
+    st.stop()
+
+# -----------------------------------------------------------------------------
+# 1. 기본 설정
+# -----------------------------------------------------------------------------
+PAGE_TITLES = {
+    "plus_minus": "덧셈·뺄셈", "multiplication_division": "곱셈·나눗셈", "polynomial": "다항식 챌린지",
+    "pig": "Pig Game", "streams": "스트림스", "baseball": "숫자야구",
+}
+COLUMNS = ["ts", "page", "class", "player", "kind", "level", "value", "correct", "latency_ms"]
+
+log = events.store()
+if log.pending():
+    left, right = st.columns([4, 1])
+    left.caption(f"최근 기록(최대 {events.ROLL_SECONDS // 60}분)은 아직 파일로 닫히지 않아 아래 분석에 빠져 있습니다.")
+    if right.button("지금 반영", width='stretch'):
+        log.roll()
+
+# -----------------------------------------------------------------------------
+# 2. 조건 (날짜와 페이지는 폴더로, 반과 레벨은 row group 통계로 걸러 읽습니다)
+# -----------------------------------------------------------------------------
+today = datetime.datetime.now(events.KST).date()
+cols = st.columns([2, 3, 1, 2])
+period = cols[0].date_input("기간", value=(today - datetime.timedelta(days=6), today), max_value=today)
+pages = cols[1].multiselect("게임", events.partition_values("page"), format_func=lambda p: PAGE_TITLES.get(p, p))
+classroom = cols[2].text_input("반", placeholder="예: 2-3").strip()
+level = cols[3].text_input("레벨", placeholder="예: Lv.2 계수 찾기").strip()
+
+if len(period) != 2:
+    st.stop()
+start, end = (d.isoformat() for d in period)
+condition = (ds.field("date") >= start) & (ds.field("date") <= end)
+if pages:
+    condition &= ds.field("page").isin(pages)
+if classroom:
+    condition &= ds.field("class") == classroom
+if level:
+    condition &= ds.field("level") == level
+
+dataset = events.dataset()
+t0 = time.perf_counter()
+files = len(list(dataset.get_fragments(filter=condition)))
+table = dataset.to_table(filter=condition, columns=COLUMNS)
+elapsed = (time.perf_counter() - t0) * 1000
+st.caption(f"{table.num_rows:,}줄 · 파일 {files:,}개 · {elapsed:.0f} ms")
+if table.num_rows == 0:
+    st.info("조건에 맞는 기록이 없습니다.")
+    st.stop()
+df = table.to_pandas()
+# 정답 여부가 없는 사건(주사위, 뽑기 ...)이 섞이면 object가 되므로 빈칸을 허용하는 bool로 둡니다.
+df["correct"] = df["correct"].astype("boolean")
+df["게임"] = df["page"].map(lambda p: PAGE_TITLES.get(p, p))
+
+# -----------------------------------------------------------------------------
+# 3. 화면
+# -----------------------------------------------------------------------------
+# 3-1. 게임별 사건 수
+st.subheader("📊 게임별 기록 수")
+st.dataframe(df.pivot_table(index="게임", columns="kind", values="ts", aggfunc="count", fill_value=0),
+             width='stretch')
+
+# 3-2. 퀴즈: 레벨별 정답률과 풀이 시간
+answers = df[df["kind"] == "answer"]
+if not answers.empty:
+    st.subheader("✏️ 퀴즈 레벨별 정답률 / 풀이 시간")
+    by_level = answers.groupby(["게임", "level"])
+    st.dataframe(pd.DataFrame({
+        "문제 수": by_level.size(),
+        "정답률 (%)": (by_level["correct"].mean() * 100).round(1),
+        "풀이 시간 중앙값 (초)": (by_level["latency_ms"].median() / 1000).round(1),
+        "풀이 시간 p90 (초)": (by_level["latency_ms"].quantile(0.9) / 1000).round(1),
+    }), width='stretch')
+
+    # 반을 고르면 학생별로도 봅니다 (이름을 입력하는 게임만).
+    named = answers[answers["player"] != ""]
+    if classroom and not named.empty:
+        st.subheader(f"🙋 {classroom} 반 학생별")
+        by_player = named.groupby(["player", "게임"])
+        st.dataframe(pd.DataFrame({
+            "문제 수": by_player.size(),
+            "정답률 (%)": (by_player["correct"].mean() * 100).round(1),
+            "풀이 시간 중앙값 (초)": (by_player["latency_ms"].median() / 1000).round(1),
+            "최근": by_player["ts"].max().dt.tz_convert(events.KST).dt.strftime("%m-%d %H:%M"),
+        }), width='stretch')
+
+left, right = st.columns(2)
+
+# 3-3. Pig Game: 주사위 눈 분포
+rolls = df[(df["page"] == "pig") & (df["kind"] == "roll")]
+if not rolls.empty:
+    with left:
+        st.subheader("🐷 주사위 눈 분포")
+        st.bar_chart(rolls["value"].value_counts().sort_index(), x_label="눈", y_label="횟수")
+
+# 3-4. 숫자야구: 자릿수별 정답까지 걸린 추측 수
+guesses = df[(df["page"] == "baseball") & (df["kind"] == "guess")]
+if not guesses.empty:
+    with right:
+        st.subheader("⚾ 숫자야구")
+        by_digits = guesses.groupby("level")
+        solved = by_digits["correct"].sum()
+        st.dataframe(pd.DataFrame({
+            "추측": by_digits.size(),
+            "맞힌 판": solved,
+            "판당 추측 수": (by_digits.size() / solved.where(solved > 0)).round(1),
+        }), width='stretch')
@@ -0,0 +1,190 @@
+import datetime
+import os
+
+import streamlit as st
+from utils import assets, metrics, minify, notify, prewarm, profiler, results, state
+from utils.admin import is_admin
+from utils.streams import room as streams_room
+
+pd = prewarm.module("pandas")
+go = prewarm.module("plotly.graph_objects")
+
+st.title("📈 운영 지표")
+
+if not is_admin():
+    st.error("관리자만 볼 수 있는 페이지입니다.")
+    st.stop()
+
+# -----------------------------------------------------------------------------
+# 1. 기본 설정
+# -----------------------------------------------------------------------------
+# 재실행 시간 히스토그램 구간(ms). 마지막 구간은 그 이상 전부입니다.
+BINS_MS = [0, 10, 25, 50, 100, 250, 500, 1000, 2500, float("inf")]
+BIN_LABELS = [f"{lo:g}–{hi:g}" for lo, hi in zip(BINS_MS[:-1], BINS_MS[1:-1])] + [f"{BINS_MS[-2]:g}+"]
+SLOWEST = 20
+
+
+def _clock(ts):
+    return datetime.datetime.fromtimestamp(ts).strftime("%H:%M:%S")
+
+
+# -----------------------------------------------------------------------------
+# 2. 화면 (자동 새로고침은 이 부분만 다시 그립니다)
+# -----------------------------------------------------------------------------
+auto = st.toggle("5초마다 새로고침", value=False)
+
+
+@st.fragment(run_every=5 if auto else None)
+def dashboard():
+    runs = pd.DataFrame(metrics.runs(), columns=metrics.Run._fields)
+    active = metrics.active_sessions()
+
+    # 2-1. 접속 중인 세션
+    st.subheader("👥 접속 중인 세션")
+    cols = st.columns(3)
+    cols[0].metric("세션", sum(active.values()))
+    cols[1].metric(f"기록된 재실행 (최근 {metrics.RUN_BUFFER:,}건까지)", len(runs))
+    cols[2].metric("스레드", metrics.samples()[-1].threads if metrics.samples() else "-")
+    if active:
+        st.dataframe(
+            pd.Series(active, name="세션 수").sort_values(ascending=False).rename_axis("페이지"),
+            width='stretch',
+        )
+    if runs.empty:
+        st.info("아직 기록된 재실행이 없습니다.")
+        return
+
+    # 2-2. 페이지별 재실행 시간
+    st.subheader("⏱️ 페이지별 재실행 시간 (ms)")
+    by_page = runs.groupby("page")["ms"]
+    summary = pd.DataFrame({
+        "재실행": by_page.size(),
+        "p50": by_page.quantile(0.5),
+        "p95": by_page.quantile(0.95),
+        "최대": by_page.max(),
+    }).sort_values("p95", ascending=False).round(1)
+    st.dataframe(summary.rename_axis("페이지"), width='stretch')
+
+    runs["구간"] = pd.cut(runs["ms"], BINS_MS, labels=BIN_LABELS, right=False)
+    page = st.selectbox("히스토그램을 볼 페이지", summary.index)
+    counts = runs.loc[runs["page"] == page, "구간"].value_counts(sort=False)
+    fig = go.Figure(go.Bar(x=BIN_LABELS, y=[int(counts.get(label, 0)) for label in BIN_LABELS]))
+    fig.update_layout(xaxis_title="재실행 시간 (ms)", yaxis_title="횟수", height=300, margin=dict(l=0, r=0, t=0, b=0))
+    st.plotly_chart(fig, width='stretch')
+
+    # 2-3. 가장 느렸던 재실행과 그 재실행을 일으킨 위젯
+    st.subheader(f"🐢 가장 느린 재실행 {SLOWEST}건")
+    slowest = runs.nlargest(SLOWEST, "ms")
+    st.dataframe(pd.DataFrame({
+        "시각": slowest["ts"].map(_clock),
+        "페이지": slowest["page"],
+        "ms": slowest["ms"].round(1),
+        "위젯": slowest["trigger"].fillna("(첫 실행/페이지 이동)"),
+        "결과": slowest["outcome"],
+    }), hide_index=True, width='stretch')
+
+    # 2-4. 프로세스 메모리와 스레드 수
+    st.subheader("🧠 프로세스 RSS / 스레드 수")
+    samples = pd.DataFrame(metrics.samples(), columns=metrics.Sample._fields)
+    if not samples.empty:
+        samples.index = pd.to_datetime(samples.pop("ts"), unit="s")
+        left, right = st.columns(2)
+        left.line_chart(samples["rss_kb"] / 1024, y_label="RSS (MB)")
+        right.line_chart(samples["threads"], y_label="스레드")
+
+    # 2-5. 이 세션의 페이지 상태 크기와 모듈 예열 시간
+    left, right = st.columns(2)
+    with left:
+        st.caption("이 세션의 페이지별 상태 크기")
+        st.json(state.report(), expanded=False)
+    with right:
+        st.caption("모듈 예열 시간 (ms)")
+        st.json(prewarm.timings(), expanded=False)
+
+    # 2-6. 인라인 HTML 줄이기 (utils.minify, 페이지를 한 번 이상 연 뒤에 보입니다)
+    saved = minify.report()
+    if saved:
+        st.subheader("✂️ 인라인 HTML 크기")
+        st.dataframe(pd.DataFrame.from_dict(saved, orient="index").rename(columns={
+            "original_bytes": "원래 (B)", "minified_bytes": "줄인 뒤 (B)", "saved_bytes": "줄어든 양 (B)", "saved_pct": "줄어든 비율 (%)",
+        }), width='stretch')
+
+    # 2-7. 선생님 알림 (utils.notify): 받은 알림 줄 / 보낸 요약 / 다시 보낸 횟수 / 버린 요약 / 대기열 오류
+    sent = notify.stats()
+    if sent:
+        st.subheader("🔔 텔레그램 알림")
+        cols = st.columns(5)
+        for col, (key, label) in zip(cols, [("queued", "받은 알림"), ("sent", "보낸 요약"), ("retried", "재시도"), ("dropped", "버린 요약"), ("failed", "오류")]):
+            col.metric(label, sent.get(key, 0))
+
+    # 2-8. 결과 저장소 (utils.results): 쓴 결과 / 트랜잭션 수 / 실패
+    st.subheader("🗄️ 결과 저장소")
+    written = results.store().stats
+    cols = st.columns(3)
+    for col, (key, label) in zip(cols, [("written", "쓴 결과"), ("batches", "트랜잭션"), ("failed", "실패")]):
+        col.metric(label, written[key])
+
+    # 2-9. 파일 캐시 (utils.assets): 디스크에서 읽은 횟수와 캐시 적중률
+    cached = assets.stats()
+    st.subheader("📦 파일 캐시")
+    cols = st.columns(4)
+    cols[0].metric("적중률", "-" if cached["hit_ratio"] is None else f"{cached['hit_ratio']:.1%}")
+    cols[1].metric("캐시에서", cached["hits"])
+    cols[2].metric("디스크에서", cached["misses"])
+    cols[3].metric("파일 (KB)", f"{cached['files']} ({cached['bytes'] / 1024:,.0f})")
+
+    # 2-10. 스트림스 교실 방 (utils.streams.room): 학생 폴링 중 방을 실제로 읽은 비율
+    rooms = streams_room.stats()
+    if rooms:
+        st.subheader("📡 스트림스 교실 방")
+        cols = st.columns(4)
+        cols[0].metric("만든 방", rooms.get("created", 0))
+        cols[1].metric("뽑기", rooms.get("draws", 0))
+        cols[2].metric("학생 폴링", rooms.get("polls", 0))
+        cols[3].metric("방 읽기", rooms.get("loads", 0),
+                       help="version이 바뀌어 방을 읽은 횟수 (같은 워커의 학생들은 한 번 읽은 것을 나눠 씁니다)")
+
+    # 2-11. 워커 프로세스 (python -m utils.workers로 여러 개 띄운 경우, 위의 표는 이 워커의 것입니다)
+    peers = metrics.workers()
+    if len(peers) > 1:
+        st.subheader(f"🧩 워커 {len(peers)}개")
+        st.caption(f"최근 {3 * metrics.SAMPLE_SECONDS}초 안에 재실행이 있었던 워커만 보입니다.")
+        table = pd.DataFrame.from_dict(peers, orient="index")
+        st.dataframe(pd.DataFrame({
+            "포트": table["port"],
+            "세션": table["sessions"],
+            "분당 재실행": table["reruns_per_min"],
+            "p95 (ms)": table["p95_ms"],
+            "RSS (MB)": (table["rss_kb"] / 1024).round(1),
+            "스레드": table["threads"],
+            "갱신": table["ts"].map(_clock),
+        }).rename_axis("pid"), width='stretch')
+
+
+dashboard()
+
+
+# -----------------------------------------------------------------------------
+# 3. 재실행 프로파일 (utils.profiler, 주소에 ?profile=N을 붙인 관리자 세션)
+# -----------------------------------------------------------------------------
+st.subheader("🔥 재실행 프로파일")
+recent = profiler.profiles()
+if not recent:
+    st.caption(f"주소에 ?profile=N을 붙이면 이 세션의 다음 N번(최대 {profiler.MAX_RUNS}번) 재실행을 "
+               f"{profiler.SAMPLE_MS} ms마다 샘플링합니다.")
+else:
+    choice = st.selectbox("프로파일", range(len(recent)), format_func=lambda i: (
+        f"{_clock(recent[i].ts)} · {recent[i].page} · {recent[i].ms:.0f} ms · 표본 {recent[i].samples}개"))
+    chosen = recent[choice]
+    top = pd.DataFrame(profiler.top_functions(chosen.stacks), columns=["function", "self", "total"])
+    # 샘플러도 GIL을 기다리므로 표본 간격이 SAMPLE_MS보다 길어집니다. 실제 걸린 시간으로 나눠 씁니다.
+    per_sample = chosen.ms / max(chosen.samples, 1)
+    st.dataframe(pd.DataFrame({
+        "함수": top["function"],
+        "자기 시간 (ms)": (top["self"] * per_sample).round(1),
+        "포함 시간 (ms)": (top["total"] * per_sample).round(1),
+    }), hide_index=True, width='stretch')
+    st.download_button("접힌 스택 내려받기 (.folded)", profiler.collapsed(chosen.stacks),
+                       file_name=os.path.basename(chosen.path) if chosen.path else "profile.folded", mime="text/plain")
+    if chosen.path:
+        st.caption(f"저장 위치: {chosen.path} — flamegraph.pl이나 speedscope로 엽니다.")
@@ -0,0 +1,86 @@
+import os
+
+import streamlit as st
+from utils import prewarm
+from utils.admin import is_admin
+from utils.state import page_state
+from utils.streams import strategies, tiles, tournament
+
+pd = prewarm.module("pandas")
+go = prewarm.module("plotly.graph_objects")
+
+st.title("🏟️ 스트림스 전략 대결")
+
+if not is_admin():
+    st.error("관리자만 볼 수 있는 페이지입니다.")
+    st.stop()
+
+# 대결은 CPU 코어를 모두 쓰므로 관리자만 돌립니다. 마지막 결과는 이 세션에 남겨 둡니다.
+state = page_state("tournament", keep=("result",))
+
+
+def label(name):
+    return strategies.STRATEGIES[name][0]
+
+
+# -----------------------------------------------------------------------------
+# 1. 설정
+# -----------------------------------------------------------------------------
+st.markdown("게임 페이지와 같은 타일 묶음에서 무작위로 20장씩 뽑아, 모든 전략이 **같은 순서**로 두고 점수를 겨룹니다. "
+            "판은 프로세스마다 나눠 numpy로 한꺼번에 둡니다(`python -m utils.streams.tournament`로도 돌릴 수 있습니다).")
+with st.form("tournament_form"):
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        tile_set = st.selectbox("타일 묶음", list(tiles.TILE_SETS))
+        joker = st.checkbox("⭐ 카드 추가")
+        seed = st.number_input("난수 씨앗", min_value=0, value=0, step=1)
+    with col2:
+        games = st.number_input("판 수", min_value=100, max_value=5_000_000, value=20_000, step=10_000)
+        cores = os.cpu_count() or 1
+        workers = st.number_input("프로세스 수", min_value=1, max_value=cores, value=cores, help=f"이 서버의 코어 수: {cores}")
+    with col3:
+        names = st.multiselect("전략", list(strategies.STRATEGIES), default=["proportional", "nearest"], format_func=label)
+        rollouts = st.slider("몬테카를로: 칸마다 두어 볼 횟수", min_value=2, max_value=32, value=strategies.ROLLOUTS)
+    st.caption("몬테카를로는 코어 하나에 1초에 몇 판 정도라서, 이 전략을 넣으면 판 수를 수백 판으로 줄이세요.")
+    submitted = st.form_submit_button("⚔️ 대결 시작", type="primary")
+
+if submitted:
+    if not names:
+        st.warning("전략을 하나 이상 고르세요.")
+    else:
+        bar = st.progress(0.0, text="대결 중...")
+        state.result = tournament.run(tile_set, int(games), names, int(workers), int(seed), joker, rollouts,
+                                      progress=lambda done: bar.progress(done, text=f"대결 중... {done:.0%}"))
+        bar.empty()
+
+# -----------------------------------------------------------------------------
+# 2. 결과
+# -----------------------------------------------------------------------------
+result = state.get("result")
+if result is None:
+    st.info("설정을 고르고 '대결 시작'을 누르세요.")
+    st.stop()
+
+st.subheader(f"📊 {result.tile_set}{' + ⭐' if result.joker else ''} · {result.games:,}판")
+cols = st.columns(3)
+cols[0].metric("판/초 (전체)", f"{result.games / result.seconds:,.0f}")
+cols[1].metric("걸린 시간", f"{result.seconds:.1f}초")
+cols[2].metric("프로세스", result.workers)
+
+rows = pd.DataFrame(tournament.summary(result))
+st.dataframe(
+    rows.drop(columns="strategy").rename(columns={
+        "label": "전략", "mean": "평균", "std": "표준편차", "p10": "하위 10%", "median": "중앙값",
+        "p90": "상위 10%", "max": "최고", "win_rate": "승률", "games_per_cpu_second": "코어당 판/초",
+    }).style.format({"승률": "{:.1%}", "코어당 판/초": "{:,.0f}"}),
+    hide_index=True, width='stretch',
+)
+
+st.subheader("점수 분포")
+fig = go.Figure()
+for name, scores in result.scores.items():
+    counts = tournament.histogram(scores)
+    top = int(scores.max()) + 1
+    fig.add_trace(go.Bar(x=list(range(top)), y=counts[:top] / len(scores), name=label(name), opacity=0.6))
+fig.update_layout(barmode="overlay", xaxis_title="점수", yaxis_title="비율", height=360, margin=dict(l=0, r=0, t=0, b=0))
+st.plotly_chart(fig, width='stretch')
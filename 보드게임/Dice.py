@@ -1,6 +1,10 @@
 import streamlit as st
-import random
 import time
+from utils import rng
+from utils.state import page_state
+
+# 이 페이지의 세션 상태. op_pills, sign_pill, dice_count는 위젯 key라서 st.session_state에 둡니다.
+state = page_state("dice")
 
 st.title("🎲 주사위 모음")
 
@@ -10,7 +14,7 @@ st.title("🎲 주사위 모음")
 # 연산 pill에서 '없음'을 눌렀을 때의 똑똑한 동작을 제어하는 함수입니다.
 def on_op_change():
     curr = st.session_state.op_pills
-    prev = st.session_state.get('prev_op_pills',[])
+    prev = state.get('prev_op_pills',[])
     
     # 1) '없음'을 방금 새로 선택한 경우 -> 다른 연산을 모두 지우고 '없음'만 남김
     if "🚫 없음" in curr and "🚫 없음" not in prev:
@@ -24,7 +28,7 @@ def on_op_change():
         st.session_state.op_pills = ["🚫 없음"]
         
     # 현재 상태를 이전 상태로 저장 (다음 비교를 위해)
-    st.session_state.prev_op_pills = st.session_state.op_pills
+    state.prev_op_pills = st.session_state.op_pills
 
 # 주사위 개수를 변경할 때의 콜백 함수
 def on_dice_count_change():
@@ -36,13 +40,13 @@ def on_dice_count_change():
 # UI의 기본값을 설정합니다.
 if 'op_pills' not in st.session_state:
     st.session_state.op_pills = ["🚫 없음"]
-    st.session_state.prev_op_pills = ["🚫 없음"]
+    state.prev_op_pills = ["🚫 없음"]
 if 'sign_pill' not in st.session_state:
     st.session_state.sign_pill = "미포함"
 if 'dice_count' not in st.session_state:
     st.session_state.dice_count = 1
-if 'dice_result' not in st.session_state:
-    st.session_state.dice_result = None
+if 'dice_result' not in state:
+    state.dice_result = None
 
 # -----------------------------------------------------------------------------
 # 4. 설정 UI 영역 (st.pills 활용)
@@ -86,33 +90,36 @@ with st.expander("⚙️ 주사위 설정 열기"):
 # -----------------------------------------------------------------------------
 # 5. 주사위 결과 생성 로직
 # -----------------------------------------------------------------------------
-def generate_dice_face(ops_list, include_sign):
-    """현재 설정된 pill 값들을 바탕으로 주사위의 텍스트를 조합하는 함수입니다."""
+def generate_dice_faces(ops_list, include_sign, n):
+    """현재 설정된 pill 값들을 바탕으로 주사위 n개의 텍스트를 한 번에 조합하는 함수입니다."""
+    r = rng.stream("dice")
     
-    # 1. 연산자 결정 (선택된 것들 중 랜덤으로 하나 뽑기)
+    # 1. 연산자 결정 (선택된 것들 중 랜덤으로 하나씩 뽑기)
     op_map = {"➕ 덧셈": "➕", "➖ 뺄셈": "➖", "✖️ 곱셈": "✖️", "➗ 나눗셈": "➗"}
     valid_ops = [op_map[op] for op in ops_list if op in op_map]
     
-    op_str = ""
+    op_strs = [""] * n
     if valid_ops:
-        op_str = random.choice(valid_ops) + " " # 예: "➕ "
+        op_strs = [op + " " for op in r.choice(valid_ops, size=n)] # 예: "➕ "
         
     # 2. 부호 결정 (+ 또는 -)
-    sign_str = ""
+    sign_strs = [""] * n
     if include_sign == "포함":
-        sign_str = random.choice(["+", "-"]) # 예: "-"
+        sign_strs = r.choice(["+", "-"], size=n) # 예: "-"
         
     # 3. 숫자 결정 (1~6)
-    num_str = str(random.randint(1, 6))      # 예: "5"
-    
-    # 음수가 연산과 같이 나오는 경우 괄호로 묶기 (부호 포함 시 양수도 괄호)
-    if sign_str and op_str:
-        num_part = f"({sign_str}{num_str})"
-    else:
-        num_part = f"{sign_str}{num_str}"
+    num_strs = [str(num) for num in r.dice(n).tolist()]      # 예: "5"
     
-    # 최종 조합 리턴 (연산자와 숫자 부분을 분리해서 리턴)
-    return op_str, num_part
+    faces = []
+    for op_str, sign_str, num_str in zip(op_strs, sign_strs, num_strs):
+        # 음수가 연산과 같이 나오는 경우 괄호로 묶기 (부호 포함 시 양수도 괄호)
+        if sign_str and op_str:
+            num_part = f"({sign_str}{num_str})"
+        else:
+            num_part = f"{sign_str}{num_str}"
+        # 연산자와 숫자 부분을 분리해서 담기
+        faces.append((op_str, num_part))
+    return faces
 
 # -----------------------------------------------------------------------------
 # 6. 주사위 굴리기 애니메이션 및 결과 화면
@@ -129,13 +136,13 @@ if st.button("🎲 주사위 굴리기", type="primary"):
     curr_sign = st.session_state.sign_pill if st.session_state.sign_pill else "미포함"
     dice_count = st.session_state.dice_count if st.session_state.dice_count else 1
     
+    # 애니메이션의 모든 장면과 최종 결과에 쓸 주사위를 한 번에 뽑아 둡니다.
+    faces = [f"<small>{op}</small>{num}" for op, num in generate_dice_faces(curr_ops, curr_sign, (total_steps + 1) * dice_count)]
+    
     # 애니메이션(드르르륵 굴러가는 효과)
     for i in range(total_steps):
         # 주사위 개수만큼 결과 생성
-        temp_results = []
-        for _ in range(dice_count):
-            op, num = generate_dice_face(curr_ops, curr_sign)
-            temp_results.append(f"<small>{op}</small>{num}")
+        temp_results = faces[i * dice_count:(i + 1) * dice_count]
         
         with placeholder.container():
             if dice_count == 1:
@@ -153,11 +160,8 @@ if st.button("🎲 주사위 굴리기", type="primary"):
             time.sleep(current_delay)
 
     # 최종 결과 고정
-    final_results = []
-    for _ in range(dice_count):
-        op, num = generate_dice_face(curr_ops, curr_sign)
-        final_results.append(f"<small>{op}</small>{num}")
-    st.session_state.dice_result = final_results # 저장
+    final_results = faces[total_steps * dice_count:]
+    state.dice_result = final_results # 저장
     
     with placeholder.container():
         if dice_count == 1:
@@ -171,22 +175,22 @@ if st.button("🎲 주사위 굴리기", type="primary"):
 
 else:
     # 평상시(버튼 누르기 전) 화면
-    if st.session_state.dice_result is not None:
+    if state.dice_result is not None:
         dice_count = st.session_state.dice_count if st.session_state.dice_count else 1
-        result_count = len(st.session_state.dice_result)
+        result_count = len(state.dice_result)
         
         # 저장된 결과 개수가 현재 설정된 개수와 일치할 경우에만 표시
         if result_count == dice_count:
             if dice_count == 1:
-                st.markdown(f"<h1 style='text-align: center; font-size: 130px; padding: 40px 0;'>{st.session_state.dice_result[0]}</h1>", unsafe_allow_html=True)
+                st.markdown(f"<h1 style='text-align: center; font-size: 130px; padding: 40px 0;'>{state.dice_result[0]}</h1>", unsafe_allow_html=True)
             else:
                 cols = st.columns(dice_count)
                 for j, col in enumerate(cols):
                     with col:
-                        st.markdown(f"<h1 style='text-align: center; font-size: 100px; padding: 20px 0;'>{st.session_state.dice_result[j]}</h1>", unsafe_allow_html=True)
+                        st.markdown(f"<h1 style='text-align: center; font-size: 100px; padding: 20px 0;'>{state.dice_result[j]}</h1>", unsafe_allow_html=True)
         else:
             # 주사위 개수가 변경되었으므로 초기화
-            st.session_state.dice_result = None
+            state.dice_result = None
             st.markdown(f"<h1 style='text-align: center; font-size: 130px; padding: 40px 0;'>❔</h1>", unsafe_allow_html=True)
     else:
-        st.markdown(f"<h1 style='text-align: center; font-size: 130px; padding: 40px 0;'>❔</h1>", unsafe_allow_html=True)
\ No newline at end of file
+        st.markdown(f"<h1 style='text-align: center; font-size: 130px; padding: 40px 0;'>❔</h1>", unsafe_allow_html=True)
\ No newline at end of file
@@ -1,16 +1,20 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from utils import assets, lite, minify
 
 st.markdown("<h1 style='text-align: center; color: #d97706;'>성냥개비 퍼즐</h1>", unsafe_allow_html=True)
 
 # -------------------------------------------------------------------
 # 🌟 [최적화 핵심] 1. 파이썬 서버가 직접 파일 목록을 읽어옵니다.
 # (학생 폰에서 깃허브 API를 호출하지 않으므로 트래픽 차단 에러 100% 해결!)
+# 그림은 깃허브 대신 앱 서버가 저장소의 파일을 메모리에 올려 두고 ETag와 함께 내려줍니다.
 # -------------------------------------------------------------------
-GITHUB_RAW_BASE = "https://raw.githubusercontent.com/Math-DongDong/MathZip/main/기타/성냥개비퍼즐(54문제)"
+PUZZLE_DIR = "기타/성냥개비퍼즐(54문제)"
 
 # 1.PNG 부터 54.PNG 까지의 주소를 파이썬 리스트로 미리 만듭니다. 
-image_urls = [f"{GITHUB_RAW_BASE}/{i}.PNG" for i in range(1, 55)]
+# 가벼운 모드(utils.lite)에서는 크기와 색 수를 줄인 그림을 내려줍니다.
+image_dir = lite.small_images(PUZZLE_DIR) if lite.enabled() else PUZZLE_DIR
+image_urls = [assets.url(f"{image_dir}/{i}.PNG") for i in range(1, 55)]
 
 # 파이썬 리스트를 자바스크립트 배열 형식의 문자열로 변환합니다.
 js_image_urls = str(image_urls)
@@ -25,7 +29,7 @@ HTML = '''
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <script src="https://cdn.tailwindcss.com"></script>
+        <link rel="stylesheet" href="vendor:tailwind.css">
         <style>
             body { font-family: 'Segoe UI', sans-serif; background-color: #ffffff; color: #334155; margin: 0; }
             #drawCanvas {
@@ -293,8 +297,6 @@ HTML = '''
 '''
 
 # -------------------------------------------------------------------
-# 3. 렌더링 직전에 변수를 안전하게 치환(.replace)하여 에러를 막습니다!
+# 3. 변수 치환(___URLS___)과 HTML 줄이기는 서버 프로세스당 한 번만 하고 결과를 재사용합니다.
 # -------------------------------------------------------------------
-HTML = HTML.replace("___URLS___", js_image_urls)
-
-components.html(HTML, height=650, scrolling=True)
\ No newline at end of file
+components.html(minify.page_html("MatchstickPuzzle", HTML, {"___URLS___": js_image_urls}), height=650, scrolling=True)
\ No newline at end of file
@@ -1,14 +1,20 @@
 import streamlit as st
-import random
+from utils import events, metrics, rng
+from utils.state import page_state
+
+# 이 페이지의 세션 상태 (Pig Game의 game_over 등과 섞이지 않도록 이름공간을 나눕니다)
+# current_guess는 알약 버튼(st.pills)의 key라서 st.session_state에 둡니다.
+state = page_state("baseball")
 
 # -----------------------------------------------------------------------------
 # 2. 게임 로직 함수 정의
 # -----------------------------------------------------------------------------
 def generate_target_number(length):
+    r = rng.stream("baseball")
     digits = list("0123456789")
-    first_digit = random.choice(list("123456789"))
+    first_digit = r.choice(list("123456789"))
     digits.remove(first_digit)
-    rest_digits = random.sample(digits, length - 1)
+    rest_digits = r.sample(digits, length - 1)
     return first_digit + "".join(rest_digits)
 
 def check_guess(guess, target):
@@ -20,30 +26,30 @@ def check_guess(guess, target):
 # -----------------------------------------------------------------------------
 # 3. 세션 상태(Session State) 초기화
 # -----------------------------------------------------------------------------
-if 'target_number' not in st.session_state:
-    st.session_state.target_number = None
-if 'history' not in st.session_state:
-    st.session_state.history =[]
-if 'game_over' not in st.session_state:
-    st.session_state.game_over = False
-if 'digit_length' not in st.session_state:
-    st.session_state.digit_length = 4
+if 'target_number' not in state:
+    state.target_number = None
+if 'history' not in state:
+    state.history =[]
+if 'game_over' not in state:
+    state.game_over = False
+if 'digit_length' not in state:
+    state.digit_length = 4
 if 'current_guess' not in st.session_state:
     st.session_state.current_guess =[]
-if 'error_msg' not in st.session_state:
-    st.session_state.error_msg = "" # 경고 메시지를 담을 공간 추가
+if 'error_msg' not in state:
+    state.error_msg = "" # 경고 메시지를 담을 공간 추가
 
 def start_new_game(length=None):
     if length is None:
-        length = st.session_state.digit_length
-    st.session_state.target_number = generate_target_number(length)
-    st.session_state.history =[]
-    st.session_state.game_over = False
-    st.session_state.digit_length = length
+        length = state.digit_length
+    state.target_number = generate_target_number(length)
+    state.history =[]
+    state.game_over = False
+    state.digit_length = length
     st.session_state.current_guess =[]
-    st.session_state.error_msg = ""
+    state.error_msg = ""
 
-if st.session_state.target_number is None:
+if state.target_number is None:
     start_new_game()
 
 # ⭐ [핵심 해결책] 확인 버튼을 눌렀을 때 실행될 콜백(Callback) 함수
@@ -52,20 +58,51 @@ def handle_submit():
     user_guess = "".join(st.session_state.current_guess)
     
     # 2. 자릿수 검사
-    if len(user_guess) != st.session_state.digit_length:
-        st.session_state.error_msg = f"⚠️ {st.session_state.digit_length}개의 숫자를 모두 선택해 주세요!"
+    if len(user_guess) != state.digit_length:
+        state.error_msg = f"⚠️ {state.digit_length}개의 숫자를 모두 선택해 주세요!"
     else:
         # 3. 정상 입력 시 로직 처리
-        st.session_state.error_msg = "" # 에러 메시지 초기화
-        s, b, o = check_guess(user_guess, st.session_state.target_number)
-        st.session_state.history.append((user_guess, s, b, o))
+        state.error_msg = "" # 에러 메시지 초기화
+        s, b, o = check_guess(user_guess, state.target_number)
+        state.history.append((user_guess, s, b, o))
+        events.log("baseball", "guess", level=f"{state.digit_length}자리", value=user_guess,
+                   correct=(s == state.digit_length))
         
-        if s == st.session_state.digit_length:
-            st.session_state.game_over = True
+        if s == state.digit_length:
+            state.game_over = True
             
         # 4. 화면을 그리기 전에 알약 버튼 상태를 미리 비워줌 (에러 방지!)
         st.session_state.current_guess =[]
 
+# 숫자 디스플레이와 알약 버튼은 fragment라서 알약을 누를 때마다 이 부분만 다시 실행합니다.
+# 확인 버튼은 fragment 밖에 있으므로 누르면 기록까지 페이지 전체를 다시 그립니다.
+@metrics.fragment("숫자야구 › 입력")
+def guess_input():
+    if not state.game_over:
+        # 1. 큼직한 실시간 숫자 디스플레이
+        current_selection = st.session_state.current_guess
+        if current_selection:
+            display_text = " ".join(current_selection)
+            st.markdown(f"<h1 style='text-align: center; color: #1E88E5; letter-spacing: 15px; font-size: 50px;'>{display_text}</h1>", unsafe_allow_html=True)
+        else:
+            placeholder_text = "_ " * state.digit_length
+            st.markdown(f"<h1 style='text-align: center; color: #B0BEC5; letter-spacing: 15px; font-size: 50px;'>{placeholder_text}</h1>", unsafe_allow_html=True)
+    
+        # 2. 에러 메시지 표시 로직 (콜백 함수에서 발생한 메시지 띄우기)
+        if state.error_msg:
+            st.error(state.error_msg)
+            # 한 번 보여준 에러 메시지는 다음 행동 시 지워지도록 초기화
+            state.error_msg = ""
+    
+        # 3. 터치형 알약 버튼
+        st.pills(
+            f"👇 {state.digit_length}개의 숫자를 선택하세요:",
+            options=[str(i) for i in range(10)],
+            selection_mode="multi",
+            key="current_guess"
+        )
+
+
 # -----------------------------------------------------------------------------
 # 4. 화면 레이아웃 구성
 # -----------------------------------------------------------------------------
@@ -86,39 +123,18 @@ bot_left, bot_right = st.columns([0.3,0.7])
 
 # 하단 왼쪽: 숫자 입력란 (실시간 디스플레이 + st.pills)
 with bot_left:
-    st.subheader(f"🎯 {st.session_state.digit_length}자리 숫자 입력")
+    st.subheader(f"🎯 {state.digit_length}자리 숫자 입력")
 
     with st.popover("🎮 게임 설정 열기"):
-        idx = st.session_state.digit_length - 4 
+        idx = state.digit_length - 4 
         selected_length = st.radio("몇 자리 숫자로 할까요?", (4, 5, 6), index=idx, horizontal=True)
         if st.button("🔄 새 게임 시작", type="primary", use_container_width=True):
             start_new_game(selected_length)
             st.rerun()
 
-    if not st.session_state.game_over:
-        # 1. 큼직한 실시간 숫자 디스플레이
-        current_selection = st.session_state.current_guess
-        if current_selection:
-            display_text = " ".join(current_selection)
-            st.markdown(f"<h1 style='text-align: center; color: #1E88E5; letter-spacing: 15px; font-size: 50px;'>{display_text}</h1>", unsafe_allow_html=True)
-        else:
-            placeholder_text = "_ " * st.session_state.digit_length
-            st.markdown(f"<h1 style='text-align: center; color: #B0BEC5; letter-spacing: 15px; font-size: 50px;'>{placeholder_text}</h1>", unsafe_allow_html=True)
-        
-        # 2. 에러 메시지 표시 로직 (콜백 함수에서 발생한 메시지 띄우기)
-        if st.session_state.error_msg:
-            st.error(st.session_state.error_msg)
-            # 한 번 보여준 에러 메시지는 다음 행동 시 지워지도록 초기화
-            st.session_state.error_msg = ""
-        
-        # 3. 터치형 알약 버튼
-        st.pills(
-            f"👇 {st.session_state.digit_length}개의 숫자를 선택하세요:",
-            options=[str(i) for i in range(10)],
-            selection_mode="multi",
-            key="current_guess"
-        )
-        
+    guess_input()
+
+    if not state.game_over:
         # 4. 입력 완료 버튼 (⭐⭐⭐ on_click 옵션 추가 ⭐⭐⭐)
         st.button(
             "확인 (입력 완료)", 
@@ -135,17 +151,17 @@ with bot_left:
 with bot_right:
     st.subheader("📝 입력 결과 기록")
     
-    if st.session_state.game_over:
+    if state.game_over:
         st.balloons()
-        st.success(f"🎊 {len(st.session_state.history)}번 만에 정답 {st.session_state.target_number}을(를) 맞추셨습니다!")
+        st.success(f"🎊 {len(state.history)}번 만에 정답 {state.target_number}을(를) 맞추셨습니다!")
     
-    if not st.session_state.history:
+    if not state.history:
         st.caption("아직 입력한 기록이 없습니다.")
     else:
         col_left, col_right = st.columns(2)
         
-        for idx, (guess, s, b, o) in enumerate(reversed(st.session_state.history)):
-            attempt_num = len(st.session_state.history) - idx
+        for idx, (guess, s, b, o) in enumerate(reversed(state.history)):
+            attempt_num = len(state.history) - idx
             
             result_text = f"**`{attempt_num}번째`**  {guess} : "
             if s > 0: result_text += f"🟢 **{s}S** "
@@ -1,11 +1,21 @@
 # pig_game_app_v14_final_header_size_fix.py
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import random
+import io
 import time
-import plotly.graph_objects as go
+from utils import events, lite, metrics, prewarm, rng
+from utils.state import page_state
+
+# app.py가 서버 시작 시 미리 불러 둔 모듈을 받아 씁니다.
+pd = prewarm.module("pandas")
+go = prewarm.module("plotly.graph_objects")
+
+# 이 페이지의 세션 상태 (숫자야구의 game_over 등과 섞이지 않도록 이름공간을 나눕니다)
+# 오래 쉬면 점수판과 주사위 통계만 남기고, 진행 중이던 턴은 정리합니다.
+state = page_state("pig", keep=(
+    "num_players", "winning_score", "player_names", "player_scores",
+    "current_player", "game_over", "winner", "roll_counts",
+))
 
 # [핵심 수정] .stats-header의 font-size 값을 .stats-cell과 유사한 수준으로 키워 균형을 맞춥니다.
 st.markdown("""
@@ -36,7 +46,7 @@ st.markdown("""
 st.title("🐷 Pig Game")
 
 # --- 2. 상단 게임 설정 패널 ---
-with st.expander("⚙️ 게임 설정 및 진행 방법 열기", expanded=('player_scores' not in st.session_state)):
+with st.expander("⚙️ 게임 설정 및 진행 방법 열기", expanded=('player_scores' not in state)):
     with st.form(key="game_setup_form",border=False):
         col1, col2 = st.columns(2)
         with col1:
@@ -56,103 +66,139 @@ with st.expander("⚙️ 게임 설정 및 진행 방법 열기", expanded=('pla
         submitted = st.form_submit_button("🚀 새 게임 시작")
         
         if submitted:
-            st.session_state.num_players = num_players
-            st.session_state.winning_score = winning_score
-            st.session_state.player_names = [f"{i+1}모둠" for i in range(num_players)]
-            st.session_state.player_scores = [0] * num_players
-            st.session_state.current_player = 0
-            st.session_state.pending_score = 0
-            st.session_state.last_roll = "🐷"
-            st.session_state.game_over = False
-            st.session_state.winner = None
-            # roll_history는 유지 (첫 게임일 때만 초기화)
-            if 'roll_history' not in st.session_state:
-                st.session_state.roll_history = []
-            st.session_state.turn_over_message = ""
+            state.num_players = num_players
+            state.winning_score = winning_score
+            state.player_names = [f"{i+1}모둠" for i in range(num_players)]
+            state.player_scores = [0] * num_players
+            state.current_player = 0
+            state.pending_score = 0
+            state.last_roll = "🐷"
+            state.game_over = False
+            state.winner = None
+            # 주사위 눈별 횟수는 유지 (첫 게임일 때만 초기화). 던진 기록 전체 대신 6칸만 저장합니다.
+            if 'roll_counts' not in state:
+                state.roll_counts = [0] * 6
+            state.turn_over_message = ""
             st.rerun()
 
 
 # --- 3. 핵심 게임 로직 함수 ---
 def next_turn():
-    st.session_state.current_player = (st.session_state.current_player + 1) % st.session_state.num_players
-    st.session_state.pending_score = 0
-    st.session_state.last_roll = "🐷"
+    state.current_player = (state.current_player + 1) % state.num_players
+    state.pending_score = 0
+    state.last_roll = "🐷"
+    state.turn_ended = True
     time.sleep(0.5) 
 
 def roll_dice():
-    roll = random.randint(1, 6)
-    st.session_state.last_roll = roll
-    st.session_state.roll_history.append(roll)
+    roll = rng.stream("pig").roll()
+    state.last_roll = roll
+    events.log("pig", "roll", player=state.player_names[state.current_player], value=roll)
+    state.roll_counts[roll - 1] += 1
     if roll == 1:
-        st.session_state.pending_score = 0
-        st.session_state.turn_over_message = f"앗! 1이 나왔습니다. 점수를 모두 잃고 턴이 넘어갑니다."
+        state.pending_score = 0
+        state.turn_over_message = f"앗! 1이 나왔습니다. 점수를 모두 잃고 턴이 넘어갑니다."
         next_turn()
     else:
-        st.session_state.pending_score += roll
-        st.session_state.turn_over_message = ""
+        state.pending_score += roll
+        state.turn_over_message = ""
 
 def hold():
-    current_player_idx = st.session_state.current_player
-    st.session_state.player_scores[current_player_idx] += st.session_state.pending_score
-    st.session_state.turn_over_message = f"{st.session_state.pending_score}점을 획득했습니다!"
-    if st.session_state.player_scores[current_player_idx] >= st.session_state.winning_score:
-        st.session_state.game_over = True
-        st.session_state.winner = st.session_state.player_names[current_player_idx]
+    current_player_idx = state.current_player
+    events.log("pig", "hold", player=state.player_names[current_player_idx], value=state.pending_score)
+    state.player_scores[current_player_idx] += state.pending_score
+    state.turn_over_message = f"{state.pending_score}점을 획득했습니다!"
+    if state.player_scores[current_player_idx] >= state.winning_score:
+        state.game_over = True
+        state.winner = state.player_names[current_player_idx]
+        state.turn_ended = True
+        events.log("pig", "game_over", player=state.winner, value=state.player_scores[current_player_idx])
     else:
         next_turn()
 
+def ratio_png(roll_ratio):
+    """주사위 눈의 비율 그래프를 PNG로 (가벼운 모드용). 글자는 눈 번호와 비율 숫자만 씁니다."""
+    plt = prewarm.module("matplotlib.pyplot")
+    fig, ax = plt.subplots(figsize=(4, 2.4), dpi=80)
+    ax.plot(roll_ratio.index, roll_ratio.values, marker='o')
+    ax.set_xticks(list(roll_ratio.index)); ax.set_ylim(0, 1)
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    plt.close(fig)
+    return buffer.getvalue()
+
 # --- 4. 메인 UI 렌더링 ---
-if 'player_scores' not in st.session_state:
-    st.info("👆 상단의 '게임 설정' 패널에서 설정을 마친 후 '새 게임 시작' 버튼을 눌러주세요.")
-else:
-    active_player_name = st.session_state.player_names[st.session_state.current_player]
-    if st.session_state.game_over:
+# 오래 쉬어 점수판만 남은 경우 진행 중이던 턴 값을 처음 상태로 채웁니다.
+if 'player_scores' in state:
+    state.setdefault('pending_score', 0)
+    state.setdefault('last_roll', "🐷")
+    state.setdefault('turn_over_message', "")
+
+# 주사위 판과 점수판은 fragment라서 '주사위 던지기'는 이 부분만 다시 실행합니다.
+# 아래 주사위 통계는 차례가 끝날 때(1이 나오거나 그만하기, 게임 종료) 페이지 전체와 함께 갱신합니다.
+@metrics.fragment("Pig Game › 주사위 판")
+def game_board():
+    if state.pop('turn_ended', False):
+        st.rerun()
+
+    active_player_name = state.player_names[state.current_player]
+    if state.game_over:
         st.balloons(); 
-        st.success(f"🎉 **게임 종료! 승자는 {st.session_state.winner} 입니다!** 🎉  새 게임을 시작하려면 상단 설정 패널에서 '새 게임 시작' 버튼을 누르세요.")
+        st.success(f"🎉 **게임 종료! 승자는 {state.winner} 입니다!** 🎉  새 게임을 시작하려면 상단 설정 패널에서 '새 게임 시작' 버튼을 누르세요.")
    
     main_col1, main_col2 = st.columns([0.3, 0.7])
     with main_col1:
-        st.markdown(f"<p style='text-align: center; font-size: 110px; font-weight: bold; margin: 0; line-height: 1;'>{st.session_state.last_roll}</p>", unsafe_allow_html=True)
-        st.metric(label="이번 라운드 점수", value=f"{st.session_state.pending_score} 점")
+        st.markdown(f"<p style='text-align: center; font-size: 110px; font-weight: bold; margin: 0; line-height: 1;'>{state.last_roll}</p>", unsafe_allow_html=True)
+        st.metric(label="이번 라운드 점수", value=f"{state.pending_score} 점")
         btn_cols = st.columns(2)
-        with btn_cols[0]: st.button("주사위 던지기", on_click=roll_dice, width='stretch', disabled=st.session_state.game_over)
-        with btn_cols[1]: st.button("그만하기", on_click=hold, width='stretch', disabled=st.session_state.game_over)
+        with btn_cols[0]: st.button("주사위 던지기", on_click=roll_dice, width='stretch', disabled=state.game_over)
+        with btn_cols[1]: st.button("그만하기", on_click=hold, width='stretch', disabled=state.game_over)
 
     with main_col2:
         st.subheader(f"scoreboard - 현재 **{active_player_name}**")
-        score_cols = st.columns(st.session_state.num_players)
+        score_cols = st.columns(state.num_players)
         
         for i, col in enumerate(score_cols):
             with col:
-                is_current_player = (i == st.session_state.current_player)
-                player_name = st.session_state.player_names[i]
+                is_current_player = (i == state.current_player)
+                player_name = state.player_names[i]
                 header_text = f"👑 {player_name}" if is_current_player else player_name
                 st.markdown(f"**{header_text}**")
-                player_score = st.session_state.player_scores[i]
-                delta_score = st.session_state.pending_score if is_current_player and not st.session_state.game_over else 0
+                player_score = state.player_scores[i]
+                delta_score = state.pending_score if is_current_player and not state.game_over else 0
                 st.metric(label="총 점수", value=player_score, delta=f"{delta_score} 점" if delta_score > 0 else None)
-        if st.session_state.turn_over_message: st.info(st.session_state.turn_over_message)
+        if state.turn_over_message: st.info(state.turn_over_message)
+
+
+if 'player_scores' not in state:
+    st.info("👆 상단의 '게임 설정' 패널에서 설정을 마친 후 '새 게임 시작' 버튼을 눌러주세요.")
+else:
+    state.pop('turn_ended', None)
+    game_board()
 
     stats_col1, stats_col2 = st.columns(2)
 
     with stats_col1:
         st.subheader("📊 주사위 눈의 비율")
-        if st.session_state.roll_history:
-            roll_counts = pd.Series(st.session_state.roll_history).value_counts()
-            full_counts = pd.Series(index=range(1, 7), data=0, dtype=int); full_counts.update(roll_counts)
-            total_rolls = len(st.session_state.roll_history)
+        if sum(state.roll_counts):
+            full_counts = pd.Series(index=range(1, 7), data=state.roll_counts, dtype=int)
+            total_rolls = int(full_counts.sum())
             roll_ratio = full_counts / total_rolls
-            fig = go.Figure(); fig.add_trace(go.Scatter(x=roll_ratio.index, y=roll_ratio.values, mode='lines+markers', name='비율', line_shape='spline'))
-            fig.update_layout(xaxis_title="주사위 눈", yaxis_title="비율", yaxis_range=[0, 1],height=300,margin=dict(l=0, r=0, t=0, b=0)); st.plotly_chart(fig, width='stretch')
+            if lite.enabled():
+                # 가벼운 모드(utils.lite): Plotly 차트 대신 작은 PNG 한 장
+                st.image(ratio_png(roll_ratio), width='stretch')
+            else:
+                fig = go.Figure(); fig.add_trace(go.Scatter(x=roll_ratio.index, y=roll_ratio.values, mode='lines+markers', name='비율', line_shape='spline'))
+                fig.update_layout(xaxis_title="주사위 눈", yaxis_title="비율", yaxis_range=[0, 1],height=300,margin=dict(l=0, r=0, t=0, b=0)); st.plotly_chart(fig, width='stretch')
         else: 
             st.caption("아직 주사위를 던지지 않았습니다.")
 
     with stats_col2:
         st.subheader("📈 주사위 눈의 통계표")
-        if st.session_state.roll_history:
-            roll_counts = pd.Series(st.session_state.roll_history).value_counts()
-            full_counts = pd.Series(index=range(1, 7), data=0, dtype=int); full_counts.update(roll_counts)
-            total_rolls = len(st.session_state.roll_history)
+        if sum(state.roll_counts):
+            full_counts = pd.Series(index=range(1, 7), data=state.roll_counts, dtype=int)
+            total_rolls = int(full_counts.sum())
             roll_ratio = full_counts / total_rolls
 
             header_cols = st.columns([1, 1, 1, 1, 1, 1, 1])
@@ -1,5 +1,10 @@
 import streamlit as st
-import random # 각 탭에서 중복 import하는 대신 맨 위로 이동
+from utils import assets, events, lite, metrics, prewarm, rng
+from utils.state import page_state
+from utils.streams import room, scoring, solver, tiles
+
+# 이 페이지의 세션 상태 (다른 페이지의 draw_count 등과 섞이지 않도록 이름공간을 나눕니다)
+state = page_state("streams")
 
 # --- [핵심 수정] 스타일 정의를 맨 위로 통합 ---
 # 이 스타일은 앱 전체의 모든 탭에 적용됩니다.
@@ -18,13 +23,14 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# 게임판 PDF 파일 읽기
-pdf_path = "./기타/스트림스_게임판.pdf"
+VIDEO_URL = "https://youtu.be/gq4UmK0MRbE?si=caJJ4gh-hdnC8OvL"
+
+# 게임판 PDF 파일 읽기 (프로세스당 한 번 읽어 두고, 파일이 바뀌었을 때만 다시 읽습니다)
+pdf_path = "기타/스트림스_게임판.pdf"
 PDFbyte = None
 # 파일이 없을 경우를 대비해 try-except 구문으로 감싸는 것이 더 안정적입니다.
 try:
-    with open(pdf_path, "rb") as pdf_file:
-        PDFbyte = pdf_file.read()
+    PDFbyte = assets.read(pdf_path)
 except FileNotFoundError:
     # PDF 파일이 없어도 앱이 멈추지 않도록 처리
     pass
@@ -32,11 +38,15 @@ except FileNotFoundError:
 st.title("🔢 스트림스")
 
 # --- 탭 구성 ---
-tabs = st.tabs(["게임방법", "기본 버전", "정수 버전", "유리수 버전"])
+tabs = st.tabs(["게임방법", "기본 버전", "정수 버전", "유리수 버전", "점수 계산", "교실 방", "타일 직접 만들기"])
 
 # --- 1. 게임방법 탭 ---
 with tabs[0]:
-    st.video("https://youtu.be/gq4UmK0MRbE?si=caJJ4gh-hdnC8OvL")
+    # 가벼운 모드(utils.lite)에서는 영상을 페이지에 넣지 않고 링크만 둡니다.
+    if lite.enabled():
+        st.link_button("▶️ 게임 방법 영상 보기 (YouTube)", VIDEO_URL)
+    else:
+        st.video(VIDEO_URL)
     if PDFbyte:
         st.download_button(
             label="게임판 다운로드",
@@ -47,170 +57,201 @@ with tabs[0]:
     else:
         st.warning("게임판 PDF 파일('스트림스_게임판.pdf')을 찾을 수 없습니다.")
 
+# 탭 2~7은 fragment입니다. 뽑기, 다시하기, ⭐ 카드 체크는 그 탭만 다시 실행하고
+# 다른 탭(영상, 게임판 PDF 포함)은 그대로 둡니다.
+
+# 20개를 모두 뽑으면 각 탭 아래에 보여 주는 "최고의 게임판" (utils.streams.solver)
+def show_board(board, latex=False):
+    cells = ["·" if tile is None else (f"${tile}$" if latex and tile != "⭐" else str(tile)) for tile in board]
+    st.markdown(" | ".join(cells))
+
+
+def best_board_panel(version, drawn, low, high, latex=False):
+    # low/high: 타일 묶음의 가장 작은/큰 값 (비례 배치의 기준). 게임판은 SLOTS칸이라 그만큼만 씁니다.
+    drawn = list(drawn[:scoring.SLOTS])
+    best_score, best = solver.best_board(drawn)
+    rule_score, rule = solver.proportional_board(drawn, low, high)
+    with st.expander("🏅 최고의 게임판과 비교하기", expanded=True):
+        st.markdown(f"**순서를 미리 알았다면 {best_score}점** — 뽑힌 수를 작은 것부터 차례로 놓은 판입니다.")
+        show_board(best, latex)
+        st.markdown(f"**미리 모르고 비례 배치로 놓았다면 {rule_score}점** — 수가 나올 때마다, 흐름이 깨지지 않는 빈칸 중 "
+                    "양옆 수 사이의 비율만큼 떨어진 칸에 놓은 판입니다.")
+        show_board(rule, latex)
+        mine = st.text_input("내 게임판 (20칸을 쉼표로, 빈칸은 비워 두기)", key=f"my_board_{version}",
+                             placeholder="예: 3, 5, 7, ⭐, 12, ...")
+        if mine.strip():
+            try:
+                my_score = scoring.score(mine.split(","))
+            except ValueError as error:
+                st.error(f"읽을 수 없는 칸이 있습니다. {error}")
+            else:
+                st.metric("내 점수", f"{my_score}점", delta=f"{my_score - rule_score:+d}점 (비례 배치와 비교)")
+
+
 # --- 2. 기본 버전 탭 ---
-with tabs[1]:
-    def initialize_game(joker=False):
-        number_pool = []
-        number_pool.extend(list(range(1, 11)))
-        number_pool.extend(list(range(11, 21)))
-        number_pool.extend(list(range(11, 21)))
-        number_pool.extend(list(range(21, 31)))
-        if joker:
-            number_pool.append("⭐")
-        random.shuffle(number_pool)
-        st.session_state.pool = number_pool
-        st.session_state.draw_count = 0
-        st.session_state.current_number = "❔"
-        st.session_state.drawn_history = []
-        st.session_state.last_joker_base = joker
+def initialize_game(joker=False):
+    # 타일 묶음은 교실 방, 전략 대결과 함께 씁니다 (utils.streams.tiles). 뽑을 때는 pool.draw().
+    state.pool = tiles.BASE.with_joker(joker).shuffled(rng.stream("streams"))
+    state.draw_count = 0
+    state.current_number = "❔"
+    state.drawn_history = []
+    state.last_joker_base = joker
+
 
+@metrics.fragment("스트림스 › 기본 버전")
+def base_version():
     if 'joker_base' not in st.session_state:
         st.session_state.joker_base = False
 
-    if 'pool' not in st.session_state:
+    if 'pool' not in state:
         initialize_game(st.session_state.joker_base)
 
     # 첫 번째 뽑기 전까지만 조커 체크박스 토글이 반영되도록 (풀 재생성)
-    if st.session_state.draw_count == 0 and st.session_state.get('last_joker_base') != st.session_state.joker_base:
+    if state.draw_count == 0 and state.get('last_joker_base') != st.session_state.joker_base:
         initialize_game(st.session_state.joker_base)
 
     col1, col_spacer, col2 = st.columns([1,2,1])
     with col1:
         if st.button("  처음부터 다시하기  ", type="primary",width='stretch', key="restart_base"):
             initialize_game(st.session_state.joker_base)
-            st.rerun()
+            # 체크박스와 뽑기 버튼, 숫자판은 모두 이 아래에서 그려지므로 다시 실행할 필요가 없습니다.
     with col_spacer:
-        st.checkbox("⭐ 카드 추가", key="joker_base", disabled=(st.session_state.draw_count > 0))
+        st.checkbox("⭐ 카드 추가", key="joker_base", disabled=(state.draw_count > 0))
     with col2:
-        is_disabled = (st.session_state.draw_count >= 19)
+        # 버튼은 이번 뽑기 전에 그려지므로 disabled는 한 번 늦습니다. 20개 제한은 누른 뒤에 확인합니다.
+        is_disabled = (state.draw_count >= scoring.SLOTS)
         if st.button("다음 숫자 뽑기", disabled=is_disabled, width='stretch', key="draw_base"):
-            if st.session_state.pool:
-                st.session_state.draw_count += 1
-                new_number = st.session_state.pool.pop()
-                st.session_state.current_number = new_number
-                st.session_state.drawn_history.append(new_number)
-    if st.session_state.draw_count == 0:
+            if state.draw_count < scoring.SLOTS and state.pool:
+                state.draw_count += 1
+                new_number = state.pool.draw().label
+                state.current_number = new_number
+                state.drawn_history.append(new_number)
+                events.log("streams", "draw", level="기본", value=new_number)
+    if state.draw_count == 0:
         st.header("첫 번째 숫자를 뽑아주세요.")
-    elif st.session_state.draw_count >= 20:
+    elif state.draw_count >= 20:
         st.header("🏁 숫자를 모두 뽑았습니다! 🏁")
     else:
-        st.header(f"{st.session_state.draw_count}번째 숫자")
-    st.markdown(f"<p style='text-align: center; font-size: 150px; font-weight: bold;'>{st.session_state.current_number}</p>", unsafe_allow_html=True)
+        st.header(f"{state.draw_count}번째 숫자")
+    st.markdown(f"<p style='text-align: center; font-size: 150px; font-weight: bold;'>{state.current_number}</p>", unsafe_allow_html=True)
     st.divider()
     rule_text = "ℹ️ **숫자 타일 구성:** 1 ~ 10 (각 1개), 11 ~ 20 (각 2개), 21 ~ 30 (각 1개)"
     history_title = "**※ 지금까지 뽑은 숫자들:**"
-    if st.session_state.drawn_history:
-        history_values = "  ➡️  ".join(map(str, st.session_state.drawn_history))
+    if state.drawn_history:
+        history_values = "  ➡️  ".join(map(str, state.drawn_history))
     else:
         history_values = "아직 뽑은 숫자가 없습니다."
     info_box_content = f"""{rule_text}\n---\n{history_title} {history_values}"""
     st.info(info_box_content)
+    if state.draw_count >= 20:
+        best_board_panel("base", state.drawn_history, tiles.BASE.low, tiles.BASE.high)
+
+with tabs[1]:
+    base_version()
 
 # --- 3. 정수 버전 탭 ---
-with tabs[2]:
-    def initialize_game_Z(joker=False):
-        number_pool = []
-        number_pool.extend(list(range(-15, -4)))
-        for num in range(-4, 5):
-            number_pool.extend([num] * 2)
-        number_pool.extend(list(range(5, 16)))
-        if joker:
-            number_pool.append("⭐")
-        random.shuffle(number_pool)
-        st.session_state.pool_Z = number_pool
-        st.session_state.draw_count_Z = 0
-        st.session_state.current_number_Z = "❔"
-        st.session_state.drawn_history_Z = []
-        st.session_state.last_joker_Z = joker
+def initialize_game_Z(joker=False):
+    state.pool_Z = tiles.INTEGER.with_joker(joker).shuffled(rng.stream("streams"))
+    state.draw_count_Z = 0
+    state.current_number_Z = "❔"
+    state.drawn_history_Z = []
+    state.last_joker_Z = joker
+
 
+@metrics.fragment("스트림스 › 정수 버전")
+def integer_version():
     if 'joker_Z' not in st.session_state:
         st.session_state.joker_Z = False
 
-    if 'pool_Z' not in st.session_state:
+    if 'pool_Z' not in state:
         initialize_game_Z(st.session_state.joker_Z)
 
-    if st.session_state.draw_count_Z == 0 and st.session_state.get('last_joker_Z') != st.session_state.joker_Z:
+    if state.draw_count_Z == 0 and state.get('last_joker_Z') != st.session_state.joker_Z:
         initialize_game_Z(st.session_state.joker_Z)
 
     col1, col_spacer, col2 = st.columns([1,2,1])
     with col1:
         if st.button("  처음부터 다시하기  ", type="primary",width='stretch', key="restart_Z"):
             initialize_game_Z(st.session_state.joker_Z)
-            st.rerun()
+            # 체크박스와 뽑기 버튼, 숫자판은 모두 이 아래에서 그려지므로 다시 실행할 필요가 없습니다.
     with col_spacer:
-        st.checkbox("⭐ 카드 추가", key="joker_Z", disabled=(st.session_state.draw_count_Z > 0))
+        st.checkbox("⭐ 카드 추가", key="joker_Z", disabled=(state.draw_count_Z > 0))
 
     with col2:
-        is_disabled = (st.session_state.draw_count_Z >= 19)
+        is_disabled = (state.draw_count_Z >= scoring.SLOTS)
         if st.button("다음 정수 뽑기", disabled=is_disabled, width='stretch', key="draw_Z"):
-            if st.session_state.pool_Z:
-                st.session_state.draw_count_Z += 1
-                new_number = st.session_state.pool_Z.pop()
-                st.session_state.current_number_Z = new_number
-                st.session_state.drawn_history_Z.append(new_number)
-    if st.session_state.draw_count_Z == 0:
+            if state.draw_count_Z < scoring.SLOTS and state.pool_Z:
+                state.draw_count_Z += 1
+                new_number = state.pool_Z.draw().label
+                state.current_number_Z = new_number
+                state.drawn_history_Z.append(new_number)
+                events.log("streams", "draw", level="정수", value=new_number)
+    if state.draw_count_Z == 0:
         st.header("첫 번째 정수를 뽑아주세요.")
-    elif st.session_state.draw_count_Z >= 20:
+    elif state.draw_count_Z >= 20:
         st.header("🏁 20개의 정수를 모두 뽑았습니다! 🏁")
     else:
-        st.header(f"{st.session_state.draw_count_Z}번째 정수")
-    st.markdown(f"<p style='text-align: center; font-size: 150px; font-weight: bold;'>{st.session_state.current_number_Z}</p>", unsafe_allow_html=True)
+        st.header(f"{state.draw_count_Z}번째 정수")
+    st.markdown(f"<p style='text-align: center; font-size: 150px; font-weight: bold;'>{state.current_number_Z}</p>", unsafe_allow_html=True)
     st.divider()
     rule_text = "ℹ️ **정수 타일 구성:** -15 ~ -5 (각 1개), -4 ~ 4 (각 2개), 5 ~ 15 (각 1개)"
     history_title = "**※ 지금까지 뽑은 정수들:**"
-    if st.session_state.drawn_history_Z:
-        history_values = "  ➡️  ".join(map(str, st.session_state.drawn_history_Z))
+    if state.drawn_history_Z:
+        history_values = "  ➡️  ".join(map(str, state.drawn_history_Z))
     else:
         history_values = "아직 뽑은 정수가 없습니다."
     info_box_content = f"""{rule_text}\n---\n{history_title} {history_values}"""
     st.info(info_box_content)
+    if state.draw_count_Z >= 20:
+        best_board_panel("Z", state.drawn_history_Z, tiles.INTEGER.low, tiles.INTEGER.high)
+
+with tabs[2]:
+    integer_version()
 
 # --- 4. 유리수 버전 탭 ---
-with tabs[3]:
-    def initialize_game_Q(joker=False):
-        number_pool = []
-        for i in range(1, 7): number_pool.append(f"\\frac{{{i}}}{{2}}"); number_pool.append(f"-\\frac{{{i}}}{{2}}")
-        number_pool.extend(["2.7", "-2.7"])
-        number_pool.extend(["\\frac{5}{3}", "-\\frac{5}{3}", "\\frac{4}{3}", "-\\frac{4}{3}", "\\frac{2}{3}", "-\\frac{2}{3}", "\\frac{1}{3}", "-\\frac{1}{3}", "0","\\frac{1}{2}","\\frac{3}{2}","\\frac{5}{2}","-\\frac{1}{2}","-\\frac{3}{2}","-\\frac{5}{2}"])
-        if joker:
-            number_pool.append("⭐")
-        random.shuffle(number_pool)
-        st.session_state.pool_Q, st.session_state.draw_count_Q, st.session_state.current_number_Q, st.session_state.drawn_history_Q = number_pool, 0, "❔", []
-        st.session_state.last_joker_Q = joker
+def initialize_game_Q(joker=False):
+    number_pool = tiles.RATIONAL.with_joker(joker).shuffled(rng.stream("streams"))
+    state.pool_Q, state.draw_count_Q, state.current_number_Q, state.drawn_history_Q = number_pool, 0, "❔", []
+    state.last_joker_Q = joker
+
+
+@metrics.fragment("스트림스 › 유리수 버전")
+def rational_version():
     if 'joker_Q' not in st.session_state:
         st.session_state.joker_Q = False
 
-    if 'pool_Q' not in st.session_state:
+    if 'pool_Q' not in state:
         initialize_game_Q(st.session_state.joker_Q)
 
     # 첫 번째 뽑기 전까지만 조커 체크박스 토글이 반영되도록 (풀 재생성)
-    if st.session_state.draw_count_Q == 0 and st.session_state.get('last_joker_Q') != st.session_state.joker_Q:
+    if state.draw_count_Q == 0 and state.get('last_joker_Q') != st.session_state.joker_Q:
         initialize_game_Q(st.session_state.joker_Q)
 
     col1, col_spacer, col2 = st.columns([1,2,1])
     with col1:
         if st.button("  처음부터 다시하기  ", type="primary", width='stretch', key="restart_Q"):
             initialize_game_Q(st.session_state.joker_Q)
-            st.rerun()
+            # 체크박스와 뽑기 버튼, 숫자판은 모두 이 아래에서 그려지므로 다시 실행할 필요가 없습니다.
     with col_spacer:   
-        st.checkbox("⭐ 카드 추가", key="joker_Q", disabled=(st.session_state.draw_count_Q > 0))
+        st.checkbox("⭐ 카드 추가", key="joker_Q", disabled=(state.draw_count_Q > 0))
     with col2:
-        is_disabled = (st.session_state.draw_count_Q >= 19)
+        is_disabled = (state.draw_count_Q >= scoring.SLOTS)
         if st.button("다음 유리수 뽑기", disabled=is_disabled, width='stretch', key="draw_Q"):
-            if st.session_state.pool_Q:
-                st.session_state.draw_count_Q += 1
-                new_number = st.session_state.pool_Q.pop()
-                st.session_state.current_number_Q = new_number
-                st.session_state.drawn_history_Q.append(new_number)
+            if state.draw_count_Q < scoring.SLOTS and state.pool_Q:
+                state.draw_count_Q += 1
+                new_number = state.pool_Q.draw().label
+                state.current_number_Q = new_number
+                state.drawn_history_Q.append(new_number)
+                events.log("streams", "draw", level="유리수", value=new_number)
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        if st.session_state.draw_count_Q == 0: st.header("첫 번째 유리수를 뽑아주세요.")
-        elif st.session_state.draw_count_Q >= 20: st.header("🏁 모든 유리수를 뽑았습니다! 🏁")
-        else: st.header(f"{st.session_state.draw_count_Q}번째 유리수")
-        if st.session_state.current_number_Q in ("❔", "⭐"):
-            st.markdown(f"<p style='text-align: center; font-size: 150px; font-weight: bold;'>{st.session_state.current_number_Q}</p>", unsafe_allow_html=True)
+        if state.draw_count_Q == 0: st.header("첫 번째 유리수를 뽑아주세요.")
+        elif state.draw_count_Q >= 20: st.header("🏁 모든 유리수를 뽑았습니다! 🏁")
+        else: st.header(f"{state.draw_count_Q}번째 유리수")
+        if state.current_number_Q in ("❔", "⭐"):
+            st.markdown(f"<p style='text-align: center; font-size: 150px; font-weight: bold;'>{state.current_number_Q}</p>", unsafe_allow_html=True)
         else:
-            st.latex(st.session_state.current_number_Q)
+            st.latex(state.current_number_Q)
     with right_col:
         # [핵심 수정] "부수 효과"를 활용한 커스텀 HTML/CSS 정보 패널
         st.markdown(r"""
@@ -224,8 +265,300 @@ with tabs[3]:
         """, unsafe_allow_html=True)
     st.divider() 
     history_title = "**※ 지금까지 뽑은 유리수들:**"
-    if st.session_state.drawn_history_Q:
-        history_values =  "  ➡️  ".join([f"${s}$" for s in st.session_state.drawn_history_Q])
+    if state.drawn_history_Q:
+        history_values =  "  ➡️  ".join([f"${s}$" for s in state.drawn_history_Q])
     else:
         history_values = "아직 뽑은 유리수가 없습니다."
     st.info(f"{history_title}\n\n{history_values}")
+    if state.draw_count_Q >= 20:
+        best_board_panel("Q", state.drawn_history_Q, tiles.RATIONAL.low, tiles.RATIONAL.high, latex=True)
+
+with tabs[3]:
+    rational_version()
+
+# --- 5. 점수 계산 탭 ---
+# 종이 게임판을 표(또는 CSV)로 받아 반 전체를 한 번에 채점합니다 (utils.streams.scoring).
+SHEET_ROWS = 30
+
+
+def empty_sheet():
+    pd = prewarm.module("pandas")
+    columns = {"이름": [f"{i}번" for i in range(1, SHEET_ROWS + 1)]}
+    columns.update({str(slot): [""] * SHEET_ROWS for slot in range(1, scoring.SLOTS + 1)})
+    return pd.DataFrame(columns)
+
+
+@metrics.fragment("스트림스 › 점수 계산")
+def score_sheet():
+    pd = prewarm.module("pandas")
+    st.markdown("학생들의 게임판을 표에 옮겨 적거나 CSV 파일로 올리면 한 번에 채점하고 순위를 매깁니다. "
+                "기본·정수·유리수 타일을 모두 쓸 수 있고, 유리수는 `1/2`, `-5/3`, `2.7`처럼, ⭐ 카드는 `*`로 적어도 됩니다.")
+    with st.expander("흐름 길이별 점수표"):
+        st.dataframe(pd.DataFrame({"흐름 길이": range(1, scoring.SLOTS + 1), "점수": scoring.SCORES[1:]}).set_index("흐름 길이").T)
+
+    uploaded = st.file_uploader("CSV 파일 (첫 열은 이름, 다음 20열은 1~20번 칸)", type="csv", key="streams_sheet_csv")
+    if uploaded is not None:
+        sheet = pd.read_csv(uploaded, dtype=str, keep_default_na=False)
+        key = f"streams_sheet_{uploaded.file_id}"
+    else:
+        sheet, key = empty_sheet(), "streams_sheet"
+    sheet = st.data_editor(sheet, key=key, num_rows="dynamic", hide_index=True, width='stretch')
+
+    boards = sheet.iloc[:, 1:1 + scoring.SLOTS].fillna("").astype(str)
+    filled = (boards.apply(lambda column: column.str.strip()) != "").any(axis=1)
+    if not filled.any():
+        st.caption("아직 적은 게임판이 없습니다.")
+        return
+    try:
+        scores = scoring.score_batch(boards[filled])
+    except ValueError as error:
+        st.error(f"읽을 수 없는 칸이 있습니다. {error}")
+        return
+
+    names = sheet.iloc[:, 0].fillna("").astype(str)[filled]
+    result = pd.DataFrame({"순위": scoring.rank(scores), "이름": names.to_numpy(), "점수": scores})
+    result = result.sort_values(["순위", "이름"]).reset_index(drop=True)
+    st.subheader(f"🏆 채점 결과 ({len(result)}명)")
+    st.dataframe(result, hide_index=True, width='stretch')
+    st.download_button("결과 CSV 내려받기", result.to_csv(index=False).encode("utf-8-sig"),
+                       file_name="스트림스_점수.csv", mime="text/csv")
+
+with tabs[4]:
+    score_sheet()
+
+# --- 6. 교실 방 탭 ---
+# 선생님이 방을 만들어 뽑으면, 학생 기기는 방 코드로 들어가 같은 순서를 따라 봅니다 (utils.streams.room).
+def show_drawn(name, joker, drawn, waiting, latex=False):
+    """지금 타일과 지금까지 뽑은 타일 (교실 방, 직접 만든 묶음 탭 공통)."""
+    current = drawn[-1] if drawn else "❔"
+    if not drawn:
+        st.header(waiting)
+    elif len(drawn) >= scoring.SLOTS:
+        st.header("🏁 숫자를 모두 뽑았습니다! 🏁")
+    else:
+        st.header(f"{len(drawn)}번째 숫자")
+    if latex and current not in ("❔", "⭐"):
+        st.latex(current)
+    else:
+        st.markdown(f"<p style='text-align: center; font-size: 150px; font-weight: bold;'>{current}</p>", unsafe_allow_html=True)
+    st.divider()
+    if drawn:
+        history_values = "  ➡️  ".join(f"${s}$" if latex and s != "⭐" else str(s) for s in drawn)
+    else:
+        history_values = "아직 뽑은 숫자가 없습니다."
+    st.info(f"**※ {name}{' + ⭐' if joker else ''} · 지금까지 뽑은 숫자들:**\n\n{history_values}")
+
+
+CUSTOM_SET = "직접 만든 묶음"
+
+
+def room_tile_set():
+    """방 만들기에서 고른 묶음 (직접 만든 묶음은 ⭐ 여부까지 그 탭에서 정한 그대로)."""
+    name = st.session_state.room_tile_set_choice
+    if name == CUSTOM_SET:
+        return state.custom_set
+    return tiles.TILE_SETS[name].with_joker(st.session_state.room_joker_choice)
+
+
+# 방 만들기, 들어가기, 나가기, 닫기는 버튼의 on_click에서 처리해, 그 다음 실행이 바로 바뀐 화면을 그립니다.
+def leave_room():
+    for key in ("room_code", "room_owner", "room_set", "room_drawn", "room_seen", "room_view"):
+        state.pop(key, None)
+
+
+def create_room():
+    tile_set = room_tile_set()
+    try:
+        state.room_code, state.room_owner = room.create(tile_set, tile_set.shuffled(rng.stream("streams")))
+    except ValueError as error:
+        state.room_error = f"이 묶음으로는 방을 만들 수 없습니다. {error}"
+        return
+    state.room_set, state.room_drawn, state.room_error = tile_set, [], None
+
+
+def join_room():
+    code = room.normalize(st.session_state.room_code_input)
+    if room.version(code) is None:
+        state.room_error = f"'{code}' 방이 없습니다. 코드를 다시 확인하세요."
+    else:
+        state.room_code, state.room_error = code, None
+
+
+def close_room():
+    try:
+        room.close(state.room_code, state.room_owner)
+    except KeyError:  # 이미 만료된 방
+        pass
+    leave_room()
+
+
+@metrics.fragment("스트림스 › 방 따라가기", run_every=room.POLL_SECONDS)
+def follow_room():
+    # 폴링마다 version 키 하나만 읽고, 바뀌었을 때만 방을 읽습니다.
+    seen = room.version(state.room_code)
+    if seen is None:
+        st.warning("방이 닫혔거나 오래되어 사라졌습니다. '방 나가기'를 누르고 새 코드로 들어가세요.")
+        return
+    if seen != state.get("room_seen"):
+        view = room.view(state.room_code, seen)
+        if view is None:
+            return
+        before = state.get("room_view")
+        state.room_seen, state.room_view = seen, view
+        if before is not None and (len(before["drawn"]) >= scoring.SLOTS) != (len(view["drawn"]) >= scoring.SLOTS):
+            # 다 뽑은 뒤의 비교 패널은 이 fragment 밖에서 그리므로, 게임이 끝나거나 다시 시작할 때만 한 번 다시 그립니다.
+            st.rerun()
+    view = state.room_view
+    show_drawn(view["tile_set"], view["joker"], view["drawn"], "선생님이 첫 번째 숫자를 뽑기를 기다리고 있습니다.",
+               view["latex"])
+
+
+@metrics.fragment("스트림스 › 교실 방")
+def room_tab():
+    # 1) 선생님: 방 코드를 보여 주고 뽑습니다. 뽑은 목록은 이 세션에도 두어 방을 다시 읽지 않습니다.
+    if state.get("room_owner"):
+        code, tile_set = state.room_code, state.room_set
+        st.markdown(f"<p style='text-align: center; font-size: 64px; font-weight: bold; letter-spacing: 0.3em;'>{code}</p>",
+                    unsafe_allow_html=True)
+        st.caption("학생들은 '교실 방' 탭에서 이 코드를 적고 들어옵니다. 선생님이 뽑으면 학생 화면에 "
+                   f"{room.POLL_SECONDS}초 안에 같은 숫자가 나옵니다.")
+        col1, col_spacer, col2 = st.columns([1, 2, 1])
+        try:
+            with col1:
+                if st.button("  처음부터 다시하기  ", type="primary", width='stretch', key="restart_room"):
+                    room.restart(code, state.room_owner, tile_set.shuffled(rng.stream("streams")))
+                    state.room_drawn = []
+            with col_spacer:
+                st.button("방 닫기", key="close_room", on_click=close_room)
+            with col2:
+                if st.button("다음 숫자 뽑기", disabled=len(state.room_drawn) >= scoring.SLOTS, width='stretch', key="draw_room"):
+                    tile = room.draw(code, state.room_owner)
+                    if tile is not None:
+                        state.room_drawn.append(tile)
+                        events.log("streams", "draw", level=f"{tile_set.name} (방)", value=tile)
+        except KeyError:
+            st.warning("방이 오래되어 사라졌습니다. '방 닫기'를 누르고 새 방을 만드세요.")
+            return
+        show_drawn(tile_set.name, tile_set.joker, state.room_drawn, "첫 번째 숫자를 뽑아주세요.", tile_set.latex)
+        if len(state.room_drawn) >= scoring.SLOTS:
+            best_board_panel("room", state.room_drawn, tile_set.low, tile_set.high, tile_set.latex)
+        return
+
+    # 2) 학생: 방을 따라 봅니다.
+    if state.get("room_code"):
+        st.button("방 나가기", key="leave_room", on_click=leave_room)
+        st.caption(f"방 {state.room_code}을(를) 따라 보고 있습니다. 선생님이 뽑으면 {room.POLL_SECONDS}초 안에 바뀝니다.")
+        follow_room()
+        view = state.get("room_view")
+        if view is not None and len(view["drawn"]) >= scoring.SLOTS:
+            low, high = room.bounds(view)
+            best_board_panel("room", list(view["drawn"]), low, high, view["latex"])
+        return
+
+    # 3) 아직 방이 없으면: 방 만들기(선생님) / 들어가기(학생)
+    st.markdown("교실에서 선생님 기기 하나로 뽑고, 학생들의 기기에는 **같은 순서**로 숫자가 나오게 합니다.")
+    left_col, right_col = st.columns(2)
+    with left_col:
+        st.subheader("🧑‍🏫 방 만들기")
+        choices = list(tiles.TILE_SETS) + ([CUSTOM_SET] if state.get("custom_set") is not None else [])
+        name = st.selectbox("타일 묶음", choices, key="room_tile_set_choice")
+        st.checkbox("⭐ 카드 추가", key="room_joker_choice", disabled=(name == CUSTOM_SET),
+                    help="직접 만든 묶음은 '타일 직접 만들기' 탭에서 정한 그대로 씁니다.")
+        st.button("방 만들기", type="primary", key="create_room", on_click=create_room)
+    with right_col:
+        st.subheader("🙋 방 들어가기")
+        st.text_input("방 코드", max_chars=room.CODE_LENGTH + 2, key="room_code_input", placeholder="칠판의 코드 4글자")
+        st.button("들어가기", key="join_room", on_click=join_room)
+        if state.get("room_error"):
+            st.error(state.room_error)
+
+with tabs[5]:
+    room_tab()
+
+# --- 7. 타일 직접 만들기 탭 ---
+# 범위, 분모, 부호로 묶음을 만들고 표에서 고친 뒤 그 묶음으로 게임을 합니다 (utils.streams.tiles).
+def custom_table(tile_set):
+    pd = prewarm.module("pandas")
+    rows = [(tile.label, count) for tile, count in tile_set.counts() if tile.value is not tiles.JOKER]
+    return pd.DataFrame(rows, columns=["타일", "개수"])
+
+
+def generate_table():
+    ss = st.session_state
+    try:
+        made = tiles.generate(ss.custom_low, ss.custom_high, ss.custom_denominator, ss.custom_sign, ss.custom_style,
+                              ss.custom_copies)
+    except ValueError as error:
+        state.custom_error = str(error)
+        return
+    # 표 편집기의 key를 바꿔야 전에 고친 내용 대신 새 표가 보입니다.
+    state.custom_error, state.custom_table = None, custom_table(made)
+    state.custom_table_version += 1
+
+
+def initialize_game_C(tile_set):
+    state.custom_set = tile_set
+    state.pool_C = tile_set.shuffled(rng.stream("streams"))
+    state.drawn_history_C = []
+
+
+@metrics.fragment("스트림스 › 타일 직접 만들기")
+def custom_version():
+    pd = prewarm.module("pandas")
+    if "custom_table" not in state:
+        # 아래 입력칸의 처음 값과 같은 묶음: -3 ~ 3, 분모 2 이하, 각 2개
+        state.custom_table, state.custom_table_version = custom_table(tiles.generate(-3, 3, 2, copies=2)), 0
+
+    st.markdown("**① 범위로 만들기** — 가장 작은 수와 가장 큰 수 사이에서 분모가 정한 수 이하인 값을 모두 넣습니다.")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.text_input("가장 작은 수", value="-3", key="custom_low")
+        st.text_input("가장 큰 수", value="3", key="custom_high")
+    with col2:
+        st.slider("분모는 이 수까지", min_value=1, max_value=10, value=2, key="custom_denominator")
+        st.number_input("같은 타일 개수", min_value=1, max_value=tiles.MAX_COPIES, value=2, key="custom_copies")
+    with col3:
+        st.radio("부호", list(tiles.SIGNS), horizontal=True, key="custom_sign")
+        st.radio("모양", tiles.STYLES, horizontal=True, key="custom_style",
+                 help="소수는 끝나는 소수로 쓸 수 있는 값(분모가 2, 4, 5, 8, 10 ...)만 넣습니다.")
+    st.button("표 만들기", key="generate_C", on_click=generate_table)
+    if state.get("custom_error"):
+        st.error(state.custom_error)
+
+    st.markdown("**② 표에서 고치기** — 타일을 더하거나 지우고 개수를 바꿀 수 있습니다. `1/2`, `0.3`, `\\frac{5}{3}`처럼 적습니다.")
+    table = st.data_editor(state.custom_table, key=f"custom_table_{state.custom_table_version}", num_rows="dynamic",
+                           hide_index=True, width='stretch', column_config={
+                               "개수": st.column_config.NumberColumn(min_value=0, max_value=tiles.MAX_COPIES, step=1)})
+    joker = st.checkbox("⭐ 카드 추가", key="joker_C")
+    rows = [(str(cell), 0 if pd.isna(count) else count) for cell, count in zip(table["타일"], table["개수"])
+            if not pd.isna(cell) and str(cell).strip()]
+    try:
+        tile_set = tiles.TileSet.from_counts(CUSTOM_SET, rows).with_joker(joker).validate()
+    except ValueError as error:
+        st.error(f"이 묶음으로는 게임을 할 수 없습니다. {error}")
+        tile_set = None
+    else:
+        st.success(tile_set.describe())
+
+    st.markdown("**③ 게임하기**")
+    col1, col_spacer, col2 = st.columns([1, 2, 1])
+    with col1:
+        if st.button("이 묶음으로 새 게임", type="primary", width='stretch', key="restart_C", disabled=(tile_set is None)):
+            initialize_game_C(tile_set)
+    if state.get("custom_set") is None:
+        st.caption("표를 다 고쳤으면 '이 묶음으로 새 게임'을 누르세요. 교실 방에서도 이 묶음을 고를 수 있습니다.")
+        return
+    custom_set, drawn = state.custom_set, state.drawn_history_C
+    with col2:
+        if st.button("다음 숫자 뽑기", disabled=(len(drawn) >= scoring.SLOTS), width='stretch', key="draw_C"):
+            # disabled는 한 번 늦으므로 20개 제한은 누른 뒤에 확인합니다.
+            tile = state.pool_C.draw() if len(drawn) < scoring.SLOTS else None
+            if tile is not None:
+                drawn.append(tile.label)
+                events.log("streams", "draw", level=CUSTOM_SET, value=tile.label)
+    show_drawn(custom_set.name, custom_set.joker, drawn, "첫 번째 숫자를 뽑아주세요.", custom_set.latex)
+    if len(drawn) >= scoring.SLOTS:
+        best_board_panel("C", drawn, custom_set.low, custom_set.high, custom_set.latex)
+
+with tabs[6]:
+    custom_version()
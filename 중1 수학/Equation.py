@@ -1,7 +1,14 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import numpy as np
 import math
+from utils import prewarm
+from utils.state import page_state
+
+# app.py가 서버 시작 시 미리 불러 둔 모듈을 받아 씁니다.
+plt = prewarm.module("matplotlib.pyplot")
+np = prewarm.module("numpy")
+
+# 이 페이지의 세션 상태 (양쪽 탭의 저울 접시)
+state = page_state("equation")
 
 # -----------------------------------------------------------------------------
 # 1. 페이지 및 기본 설정
@@ -21,9 +28,9 @@ SHAPES = {
 def modify_shape(side, shape, amount):
     """도형을 추가하거나 빼는 함수 (순서 유지)"""
     if amount > 0:
-        st.session_state[side].append(shape)
+        state[side].append(shape)
     elif amount < 0:
-        pan_list = st.session_state[side]
+        pan_list = state[side]
         for i in range(len(pan_list) - 1, -1, -1):
             if pan_list[i] == shape:
                 pan_list.pop(i)
@@ -31,8 +38,8 @@ def modify_shape(side, shape, amount):
 
 def reset_scale(left_key, right_key):
     """특정 탭의 저울 초기화"""
-    st.session_state[left_key] = []
-    st.session_state[right_key] =[]
+    state[left_key] = []
+    state[right_key] =[]
 
 def get_weight(side_list, weight_dict):
     """주어진 무게 사전을 바탕으로 총 무게 계산"""
@@ -83,6 +90,7 @@ def draw_balance_scale(left_wt, right_wt, left_list, right_list):
     ax.set_ylim(-20, 12)
     ax.axis('off')
     st.pyplot(fig)
+    plt.close(fig) # pyplot이 그림을 계속 붙잡고 있지 않도록 (재실행마다 메모리 누수)
 
 # -----------------------------------------------------------------------------
 # 3. 탭 구성
@@ -95,11 +103,11 @@ tab1, tab2 = st.tabs(["⚖️ 균형을 잡아라", "🕵️‍♂️ 등식의
 with tab1:
     T1_WEIGHTS = {'tri': 5, 'sq': 3, 'cir': 2}
     
-    if 't1_left' not in st.session_state: st.session_state.t1_left =[]  
-    if 't1_right' not in st.session_state: st.session_state.t1_right =[]
+    if 't1_left' not in state: state.t1_left =[]  
+    if 't1_right' not in state: state.t1_right =[]
 
-    t1_l_wt = get_weight(st.session_state.t1_left, T1_WEIGHTS)
-    t1_r_wt = get_weight(st.session_state.t1_right, T1_WEIGHTS)
+    t1_l_wt = get_weight(state.t1_left, T1_WEIGHTS)
+    t1_r_wt = get_weight(state.t1_right, T1_WEIGHTS)
 
     t1_col_left, t1_col_mid, t1_col_right = st.columns([1, 2.5, 1])
 
@@ -142,7 +150,7 @@ with tab1:
             st.rerun()
 
     with t1_col_mid:
-        draw_balance_scale(t1_l_wt, t1_r_wt, st.session_state.t1_left, st.session_state.t1_right)
+        draw_balance_scale(t1_l_wt, t1_r_wt, state.t1_left, state.t1_right)
 
 # =============================================================================
 #[TAB 2] 등식의 성질 (미지수)
@@ -151,11 +159,11 @@ with tab2:
     # ⭐ 선생님이 짚어주신 정확한 수학적 비율 (삼각형=1, 사각형=2, 원=-2)
     T2_HIDDEN_WEIGHTS = {'tri': 1, 'sq': 2, 'cir': -2}
     
-    if 't2_left' not in st.session_state: st.session_state.t2_left =[]  
-    if 't2_right' not in st.session_state: st.session_state.t2_right =[]
+    if 't2_left' not in state: state.t2_left =[]  
+    if 't2_right' not in state: state.t2_right =[]
 
-    t2_l_wt = get_weight(st.session_state.t2_left, T2_HIDDEN_WEIGHTS)
-    t2_r_wt = get_weight(st.session_state.t2_right, T2_HIDDEN_WEIGHTS)
+    t2_l_wt = get_weight(state.t2_left, T2_HIDDEN_WEIGHTS)
+    t2_r_wt = get_weight(state.t2_right, T2_HIDDEN_WEIGHTS)
 
     t2_col_left, t2_col_mid, t2_col_right = st.columns([1, 2.5, 1])
 
@@ -198,4 +206,4 @@ with tab2:
             st.rerun()
 
     with t2_col_mid:
-        draw_balance_scale(t2_l_wt, t2_r_wt, st.session_state.t2_left, st.session_state.t2_right)
\ No newline at end of file
+        draw_balance_scale(t2_l_wt, t2_r_wt, state.t2_left, state.t2_right)
\ No newline at end of file
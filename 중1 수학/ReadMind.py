@@ -1,5 +1,9 @@
 import streamlit as st
-import random
+from utils import rng
+from utils.state import page_state
+
+# 이 페이지의 세션 상태
+state = page_state("readmind")
 
 st.title("🔮 생각을 읽는 마법구슬")
 
@@ -13,28 +17,27 @@ EMOJIS =['🍎', '🐶', '🚗', '🎈', '⭐', '🍀', '🌈', '🔥', '💧',
 # 2. 세션 상태 및 초기화/진행 함수 정의
 # -----------------------------------------------------------------------------
 def init_game():
-    target = random.choice(EMOJIS)
+    r = rng.stream("readmind")
+    target = r.choice(EMOJIS)
     
-    mapping = {}
-    for i in range(100):
-        if i % 9 == 0:
-            mapping[i] = target
-        else:
-            mapping[i] = random.choice(EMOJIS)
+    # 100칸의 그림을 한 번에 뽑고, 9의 배수 칸만 정답 그림으로 바꿉니다.
+    mapping = dict(enumerate(r.choice(EMOJIS, size=100)))
+    for i in range(0, 100, 9):
+        mapping[i] = target
             
-    st.session_state.mapping = mapping
-    st.session_state.target_emoji = target
-    st.session_state.revealed = False
-    st.session_state.step = 1
+    state.mapping = mapping
+    state.target_emoji = target
+    state.revealed = False
+    state.step = 1
 
 def next_step():
-    if st.session_state.step < 4:
-        st.session_state.step += 1
+    if state.step < 4:
+        state.step += 1
 
 def reveal_answer():
-    st.session_state.revealed = True
+    state.revealed = True
 
-if 'mapping' not in st.session_state:
+if 'mapping' not in state:
     init_game()
 
 # -----------------------------------------------------------------------------
@@ -51,14 +54,14 @@ with col_left:
     with btn1:
         st.button("🔄 새로하기", width='stretch', on_click=init_game)
     with btn2:
-        if st.session_state.step < 4:
+        if state.step < 4:
             st.button("➡️ 다음 단계", width='stretch', on_click=next_step)
         else:
             st.button("✨ 정답은?", width='stretch', on_click=reveal_answer, type="primary")
             
     
     # 2. ⬅️ [수정됨] 단계별 안내 문구 (버튼 바로 아래 위치 & 하나씩만 등장)
-    step = st.session_state.step
+    step = state.step
     if step == 1:
         st.success("① 1부터 99 사이의 숫자 중 하나를 생각한다.")
     elif step == 2:
@@ -69,7 +72,7 @@ with col_left:
         st.error("④ 오른쪽 표에서 ③의 결과에 해당하는 기호를 찾는다!")
     
     # 3. 결과 이모지 화면 (가장 하단으로 이동)
-    display_char = st.session_state.target_emoji if st.session_state.revealed else "❓"
+    display_char = state.target_emoji if state.revealed else "❓"
     st.markdown(f"<h1 style='text-align: center; font-size: 200px; margin: 0;'>{display_char}</h1>", unsafe_allow_html=True)
 
 # ==========================================
@@ -81,7 +84,7 @@ with col_right:
         
         for col_idx in range(10):
             num = row_idx * 10 + col_idx
-            emoji = st.session_state.mapping[num]
+            emoji = state.mapping[num]
             tile = cols[col_idx].container(border=False)
             
             tile.markdown(
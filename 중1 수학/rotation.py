@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from utils import lite, minify
 
 st.title("🔄 회전체 탐구")
 st.caption("캔버스에 마우스를 클릭하여 다각형을 그리고, '회전체 생성' 버튼을 눌러보세요.")
@@ -183,10 +184,9 @@ html_code = """
         </div>
     </div>
 
-    <!-- 외부 라이브러리 -->
+    <!-- three.js r128은 아직 static/vendor/에 넣지 못해 CDN에서 받습니다 (EdgesGeometry는 본체에 들어 있음) -->
     <script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"></script>
     <script src="https://cdn.jsdelivr.net/npm/three@0.128.0/examples/js/controls/OrbitControls.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/three@0.128.0/examples/js/geometries/EdgesGeometry.js"></script>
 
     <script>
         const canvasWrapper = document.getElementById('canvas-wrapper');
@@ -341,7 +341,7 @@ html_code = """
             scene.add(yAxisLine);
             
             const shapePoints = preparePointsFor3D();
-            const geometry = new THREE.LatheGeometry(shapePoints, 32, 0, currentAngle);
+            const geometry = new THREE.LatheGeometry(shapePoints, ___SEGMENTS___, 0, currentAngle);
             const baseColor = new THREE.Color(0x007bff);
             
             const surfaceMaterial = new THREE.MeshStandardMaterial({ 
@@ -384,7 +384,7 @@ html_code = """
                     threeApp.controls.enabled = true;
                     threeApp.lathe.children[0].material.depthWrite = true;
                 }
-                const newGeometry = new THREE.LatheGeometry(threeApp.shapePoints, 32, 0, currentAngle);
+                const newGeometry = new THREE.LatheGeometry(threeApp.shapePoints, ___SEGMENTS___, 0, currentAngle);
                 const newEdgesGeometry = new THREE.EdgesGeometry(newGeometry, 20);
                 const surface = threeApp.lathe.children[0];
                 const edges = threeApp.lathe.children[1];
@@ -464,4 +464,6 @@ html_code = """
 # 4. 스트림릿 컴포넌트로 렌더링
 # height=800: iframe의 높이를 800픽셀로 고정하여 넉넉한 공간 확보
 # scrolling=False: iframe 내부의 불필요한 스크롤바 제거
-components.html(html_code, height=800, scrolling=False)
\ No newline at end of file
+# 회전면 조각 수: 가벼운 모드(utils.lite)에서는 줄여서 휴대폰에서도 부드럽게 돌아가게 합니다.
+segments = lite.LATHE_SEGMENTS if lite.enabled() else 32
+components.html(minify.page_html("rotation", html_code, {"___SEGMENTS___": str(segments)}), height=800, scrolling=False)
\ No newline at end of file
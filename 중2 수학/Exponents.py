@@ -1,5 +1,9 @@
 import streamlit as st
-import random
+from utils import rng
+from utils.state import page_state
+
+# 이 페이지의 세션 상태 (스트림스의 draw_count 등과 섞이지 않도록 이름공간을 나눕니다)
+state = page_state("exponents")
 
 # --- [핵심] 스타일 정의 ---
 # 이 스타일은 앱 전체에 적용됩니다. st.latex로 표시되는 수식의 폰트 크기를 키웁니다.
@@ -39,15 +43,15 @@ def initialize_exponent_game():
     ]
     
     # 2. 문제 섞기: 문제 순서를 무작위로 섞어 매번 다른 순서로 출제되도록 합니다.
-    random.shuffle(problems)
+    problems = rng.stream("exponents").shuffled(problems)
     
     # 3. 세션 상태 초기화: 게임에 필요한 변수들을 st.session_state에 저장합니다.
     # 이 값들은 사용자가 앱과 상호작용하는 동안 계속 유지됩니다.
-    st.session_state.problem_pool = problems     # 앞으로 뽑을 문제들이 담긴 리스트
-    st.session_state.draw_count = 0              # 현재까지 뽑은 문제의 개수
-    st.session_state.current_problem = "❔"      # 화면에 표시될 현재 문제
-    st.session_state.drawn_history = []          # 이미 뽑았던 문제들의 기록
-    st.session_state.total_problems = len(problems) # 전체 문제 개수 저장
+    state.problem_pool = problems     # 앞으로 뽑을 문제들이 담긴 리스트
+    state.draw_count = 0              # 현재까지 뽑은 문제의 개수
+    state.current_problem = "❔"      # 화면에 표시될 현재 문제
+    state.drawn_history = []          # 이미 뽑았던 문제들의 기록
+    state.total_problems = len(problems) # 전체 문제 개수 저장
 
 # --------------------------------------------------------------------------
 # --- 앱 UI(사용자 인터페이스) 시작 ---
@@ -58,7 +62,7 @@ st.title("🔢 지수법칙 문제 뽑기")
 st.divider() # 시각적인 구분을 위한 가로선
 
 # st.session_state에 'problem_pool'이 없으면 (즉, 앱을 처음 켰을 때) 게임을 초기화합니다.
-if 'problem_pool' not in st.session_state:
+if 'problem_pool' not in state:
     initialize_exponent_game()
 
 # 버튼들을 가로로 배치하기 위해 st.columns를 사용합니다.
@@ -73,44 +77,44 @@ with col1:
 
 with col2:
     # 모든 문제를 다 뽑았는지 확인하여 버튼을 비활성화(disabled)할지 결정합니다.
-    is_disabled = (st.session_state.draw_count >= st.session_state.total_problems)
+    is_disabled = (state.draw_count >= state.total_problems)
     
     # '다음 문제 뽑기' 버튼입니다.
     if st.button("➡️ 다음 문제 뽑기", disabled=is_disabled, width='stretch'):
         # 뽑을 문제가 남아있는 경우에만 실행됩니다.
-        if st.session_state.problem_pool:
-            st.session_state.draw_count += 1
-            new_problem = st.session_state.problem_pool.pop() # 문제 리스트에서 하나를 뽑아냅니다.
-            st.session_state.current_problem = new_problem      # 현재 문제로 설정
-            st.session_state.drawn_history.append(new_problem)  # 뽑은 내역에 추가
+        if state.problem_pool:
+            state.draw_count += 1
+            new_problem = state.problem_pool.pop() # 문제 리스트에서 하나를 뽑아냅니다.
+            state.current_problem = new_problem      # 현재 문제로 설정
+            state.drawn_history.append(new_problem)  # 뽑은 내역에 추가
 
 # --- 문제 표시 영역 ---
 
 # 게임의 진행 상태에 따라 다른 헤더 메시지를 보여줍니다.
-if st.session_state.draw_count == 0:
+if state.draw_count == 0:
     st.header("첫 번째 문제를 뽑아주세요.")
-elif st.session_state.draw_count >= st.session_state.total_problems:
+elif state.draw_count >= state.total_problems:
     st.header("🏁 모든 문제를 다 뽑았습니다! 🏁")
 else:
-    st.header(f"{st.session_state.draw_count}번째 문제")
+    st.header(f"{state.draw_count}번째 문제")
 
 # 현재 뽑힌 문제를 화면 중앙에 크게 표시합니다.
-if st.session_state.current_problem == "❔":
+if state.current_problem == "❔":
     # 아직 문제를 뽑기 전이면 큰 물음표를 보여줍니다.
     st.markdown("<p style='text-align: center; font-size: 150px; font-weight: bold;'>❔</p>", unsafe_allow_html=True)
 else:
     # 문제를 뽑았다면, st.latex를 사용하여 수학 수식을 아름답게 렌더링합니다.
-    st.latex(st.session_state.current_problem)
+    st.latex(state.current_problem)
 
 st.divider() # 가로선
 
 # --- 뽑은 내역 표시 영역 ---
 
 history_title = "**※ 지금까지 뽑은 문제들:**"
-if st.session_state.drawn_history:
+if state.drawn_history:
     # 뽑은 내역을 세로로 나열합니다. 각 항목을 인라인 수식으로 감싸고
     # Markdown 리스트 형태로 만들면 한 항목씩 세로로 표시됩니다.
-    history_values = "\n\n".join([f"- ${p}$" for p in st.session_state.drawn_history])
+    history_values = "\n\n".join([f"- ${p}$" for p in state.drawn_history])
 else:
     history_values = "아직 뽑은 문제가 없습니다."
 
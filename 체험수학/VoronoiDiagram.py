@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from utils import lite, minify
 
 st.markdown("<h1 style='text-align: center;'>보로노이 다이어그램</h1>", unsafe_allow_html=True)
 
@@ -13,7 +14,9 @@ HTML='''
         <title>보로노이 & 델로네 다이어그램 웹앱</title>
         
         <!-- Bootstrap 5 CSS -->
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
+        <link href="vendor:bootstrap.min.css" rel="stylesheet">
+        <!-- 이 페이지 글자만 담은 Pretendard (python -m utils.fonts) -->
+        <link href="vendor:pretendard.css" rel="stylesheet">
         
         <style>
             /* 기본 배경은 흰색으로 설정 */
@@ -114,10 +117,8 @@ HTML='''
         </p>
     </div>
 
-    <!-- Bootstrap 5 JS -->
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.css"></script>
     <!-- D3.js 핵심 라이브러리 -->
-    <script src="https://d3js.org/d3.v7.min.js"></script>
+    <script src="vendor:d3.min.js"></script>
 
     <script>
         // ----------------------------------------------------
@@ -263,4 +264,6 @@ HTML='''
     </html>
 '''
 
-components.html(HTML, height=650, scrolling=True)
\ No newline at end of file
+# 가벼운 모드(utils.lite)에서는 Pretendard를 받지 않고 기기 글꼴로 보여 줍니다.
+components.html(minify.page_html("VoronoiDiagram", lite.without_fonts(HTML) if lite.enabled() else HTML),
+                height=650, scrolling=True)
\ No newline at end of file